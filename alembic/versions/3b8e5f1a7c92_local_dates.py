@@ -0,0 +1,141 @@
+"""local dates
+
+Revision ID: 3b8e5f1a7c92
+Revises: e7a9c3b5d218
+Create Date: 2025-05-23 12:41:09.337518
+
+"""
+from datetime import timezone
+from typing import Sequence, Union
+from zoneinfo import ZoneInfo
+
+from alembic import op
+import sqlalchemy as sa
+
+from api.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e5f1a7c92'
+down_revision: Union[str, None] = 'e7a9c3b5d218'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOCAL_HOUR_TABLES = ('screams', 'reactions')
+LOCAL_DATE_TABLES = ('screams', 'reactions', 'archived_screams')
+BATCH_SIZE = 10000
+
+
+def backfill_sqlite(table_name: str, hours: bool) -> None:
+    """Compute local dates of a table in Python, SQLite has no zones."""
+    zone = ZoneInfo(settings.analytics.timezone)
+    connection = op.get_bind()
+    table = sa.table(
+        table_name,
+        sa.column('id', sa.Integer()),
+        sa.column('created_at', sa.DateTime()),
+        sa.column('local_date', sa.Date()),
+        sa.column('local_hour', sa.SmallInteger()),
+    )
+    update = (
+        sa.update(table)
+        .where(table.c.id == sa.bindparam('row_id'))
+        .values(
+            local_date=sa.bindparam('date'),
+            **({'local_hour': sa.bindparam('hour')} if hours else {}),
+        )
+    )
+
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(table.c.id, table.c.created_at)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+
+        values = []
+        for row_id, created_at in rows:
+            local = created_at.replace(tzinfo=timezone.utc).astimezone(zone)
+            values.append(
+                {'row_id': row_id, 'date': local.date(), 'hour': local.hour}
+            )
+        connection.execute(update, values)
+        last_id = rows[-1].id
+
+
+def backfill_postgresql(table_name: str, hours: bool) -> None:
+    """Compute local dates of a table with `AT TIME ZONE`."""
+    local = 'created_at AT TIME ZONE :zone'
+    columns = [f'local_date = CAST({local} AS DATE)']
+    if hours:
+        columns.append(f'local_hour = EXTRACT(HOUR FROM {local})')
+
+    op.execute(
+        sa.text(f'UPDATE {table_name} SET {", ".join(columns)}').bindparams(
+            zone=settings.analytics.timezone
+        )
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in LOCAL_DATE_TABLES:
+        op.add_column(table, sa.Column('local_date', sa.Date(), nullable=True))
+    for table in LOCAL_HOUR_TABLES:
+        op.add_column(
+            table, sa.Column('local_hour', sa.SmallInteger(), nullable=True)
+        )
+
+    backfill = (
+        backfill_postgresql
+        if op.get_bind().dialect.name == 'postgresql'
+        else backfill_sqlite
+    )
+    for table in LOCAL_DATE_TABLES:
+        backfill(table, table in LOCAL_HOUR_TABLES)
+
+    op.drop_index('ix_screams_user_id_created_at', table_name='screams')
+    op.create_index(
+        'ix_screams_user_id_local_date',
+        'screams',
+        ['user_id', 'local_date'],
+    )
+    op.create_index('ix_screams_local_date', 'screams', ['local_date'])
+    op.drop_index(
+        'ix_archived_screams_user_id_created_at',
+        table_name='archived_screams',
+    )
+    op.create_index(
+        'ix_archived_screams_user_id_local_date',
+        'archived_screams',
+        ['user_id', 'local_date'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_archived_screams_user_id_local_date',
+        table_name='archived_screams',
+    )
+    op.create_index(
+        'ix_archived_screams_user_id_created_at',
+        'archived_screams',
+        ['user_id', 'created_at'],
+    )
+    op.drop_index('ix_screams_local_date', table_name='screams')
+    op.drop_index('ix_screams_user_id_local_date', table_name='screams')
+    op.create_index(
+        'ix_screams_user_id_created_at',
+        'screams',
+        ['user_id', 'created_at'],
+    )
+
+    for table in LOCAL_HOUR_TABLES:
+        op.drop_column(table, 'local_hour')
+    for table in LOCAL_DATE_TABLES:
+        op.drop_column(table, 'local_date')
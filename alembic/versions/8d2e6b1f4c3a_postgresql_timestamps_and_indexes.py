@@ -0,0 +1,65 @@
+"""postgresql timestamps and indexes
+
+Revision ID: 8d2e6b1f4c3a
+Revises: 5f0c2a9e7d41
+Create Date: 2025-05-20 11:04:12.518630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e6b1f4c3a'
+down_revision: Union[str, None] = '5f0c2a9e7d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMPED_TABLES = ('screams', 'reactions')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # Naive timestamps were stored in UTC by CURRENT_TIMESTAMP
+        for table in TIMESTAMPED_TABLES:
+            op.alter_column(
+                table,
+                'created_at',
+                type_=sa.DateTime(timezone=True),
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                postgresql_using="created_at AT TIME ZONE 'UTC'",
+            )
+
+    op.create_index(
+        'ix_screams_user_id_created_at',
+        'screams',
+        ['user_id', 'created_at'],
+    )
+    op.create_index(
+        'ix_screams_created_at_id',
+        'screams',
+        ['created_at', 'id'],
+    )
+    op.create_index('ix_reactions_scream_id', 'reactions', ['scream_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reactions_scream_id', table_name='reactions')
+    op.drop_index('ix_screams_created_at_id', table_name='screams')
+    op.drop_index('ix_screams_user_id_created_at', table_name='screams')
+
+    if op.get_bind().dialect.name == 'postgresql':
+        for table in TIMESTAMPED_TABLES:
+            op.alter_column(
+                table,
+                'created_at',
+                type_=sa.DateTime(),
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                postgresql_using="created_at AT TIME ZONE 'UTC'",
+            )
@@ -0,0 +1,77 @@
+"""scream archive
+
+Revision ID: c41f7a2d9e60
+Revises: 8d2e6b1f4c3a
+Create Date: 2025-05-21 16:37:48.204915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f7a2d9e60'
+down_revision: Union[str, None] = '8d2e6b1f4c3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'archived_screams',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('text', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('month', sa.Integer(), nullable=False),
+        sa.Column('votes', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_archived_screams_user_id_created_at',
+        'archived_screams',
+        ['user_id', 'created_at'],
+    )
+    op.create_index(
+        'ix_archived_screams_month_votes',
+        'archived_screams',
+        ['month', 'votes'],
+    )
+    op.create_table(
+        'archived_reaction_counts',
+        sa.Column('scream_id', sa.Integer(), nullable=False),
+        sa.Column('reaction', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['scream_id'], ['archived_screams.id']),
+        sa.PrimaryKeyConstraint('scream_id', 'reaction'),
+    )
+    op.create_table(
+        'scream_partitions',
+        sa.Column('month', sa.Integer(), nullable=False),
+        sa.Column('screams', sa.Integer(), nullable=False),
+        sa.Column('reactions', sa.Integer(), nullable=False),
+        sa.Column(
+            'archived_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('(CURRENT_TIMESTAMP)'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('month'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('scream_partitions')
+    op.drop_table('archived_reaction_counts')
+    op.drop_index(
+        'ix_archived_screams_month_votes', table_name='archived_screams'
+    )
+    op.drop_index(
+        'ix_archived_screams_user_id_created_at',
+        table_name='archived_screams',
+    )
+    op.drop_table('archived_screams')
@@ -0,0 +1,70 @@
+"""scream search
+
+Revision ID: e7a9c3b5d218
+Revises: c41f7a2d9e60
+Create Date: 2025-05-22 10:15:33.871042
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a9c3b5d218'
+down_revision: Union[str, None] = 'c41f7a2d9e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS screams_fts USING fts5("
+    "text, content='screams', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS screams_fts_insert "
+    "AFTER INSERT ON screams BEGIN "
+    "INSERT INTO screams_fts (rowid, text) VALUES (new.id, new.text); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS screams_fts_delete "
+    "AFTER DELETE ON screams BEGIN "
+    "INSERT INTO screams_fts (screams_fts, rowid, text) "
+    "VALUES ('delete', old.id, old.text); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS screams_fts_update "
+    "AFTER UPDATE OF text ON screams BEGIN "
+    "INSERT INTO screams_fts (screams_fts, rowid, text) "
+    "VALUES ('delete', old.id, old.text); "
+    "INSERT INTO screams_fts (rowid, text) VALUES (new.id, new.text); "
+    "END",
+    # Index screams created before the triggers
+    "INSERT INTO screams_fts (screams_fts) VALUES ('rebuild')",
+]
+
+POSTGRESQL_UPGRADE = [
+    "CREATE INDEX IF NOT EXISTS ix_screams_text_search ON screams "
+    "USING gin (to_tsvector('simple'::regconfig, text))",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    match op.get_bind().dialect.name:
+        case 'sqlite':
+            statements = SQLITE_UPGRADE
+        case 'postgresql':
+            statements = POSTGRESQL_UPGRADE
+        case _:
+            statements = []
+
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    match op.get_bind().dialect.name:
+        case 'sqlite':
+            for trigger in ('insert', 'delete', 'update'):
+                op.execute(f'DROP TRIGGER IF EXISTS screams_fts_{trigger}')
+            op.execute('DROP TABLE IF EXISTS screams_fts')
+        case 'postgresql':
+            op.execute('DROP INDEX IF EXISTS ix_screams_text_search')
@@ -4,34 +4,84 @@ import uvicorn
 from fastapi import FastAPI
 
 from api.config import settings
-from api.database import create_database
+from api.database import create_database, writer
 from api.errors import register_exception_handler
+from api.compression import CompressionMiddleware
+from api.metrics import MetricsMiddleware, router as metrics_router
+from api.profiling import QueryProfilerMiddleware
 
 from api.memes import router as memes_router
+from api.memes.service import supermeme
 from api.screams import router as screams_router
+from api.screams.buffer import reaction_buffer
+from api.screams.group_commit import scream_committer
 from api.analytics import router as analytics_router
+from api.analytics.service import quickchart
+from api.events import router as events_router
+from api.subscribers import router as subscribers_router
 
 
 async def startup() -> None:
     """Perform start-up actions."""
     await create_database()
+    if reaction_buffer is not None:
+        reaction_buffer.start()
+
+
+async def shutdown() -> None:
+    """Perform shutdown actions."""
+    if scream_committer is not None:
+        await scream_committer.close()
+    if reaction_buffer is not None:
+        await reaction_buffer.close()
+    if writer is not None:
+        await writer.close()
+    await quickchart.close()
+    await supermeme.close()
 
 
 app = FastAPI(
     **settings.app_meta.model_dump(),
     on_startup=[startup],
+    on_shutdown=[shutdown],
 )
 
 register_exception_handler(app)
 
+if settings.compression.enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=settings.compression.encodings,
+        minimum_size=settings.compression.minimum_size,
+        levels={
+            'gzip': settings.compression.gzip_level,
+            'br': settings.compression.brotli_level,
+            'zstd': settings.compression.zstd_level,
+        },
+    )
+
+if settings.profiler.enabled:
+    app.add_middleware(
+        QueryProfilerMiddleware,
+        slow_ms=settings.profiler.slow_request_ms,
+        duplicate_threshold=settings.profiler.duplicate_threshold,
+    )
+
+if settings.metrics.enabled:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
 app.include_router(screams_router)
 app.include_router(analytics_router)
 app.include_router(memes_router)
+app.include_router(subscribers_router)
+app.include_router(events_router)
 
 if __name__ == '__main__':
     uvicorn.run(
         app,
         host=settings.host,
         port=settings.port,
+        uds=settings.uds,
         forwarded_allow_ips='*',
     )
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import schemas, service
 from api.screams import Scream
-from api.database import get_async_session
+from api.database import get_read_session
 
 router = APIRouter(tags=['Analytics'], prefix='/analytics')
 
@@ -19,7 +19,7 @@ router = APIRouter(tags=['Analytics'], prefix='/analytics')
 )
 async def get_stats(
     user_id: int = Path(..., title='User ID'),
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """Get statistics for user."""
     return await service.get_stats(session, user_id)
@@ -32,7 +32,7 @@ async def get_stats(
 async def get_graph(
     user_id: int = Path(..., title='User ID'),
     period: Literal['week', 'month', 'year'] = Query(..., title='Period'),
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """Get statistics graph for user and time period."""
     return Response(
@@ -41,12 +41,26 @@ async def get_graph(
     )
 
 
+@router.get(
+    '/{user_id}/summary',
+    response_model=schemas.Summary,
+)
+async def get_summary(
+    user_id: int = Path(..., title='User ID'),
+    period: Literal['week', 'month', 'year'] = Query(..., title='Period'),
+    graph: Literal['inline', 'url'] = Query('inline', title='Graph format'),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """Get statistics with statistics graph for user and time period."""
+    return await service.get_summary(session, user_id, period, graph)
+
+
 @router.get('/getMostVoted', response_model=Scream | None)
 async def get_most_voted(
     period: Literal['day', 'week', 'month', 'year'] = Query(
         ..., title='Period'
     ),
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """Get most voted scream in time period."""
     return await service.get_most_voted(session, period)
@@ -1,6 +1,6 @@
 """`/analytics` route schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict
 
 
@@ -9,3 +9,25 @@ class Stats(BaseModel):
 
     screams_count: int = Field(..., ge=0)
     reactions_count: Dict[str, int] = Field(default_factory=dict)
+
+
+class Graph(BaseModel):
+    """Statistics graph, either rendered or as a URL rendering it.
+
+    The rendered image is base64 encoded in JSON.
+    """
+
+    url: str | None = None
+    image: bytes | None = None
+
+    model_config = ConfigDict(
+        ser_json_bytes='base64',
+        val_json_bytes='base64',
+    )
+
+
+class Summary(BaseModel):
+    """Scream reaction statistics with statistics graph."""
+
+    stats: Stats
+    graph: Graph
@@ -1,16 +1,46 @@
-"""Utility functions for analytics."""
+"""Utility functions for analytics.
 
-from datetime import datetime, timedelta, timezone
-from calendar import monthrange
-from typing import Literal
+The same queries serve SQLite and PostgreSQL, there is no
+dialect-specific path.
+"""
 
-from sqlalchemy import select, func, extract
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from calendar import monthrange
+from typing import Iterable, Literal, Sequence
+
+from sqlalchemy import (
+    Select,
+    String,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    union_all,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import schemas
 from api import models
-from api.screams import Scream, scream_orm2schema
+from api.config import settings
+from api.localtime import TIMEZONE
+from api.partitions import (
+    LIVE,
+    PartitionRoute,
+    get_archived_months,
+    route_period,
+    select_reactions,
+    select_screams,
+)
+from api.screams import (
+    Scream,
+    scream_rows2schemas,
+    select_archived_screams_with_reactions,
+    select_screams_with_reactions,
+)
 from api.external.quickchart import QuickChart, Chart, ChartData, Dataset
+from api.metrics import MetricsTransport
 
 
 WEEKDAYS = {
@@ -40,6 +70,12 @@ MONTHS = {
 }
 """Months enumeration."""
 
+quickchart = QuickChart(
+    settings.quickchart.url,
+    MetricsTransport('quickchart') if settings.metrics.enabled else None,
+)
+"""QuickChart API client shared by requests."""
+
 
 def get_period_limits(
     period: Literal['day', 'week', 'month', 'year'],
@@ -93,102 +129,212 @@ async def get_stats(session: AsyncSession, user_id: int) -> schemas.Stats:
     Returns:
         Stats schema
     """
+    route = PartitionRoute(archived=tuple(await get_archived_months(session)))
+    screams = select_screams(route)
+
     screams_count = await session.execute(
         select(func.count())
-        .select_from(models.Scream)
-        .where(models.Scream.user_id == user_id)
-    )
-
-    reactions = await session.execute(
-        select(models.Reaction.reaction, func.count(models.Reaction.id))
-        .join(models.Scream, models.Scream.id == models.Reaction.scream_id)
-        .where(models.Scream.user_id == user_id)
-        .group_by(models.Reaction.reaction)
+        .select_from(screams)
+        .where(screams.c.user_id == user_id)
     )
+    reactions = await session.execute(select_reactions_count(user_id, route))
 
     return schemas.Stats(
         screams_count=screams_count.scalar() or 0,
-        reactions_count={r.reaction: r.count for r in reactions.all()},
+        reactions_count=dict(reactions.all()),
     )
 
 
-async def get_graph(
-    session: AsyncSession,
+def select_reactions_count(
     user_id: int,
-    period: Literal['week', 'month', 'year'],
-) -> bytes:
+    route: PartitionRoute = LIVE,
+) -> Select:
     """
-    Get statistics graph picture for time period.
+    Build query counting reactions to user screams by reaction.
 
     Args:
-        session (AsyncSession): Session
         user_id (int): User ID
-        period: Time period
+        route (PartitionRoute): Partitions of the counted screams
 
     Returns:
-        Graph picture as bytes
+        Query selecting reaction and its count
+    """
+    if not route.archived:
+        return (
+            select(models.Reaction.reaction, func.count(models.Reaction.id))
+            .join(
+                models.Scream, models.Scream.id == models.Reaction.scream_id
+            )
+            .where(models.Scream.user_id == user_id)
+            .group_by(models.Reaction.reaction)
+        )
+
+    screams = select_screams(route)
+    reactions = select_reactions(route)
+
+    return (
+        select(reactions.c.reaction, func.sum(reactions.c.count))
+        .join(screams, screams.c.id == reactions.c.scream_id)
+        .where(screams.c.user_id == user_id)
+        .group_by(reactions.c.reaction)
+    )
+
+
+def get_graph_today() -> datetime:
     """
-    today = datetime.now(tz=timezone(timedelta(hours=+3))).replace(
+    Get start of today in the analytics timezone.
+
+    Returns:
+        Today datetime
+    """
+    return datetime.now(tz=TIMEZONE).replace(
         hour=0, minute=0, second=0, microsecond=0
     )
 
+
+def get_period_dates(
+    period: Literal['day', 'week', 'month', 'year'],
+    today: datetime,
+) -> tuple[date, date]:
+    """
+    Get first and last local dates of time period.
+
+    Args:
+        period: Time period
+        today (datetime): Today datetime
+
+    Returns:
+        Inclusive bounds of time period
+    """
     start, end = get_period_limits(period, today)
+    return start.date(), end.date()
+
 
+def get_graph_bar(period: Literal['week', 'month', 'year'], day: date) -> int:
+    """
+    Get number of the graph bar a local date falls into.
+
+    Args:
+        period: Time period
+        day (date): Local date
+
+    Returns:
+        Weekday for a week with Sunday as 0, day of month for a month or
+        month for a year
+    """
     match period:
         case 'week':
-            extract_field = 'dow'
+            return (day.weekday() + 1) % 7
+        case 'month':
+            return day.day
+        case 'year':
+            return day.month
+        case _:
+            raise ValueError('Invalid period')
 
+
+def count_graph_bars(
+    period: Literal['week', 'month', 'year'],
+    days: Iterable[tuple[date, int]],
+) -> dict[int, int]:
+    """
+    Sum screams count per local date into graph bars.
+
+    Args:
+        period: Time period
+        days (Iterable[tuple[date, int]]): Local date and screams count
+
+    Returns:
+        Screams count per bar number
+    """
+    bars = defaultdict(int)
+    for day, count in days:
+        bars[get_graph_bar(period, day)] += count
+
+    return dict(bars)
+
+
+def select_graph_buckets(
+    user_id: int,
+    period: Literal['week', 'month', 'year'],
+    today: datetime,
+    route: PartitionRoute = LIVE,
+) -> Select:
+    """
+    Build query counting user screams per local date of time period.
+
+    The query range-scans the `(user_id, local_date)` index.
+
+    Args:
+        user_id (int): User ID
+        period: Time period
+        today (datetime): Today datetime
+        route (PartitionRoute): Partitions holding the period
+
+    Returns:
+        Query selecting local date and screams count
+    """
+    start, end = get_period_dates(period, today)
+    screams = select_screams(route)
+
+    return (
+        select(screams.c.local_date, func.count().label('count'))
+        .where(screams.c.user_id == user_id)
+        .where(screams.c.local_date >= start)
+        .where(screams.c.local_date <= end)
+        .group_by(screams.c.local_date)
+    )
+
+
+def build_chart(
+    period: Literal['week', 'month', 'year'],
+    today: datetime,
+    buckets: dict[int, int],
+) -> Chart:
+    """
+    Build statistics graph of a time period.
+
+    Args:
+        period: Time period
+        today (datetime): Today datetime
+        buckets (dict[int, int]): Screams count per bar number
+
+    Returns:
+        Chart configuration
+    """
+    start, end = get_period_limits(period, today)
+
+    match period:
+        case 'week':
             labels = list(WEEKDAYS.values())
-            to_data = lambda d: [  # noqa: E731
-                d.get(dow, 0) for dow in WEEKDAYS.keys()
-            ]
+            data = [buckets.get(dow, 0) for dow in WEEKDAYS.keys()]
 
             title = (
                 f'Screams from {start.strftime("%b %d")}'
                 f' to {end.strftime("%b %d")}'
             )
         case 'month':
-            extract_field = 'day'
-
             days = monthrange(today.year, today.month)[1]
             labels = list(map(str, range(1, days + 1)))
-            to_data = lambda d: [  # noqa: E731
-                d.get(day, 0) for day in range(1, days + 1)
-            ]
+            data = [buckets.get(day, 0) for day in range(1, days + 1)]
 
             title = f'Screams for {today.strftime("%b %Y")}'
         case 'year':
-            extract_field = 'month'
-
             labels = list(MONTHS.values())
-            to_data = lambda d: [  # noqa: E731
-                d.get(month, 0) for month in MONTHS.keys()
-            ]
+            data = [buckets.get(month, 0) for month in MONTHS.keys()]
 
             title = f'Screams for {start.strftime("%Y")} year'
         case _:
             raise ValueError('Invalid period')
 
-    screams_count = await session.execute(
-        select(
-            extract(extract_field, models.Scream.created_at),
-            func.count(models.Scream.id),
-        )
-        .where(models.Scream.user_id == user_id)
-        .where(models.Scream.created_at >= start)
-        .where(models.Scream.created_at <= end)
-        .group_by(extract(extract_field, models.Scream.created_at))
-        .order_by(extract(extract_field, models.Scream.created_at))
-    )
-
-    chart = Chart(
+    return Chart(
         type='bar',
         data=ChartData(
             labels=labels,
             datasets=[
                 Dataset(
                     label='posts',
-                    data=to_data({d[0]: d[1] for d in screams_count.all()}),
+                    data=data,
                     backgroundColor='black',
                 )
             ],
@@ -228,7 +374,138 @@ async def get_graph(
         },
     )
 
-    return await QuickChart().chart(chart)
+
+async def get_graph(
+    session: AsyncSession,
+    user_id: int,
+    period: Literal['week', 'month', 'year'],
+) -> bytes:
+    """
+    Get statistics graph picture for time period.
+
+    Args:
+        session (AsyncSession): Session
+        user_id (int): User ID
+        period: Time period
+
+    Returns:
+        Graph picture as bytes
+    """
+    today = get_graph_today()
+    route = route_period(
+        await get_archived_months(session),
+        *get_period_limits(period, today),
+    )
+
+    days = await session.execute(
+        select_graph_buckets(user_id, period, today, route)
+    )
+    chart = build_chart(period, today, count_graph_bars(period, days))
+
+    return await quickchart.chart(chart)
+
+
+async def get_summary(
+    session: AsyncSession,
+    user_id: int,
+    period: Literal['week', 'month', 'year'],
+    graph: Literal['inline', 'url'] = 'inline',
+) -> schemas.Summary:
+    """
+    Get stats and statistics graph for user.
+
+    Args:
+        session (AsyncSession): Session
+        user_id (int): User ID
+        period: Graph time period
+        graph: Return rendered graph picture or URL rendering it
+
+    Returns:
+        Summary schema
+    """
+    today = get_graph_today()
+    stats, bars = await get_stats_and_bars(
+        session,
+        user_id,
+        period,
+        today,
+        await get_archived_months(session),
+    )
+
+    chart = build_chart(period, today, bars)
+    if graph == 'url':
+        return schemas.Summary(
+            stats=stats,
+            graph=schemas.Graph(url=quickchart.url(chart)),
+        )
+
+    return schemas.Summary(
+        stats=stats,
+        graph=schemas.Graph(image=await quickchart.chart(chart)),
+    )
+
+
+async def get_stats_and_bars(
+    session: AsyncSession,
+    user_id: int,
+    period: Literal['week', 'month', 'year'],
+    today: datetime,
+    archived: Sequence[int] = (),
+) -> tuple[schemas.Stats, dict[int, int]]:
+    """
+    Get stats and graph bars for user with a single `UNION ALL` query.
+
+    Args:
+        session (AsyncSession): Session
+        user_id (int): User ID
+        period: Graph time period
+        today (datetime): Today datetime
+        archived (Sequence[int]): Archived month keys
+
+    Returns:
+        Stats schema and screams count per bar number
+    """
+    route = PartitionRoute(archived=tuple(archived))
+    screams = select_screams(route)
+    screams_count = (
+        select(
+            literal('screams').label('kind'),
+            null().label('key'),
+            func.count().label('count'),
+        )
+        .select_from(screams)
+        .where(screams.c.user_id == user_id)
+    )
+    reactions = select_reactions_count(user_id, route).subquery()
+    reactions_count = select(literal('reaction'), *reactions.c)
+    days = select_graph_buckets(
+        user_id,
+        period,
+        today,
+        route_period(archived, *get_period_limits(period, today)),
+    ).subquery()
+    days_count = select(
+        literal('day'),
+        cast(days.c.local_date, String),
+        days.c.count,
+    )
+
+    result = await session.execute(
+        union_all(screams_count, reactions_count, days_count)
+    )
+
+    stats = schemas.Stats(screams_count=0)
+    days = []
+    for kind, key, count in result.all():
+        match kind:
+            case 'screams':
+                stats.screams_count = count
+            case 'reaction':
+                stats.reactions_count[key] = count
+            case 'day':
+                days.append((date.fromisoformat(key), count))
+
+    return stats, count_graph_bars(period, days)
 
 
 async def get_most_voted(
@@ -240,30 +517,118 @@ async def get_most_voted(
 
     Args:
         session (AsyncSession): Session
-        perdio: Time period
+        period: Time period
 
     Returns:
         Scream schema
     """
-    today = datetime.now(tz=timezone(timedelta(hours=+3))).replace(
-        hour=0, minute=0, second=0, microsecond=0
+    today = get_graph_today()
+
+    route = route_period(
+        await get_archived_months(session),
+        *get_period_limits(period, today),
     )
+    start, end = get_period_dates(period, today)
 
-    start, end = get_period_limits(period, today)
+    if not route.archived:
+        most_voted_id = (
+            select_most_voted_live(start, end)
+            .with_only_columns(models.Scream.id)
+            .scalar_subquery()
+        )
 
-    result = (
-        await session.execute(
-            select(models.Scream)
-            .join(
-                models.Reaction,
-                models.Scream.id == models.Reaction.scream_id,
+        screams_table = models.Scream.__table__
+        result = await session.execute(
+            select_screams_with_reactions(screams_table).where(
+                screams_table.c.id == most_voted_id
             )
-            .where(models.Scream.created_at >= start)
-            .where(models.Scream.created_at <= end)
-            .group_by(models.Scream.id)
-            .order_by(func.count(models.Reaction.id).desc())
-            .limit(1)
         )
-    ).scalar()
 
-    return scream_orm2schema(result) if result else None
+        screams = scream_rows2schemas(result)
+        return screams[0] if screams else None
+
+    candidates = [
+        (await session.execute(query)).first()
+        for query in (
+            select_most_voted_live(start, end) if route.live else None,
+            select_most_voted_archived(start, end, route.archived),
+        )
+        if query is not None
+    ]
+    candidates = [row for row in candidates if row is not None]
+    if not candidates:
+        return None
+
+    most_voted = max(candidates, key=lambda row: row.votes)
+    if most_voted.archived:
+        query = select_archived_screams_with_reactions().where(
+            models.ArchivedScream.id == most_voted.id
+        )
+    else:
+        screams_table = models.Scream.__table__
+        query = select_screams_with_reactions(screams_table).where(
+            screams_table.c.id == most_voted.id
+        )
+
+    screams = scream_rows2schemas(await session.execute(query))
+    return screams[0] if screams else None
+
+
+def select_most_voted_live(start: date, end: date) -> Select:
+    """
+    Build query of the most voted live scream in time range.
+
+    Args:
+        start (date): First local date
+        end (date): Last local date
+
+    Returns:
+        Query selecting `id`, `votes` and `archived` of the scream
+    """
+    return (
+        select(
+            models.Scream.id,
+            func.count(models.Reaction.id).label('votes'),
+            literal(False).label('archived'),
+        )
+        .join(
+            models.Reaction,
+            models.Scream.id == models.Reaction.scream_id,
+        )
+        .where(models.Scream.local_date >= start)
+        .where(models.Scream.local_date <= end)
+        .group_by(models.Scream.id)
+        .order_by(func.count(models.Reaction.id).desc())
+        .limit(1)
+    )
+
+
+def select_most_voted_archived(
+    start: date,
+    end: date,
+    months: Sequence[int],
+) -> Select:
+    """
+    Build query of the most voted archived scream in time range.
+
+    Args:
+        start (date): First local date
+        end (date): Last local date
+        months (Sequence[int]): Archived month keys of the range
+
+    Returns:
+        Query selecting `id`, `votes` and `archived` of the scream
+    """
+    return (
+        select(
+            models.ArchivedScream.id,
+            models.ArchivedScream.votes,
+            literal(True).label('archived'),
+        )
+        .where(models.ArchivedScream.month.in_(months))
+        .where(models.ArchivedScream.local_date >= start)
+        .where(models.ArchivedScream.local_date <= end)
+        .where(models.ArchivedScream.votes > 0)
+        .order_by(models.ArchivedScream.votes.desc())
+        .limit(1)
+    )
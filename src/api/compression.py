@@ -0,0 +1,266 @@
+"""API response compression."""
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class GzipEncoder:
+    """Streaming gzip encoder."""
+
+    def __init__(self, level: int):
+        """
+        Create GzipEncoder instance.
+
+        Args:
+            level (int): Compression level (1-9)
+        """
+        self._compressor = zlib.compressobj(
+            level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress chunk of data."""
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        """Flush remaining compressed data."""
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    """Streaming brotli encoder."""
+
+    def __init__(self, level: int):
+        """
+        Create BrotliEncoder instance.
+
+        Args:
+            level (int): Compression quality (0-11)
+        """
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress chunk of data."""
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        """Flush remaining compressed data."""
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    """Streaming zstd encoder."""
+
+    def __init__(self, level: int):
+        """
+        Create ZstdEncoder instance.
+
+        Args:
+            level (int): Compression level (1-22)
+        """
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress chunk of data."""
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        """Flush remaining compressed data."""
+        return self._compressor.flush()
+
+
+ENCODERS = {
+    'gzip': GzipEncoder,
+    **({'br': BrotliEncoder} if brotli else {}),
+    **({'zstd': ZstdEncoder} if zstandard else {}),
+}
+"""Available encoders by `Content-Encoding` token."""
+
+
+def negotiate_encoding(
+    accept_encoding: str,
+    encodings: list[str],
+) -> str | None:
+    """
+    Choose response encoding from `Accept-Encoding` header.
+
+    Args:
+        accept_encoding (str): `Accept-Encoding` header value
+        encodings (list[str]): Server encodings in order of preference
+
+    Returns:
+        Chosen encoding or None if client accepts none of them
+    """
+    accepted = {}
+    for item in accept_encoding.split(','):
+        token, _, params = item.strip().partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if token:
+            accepted[token.strip().lower()] = quality
+
+    for encoding in encodings:
+        quality = accepted.get(encoding, accepted.get('*', 0.0))
+        if quality > 0:
+            return encoding
+
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with gzip, brotli or zstd.
+
+    Responses smaller than `minimum_size`, already encoded responses and
+    responses with excluded media types (images by default) are sent as is.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: list[str] = ('zstd', 'br', 'gzip'),
+        minimum_size: int = 1024,
+        levels: dict[str, int] | None = None,
+        excluded_media_types: list[str] = ('image/', 'text/event-stream'),
+    ):
+        """
+        Create CompressionMiddleware instance.
+
+        Args:
+            app (ASGIApp): Wrapped application
+            encodings (list[str]): Encodings in order of preference,
+                unavailable ones are ignored
+            minimum_size (int): Minimal body size to compress in bytes
+            levels (dict[str, int] | None): Compression level by encoding
+            excluded_media_types (list[str]): Media type prefixes
+                that are never compressed
+        """
+        self.app = app
+        self.encodings = [e for e in encodings if e in ENCODERS]
+        self.minimum_size = minimum_size
+        self.levels = {'gzip': 6, 'br': 4, 'zstd': 3, **(levels or {})}
+        self.excluded_media_types = tuple(excluded_media_types)
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Handle ASGI call."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get('accept-encoding', ''),
+            self.encodings,
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """Compressing wrapper over ASGI `send` for a single response."""
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        encoding: str,
+        send: Send,
+    ):
+        """
+        Create CompressionResponder instance.
+
+        Args:
+            middleware (CompressionMiddleware): Middleware settings
+            encoding (str): Negotiated encoding
+            send (Send): Original ASGI send
+        """
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        self._encoder = None
+        self._passthrough = False
+
+    def _should_compress(
+        self,
+        headers: Headers,
+        body: bytes,
+        more_body: bool,
+    ) -> bool:
+        if 'content-encoding' in headers:
+            return False
+        media_type = headers.get('content-type', '')
+        if media_type.startswith(self.middleware.excluded_media_types):
+            return False
+        return more_body or len(body) >= self.middleware.minimum_size
+
+    async def send(self, message: Message) -> None:
+        """Send ASGI message, compressing response body if needed."""
+        if message['type'] == 'http.response.start':
+            self._start = message
+            return
+
+        if message['type'] != 'http.response.body' or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            headers = MutableHeaders(raw=start['headers'])
+
+            if not self._should_compress(headers, body, more_body):
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self._encoder = ENCODERS[self.encoding](
+                self.middleware.levels.get(self.encoding, 6)
+            )
+            headers['Content-Encoding'] = self.encoding
+            headers.add_vary_header('Accept-Encoding')
+
+            if more_body:
+                del headers['Content-Length']
+            else:
+                body = self._encoder.compress(body) + self._encoder.finish()
+                headers['Content-Length'] = str(len(body))
+                await self._send(start)
+                await self._send({**message, 'body': body})
+                return
+
+            await self._send(start)
+
+        body = self._encoder.compress(body)
+        if not more_body:
+            body += self._encoder.finish()
+
+        await self._send({**message, 'body': body})
@@ -1,5 +1,7 @@
 """API config."""
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -29,6 +31,11 @@ class Database(BaseSettings):
     """Database config object."""
 
     url: str = Field(...)
+    single_writer: bool = Field(False)
+    read_pool_size: int = Field(4)
+    read_urls: list[str] = Field([])
+    read_policy: Literal['round-robin', 'least-busy'] = Field('round-robin')
+    sticky_seconds: float = Field(5.0)
 
     model_config = dotenv_settings_config
     model_config['env_prefix'] = 'database_'
@@ -43,16 +50,143 @@ class Memes(BaseSettings):
     model_config['env_prefix'] = 'meme_'
 
 
+class Compression(BaseSettings):
+    """Response compression config object."""
+
+    enabled: bool = Field(True)
+    encodings: list[str] = Field(['zstd', 'br', 'gzip'])
+    minimum_size: int = Field(1024)
+    gzip_level: int = Field(6)
+    brotli_level: int = Field(4)
+    zstd_level: int = Field(3)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'compression_'
+
+
+class Events(BaseSettings):
+    """Event stream config object."""
+
+    history: int = Field(10000)
+    heartbeat: float = Field(15.0)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'events_'
+
+
+class ReactionWrites(BaseSettings):
+    """Reaction writes config object."""
+
+    write_behind: bool = Field(False)
+    flush_interval_ms: int = Field(200)
+    max_pending: int = Field(1000)
+    max_screams: int = Field(10000)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'reactions_'
+
+
+class ScreamWrites(BaseSettings):
+    """Scream writes config object."""
+
+    bulk_max: int = Field(1000)
+    group_commit: bool = Field(False)
+    group_commit_window_ms: int = Field(5)
+    group_commit_max_batch: int = Field(100)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'screams_'
+
+
+class Archive(BaseSettings):
+    """Scream archive config object."""
+
+    keep_months: int = Field(12)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'archive_'
+
+
+class Search(BaseSettings):
+    """Scream search config object."""
+
+    max_candidates: int = Field(5000)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'search_'
+
+
+class Analytics(BaseSettings):
+    """Analytics config object."""
+
+    timezone: str = Field('Europe/Moscow')
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'analytics_'
+
+
+class QuickChart(BaseSettings):
+    """QuickChart API config object."""
+
+    url: str = Field('https://quickchart.io')
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'quickchart_'
+
+
+class Supermeme(BaseSettings):
+    """Supermeme API config object."""
+
+    url: str = Field('https://supermeme.ai')
+    timeout: float = Field(30.0)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'supermeme_'
+
+
+class Metrics(BaseSettings):
+    """Prometheus metrics config object."""
+
+    enabled: bool = Field(True)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'metrics_'
+
+
+class Profiler(BaseSettings):
+    """SQL query profiler config object."""
+
+    enabled: bool = Field(False)
+    slow_request_ms: float = Field(500)
+    duplicate_threshold: int = Field(5)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'profiler_'
+
+
 class Settings(BaseSettings):
     """Application settings."""
 
     host: str = Field('127.0.0.1')
     port: int = Field(8000)
+    uds: str | None = Field(None)
     app_meta: AppMeta = AppMeta()
     database: Database = Database()
     memes: Memes = Memes()
+    compression: Compression = Compression()
+    events: Events = Events()
+    reaction_writes: ReactionWrites = ReactionWrites()
+    scream_writes: ScreamWrites = ScreamWrites()
+    archive: Archive = Archive()
+    search: Search = Search()
+    analytics: Analytics = Analytics()
+    quickchart: QuickChart = QuickChart()
+    supermeme: Supermeme = Supermeme()
+    metrics: Metrics = Metrics()
+    profiler: Profiler = Profiler()
 
     model_config = dotenv_settings_config
+    model_config['env_prefix'] = ''
 
 
 settings = Settings()
@@ -1,20 +1,72 @@
 """API database."""
 
-from typing import AsyncGenerator
+from contextlib import AbstractAsyncContextManager
+from functools import wraps
+from typing import AsyncGenerator, Awaitable, Callable, TypeVar
 
-from sqlalchemy import NullPool
+from fastapi import Request
+from sqlalchemy import NullPool, event
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     create_async_engine,
     async_sessionmaker,
     AsyncSession,
 )
 
 from api.config import settings
+from api.metrics import instrument_engine
+from api.profiling import profile_engine
+from api.replicas import ReadReplicas, RecentWriters
+from api.writer import DatabaseWriter
+
+T = TypeVar('T')
 
 Base = declarative_base()
 
-engine = create_async_engine(settings.database.url, poolclass=NullPool)
+
+def set_sqlite_pragmas(engine: AsyncEngine, *pragmas: str) -> None:
+    """
+    Execute SQLite pragmas on every new connection of engine.
+
+    Args:
+        engine (AsyncEngine): Engine
+        *pragmas (str): Pragmas like `journal_mode = WAL`
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine.sync_engine, 'connect')
+    def set_pragmas(dbapi_connection, _) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f'PRAGMA {pragma}')
+        cursor.close()
+
+
+def create_write_engine(url: str) -> AsyncEngine:
+    """Create engine with a single connection for the database writer."""
+    engine = create_async_engine(url, pool_size=1, max_overflow=0)
+    set_sqlite_pragmas(engine, 'journal_mode = WAL', 'busy_timeout = 5000')
+    return engine
+
+
+def create_read_engine(url: str, pool_size: int) -> AsyncEngine:
+    """Create engine with a pool of read-only connections."""
+    engine = create_async_engine(url, pool_size=pool_size, max_overflow=0)
+    set_sqlite_pragmas(engine, 'query_only = ON', 'busy_timeout = 5000')
+    return engine
+
+
+if settings.database.single_writer:
+    engine = create_write_engine(settings.database.url)
+    read_engine = create_read_engine(
+        settings.database.url, settings.database.read_pool_size
+    )
+else:
+    engine = read_engine = create_async_engine(
+        settings.database.url, poolclass=NullPool
+    )
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -22,6 +74,58 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+writer = (
+    DatabaseWriter(AsyncSessionLocal)
+    if settings.database.single_writer
+    else None
+)
+"""Application database writer, `None` unless single writer is enabled."""
+
+replica_engines = [
+    create_read_engine(url, settings.database.read_pool_size)
+    for url in settings.database.read_urls
+]
+"""Engines of read replicas."""
+
+engines = {
+    'primary': engine,
+    **({'read': read_engine} if read_engine is not engine else {}),
+    **{
+        f'replica-{index}': replica_engine
+        for index, replica_engine in enumerate(replica_engines)
+    },
+}
+"""Application engines by name."""
+
+for name, named_engine in engines.items():
+    if settings.metrics.enabled:
+        instrument_engine(named_engine, name)
+    if settings.profiler.enabled:
+        profile_engine(named_engine)
+
+replicas = ReadReplicas(
+    [
+        async_sessionmaker(
+            replica_engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        for replica_engine in replica_engines
+    ]
+    or [ReadSessionLocal],
+    policy=settings.database.read_policy,
+)
+"""Application read replicas, the primary database unless configured."""
+
+recent_writers = RecentWriters(settings.database.sticky_seconds)
+"""Users whose reads go to the primary database."""
+
 
 async def create_database():
     """Create database."""
@@ -30,6 +134,102 @@ async def create_database():
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get asynchrounous session."""
-    async with AsyncSessionLocal() as session:
+    """
+    Get asynchrounous session of the primary database.
+
+    The session is read-only with the single writer enabled, use
+    `get_write_session` in routes that write.
+    """
+    async with ReadSessionLocal() as session:
         yield session
+
+
+async def get_write_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get asynchrounous session of the primary database for writing.
+
+    With the single writer enabled the writes run through it, so the
+    session is read-only and only serves reads of the request.
+    """
+    session_factory = (
+        ReadSessionLocal if writer is not None else AsyncSessionLocal
+    )
+    async with session_factory() as session:
+        yield session
+
+
+async def get_read_session(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get asynchrounous session of a read replica.
+
+    Reads of a user who wrote recently go to the primary database. The
+    user is identified by the `user_id` path parameter or otherwise by
+    the `X-User-Id` header, which the bot sends with every request it
+    makes for a user.
+
+    Args:
+        request (Request): Request
+    """
+    user_id = request.path_params.get(
+        'user_id', request.headers.get('x-user-id')
+    )
+    if user_id is not None and recent_writers.recent(user_id):
+        async with ReadSessionLocal() as session:
+            yield session
+        return
+
+    async with replicas.session() as session:
+        yield session
+
+
+def write_session() -> AbstractAsyncContextManager[AsyncSession]:
+    """Open session for writing, waiting for the writer if enabled."""
+    if writer is not None:
+        return writer.session()
+    return AsyncSessionLocal()
+
+
+async def write(
+    session: AsyncSession,
+    operation: Callable[..., Awaitable[T]],
+    *args,
+    **kwargs,
+) -> T:
+    """
+    Run write operation, queued to the database writer if enabled.
+
+    Args:
+        session (AsyncSession): Caller session, used without the writer
+        operation (Callable): Coroutine function taking a session
+            followed by `args` and `kwargs`
+        *args: Operation arguments
+        **kwargs: Operation keyword arguments
+
+    Returns:
+        Operation result
+    """
+    if writer is not None:
+        return await writer.run(operation, *args, **kwargs)
+    return await operation(session, *args, **kwargs)
+
+
+def writes(
+    operation: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """
+    Make service function taking a session run its writes via `write`.
+
+    Args:
+        operation (Callable): Coroutine function taking a session first
+
+    Returns:
+        Coroutine function with the same signature
+    """
+
+    @wraps(operation)
+    async def wrapper(session: AsyncSession, *args, **kwargs) -> T:
+        return await write(session, operation, *args, **kwargs)
+
+    return wrapper
@@ -3,7 +3,7 @@
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
-from api.screams import ScreamNotFound
+from api.screams import InvalidCursor, ScreamNotFound
 
 
 async def scream_not_found_handler(request: Request, exc: ScreamNotFound):
@@ -14,6 +14,15 @@ async def scream_not_found_handler(request: Request, exc: ScreamNotFound):
     )
 
 
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    """Handle InvalidCursor."""
+    return JSONResponse(
+        status_code=400,
+        content={'message': exc.message},
+    )
+
+
 def register_exception_handler(app):
     """Register exception handler for application."""
     app.add_exception_handler(ScreamNotFound, scream_not_found_handler)
+    app.add_exception_handler(InvalidCursor, invalid_cursor_handler)
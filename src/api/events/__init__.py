@@ -0,0 +1,7 @@
+"""`/events` route module."""
+
+from .bus import EventBus, bus
+from .routes import router
+from .schemas import Event
+
+__all__ = ['Event', 'EventBus', 'bus', 'router']
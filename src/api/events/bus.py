@@ -0,0 +1,126 @@
+"""In-process publish/subscribe of scream events."""
+
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import Any, AsyncIterator
+
+from api.config import settings
+from .schemas import Event, EventType
+
+
+class EventBus:
+    """
+    Event fan-out backed by a ring buffer of recent events.
+
+    Subscribers do not get their own queues: all of them read the shared
+    buffer from their cursor (ID of the last received event) and wait
+    for a notification about new events, so publishing does the same
+    work regardless of the number of subscribers.
+    """
+
+    def __init__(self, history: int = 10000):
+        """
+        Initialize the EventBus.
+
+        Args:
+            history (int): Number of recent events kept for resuming
+        """
+        self.last_id = 0
+        self._events: deque[Event] = deque(maxlen=history)
+        self._published = asyncio.Event()
+
+    def publish(self, type: EventType, data: dict[str, Any]) -> Event:
+        """
+        Publish event to all subscribers.
+
+        Args:
+            type: Event type
+            data (dict[str, Any]): JSON-serializable event data
+
+        Returns:
+            Published event
+        """
+        self.last_id += 1
+        event = Event(id=self.last_id, type=type, data=data)
+        self._events.append(event)
+
+        published, self._published = self._published, asyncio.Event()
+        published.set()
+
+        return event
+
+    def since(self, cursor: int) -> list[Event] | None:
+        """
+        Get events published after the cursor.
+
+        Args:
+            cursor (int): ID of the last received event
+
+        Returns:
+            Events after the cursor or `None` if some of them are
+            no longer kept (or the cursor is from a previous run)
+        """
+        if cursor > self.last_id:
+            return None
+        if cursor == self.last_id:
+            return []
+
+        first_id = self.last_id - len(self._events) + 1
+        if cursor + 1 < first_id:
+            return None
+
+        return list(islice(self._events, cursor + 1 - first_id, None))
+
+    async def wait(self, cursor: int) -> None:
+        """
+        Wait until an event after the cursor is published.
+
+        Args:
+            cursor (int): ID of the last received event
+        """
+        while self.last_id <= cursor:
+            await self._published.wait()
+
+    async def subscribe(
+        self,
+        cursor: int | None = None,
+        heartbeat: float | None = None,
+    ) -> AsyncIterator[Event | None]:
+        """
+        Iterate over events after the cursor, waiting for new ones.
+
+        If the cursor can not be resumed from, a `reset` event tells the
+        subscriber to reload the state and continue from its ID.
+
+        Args:
+            cursor (int | None): ID of the last received event,
+                `None` to receive only new events
+            heartbeat (float | None): Seconds after which `None` is
+                yielded if nothing was published
+
+        Yields:
+            Events, or `None` as a heartbeat
+        """
+        if cursor is None:
+            cursor = self.last_id
+
+        while True:
+            events = self.since(cursor)
+            if events is None:
+                cursor = self.last_id
+                yield Event(id=cursor, type='reset')
+                continue
+
+            for event in events:
+                cursor = event.id
+                yield event
+
+            try:
+                await asyncio.wait_for(self.wait(cursor), heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+
+
+bus = EventBus(settings.events.history)
+"""Application event bus."""
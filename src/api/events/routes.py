@@ -0,0 +1,39 @@
+"""`events` routes."""
+
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+
+from api.config import settings
+from .bus import bus
+
+router = APIRouter(tags=['Events'], prefix='/events')
+
+
+@router.get('/', response_class=StreamingResponse)
+async def stream_events(
+    cursor: int | None = Query(None, title='Last received event ID', ge=0),
+    last_event_id: int | None = Header(None, ge=0),
+):
+    """
+    Stream scream events as Server-Sent Events.
+
+    Streams `scream-created`, `scream-deleted` and `reaction-changed`
+    events. Reconnecting clients resume after `Last-Event-ID` header
+    (sent by browsers automatically) or `cursor` query parameter.
+
+    Args:
+        cursor (int | None): ID of the last received event
+        last_event_id (int | None): ID of the last received event
+    """
+    if last_event_id is not None:
+        cursor = last_event_id
+
+    async def stream():
+        async for event in bus.subscribe(cursor, settings.events.heartbeat):
+            yield event.sse if event else ': heartbeat\n\n'
+
+    return StreamingResponse(
+        stream(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
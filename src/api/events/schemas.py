@@ -0,0 +1,27 @@
+"""`/events` route schemas."""
+
+import json
+from functools import cached_property
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+EventType = Literal['scream-created', 'scream-deleted', 'reaction-changed']
+"""Type of a published event."""
+
+
+class Event(BaseModel):
+    """Event about a change of screams."""
+
+    id: int = Field(..., ge=0)
+    type: EventType | Literal['reset'] = Field(...)
+    data: dict[str, Any] = Field(default_factory=dict)
+
+    @cached_property
+    def sse(self) -> str:
+        """Event encoded as a Server-Sent Events message."""
+        return (
+            f'id: {self.id}\n'
+            f'event: {self.type}\n'
+            f'data: {json.dumps(self.data, ensure_ascii=False)}\n\n'
+        )
@@ -1,8 +1,9 @@
 """QuickChart API wrapper module."""
 
 from typing import List, Any
+from urllib.parse import urlencode
 from pydantic import BaseModel
-from httpx import AsyncClient
+from httpx import AsyncBaseTransport, AsyncClient
 
 
 class Dataset(BaseModel):
@@ -72,14 +73,21 @@ class QuickChart:
         ```
     """
 
-    def __init__(self, quickchart_url: str = 'https://quickchart.io'):
+    def __init__(
+        self,
+        quickchart_url: str = 'https://quickchart.io',
+        transport: AsyncBaseTransport | None = None,
+    ):
         """
         Initialize a QuickChart instance.
 
         Args:
             quickchart_url (str): Base url of QuickChart API.
+            transport (AsyncBaseTransport | None): Transport sending
+                requests, the default one if omitted.
         """
-        self.client = AsyncClient(base_url=quickchart_url)
+        self.quickchart_url = quickchart_url
+        self.client = AsyncClient(base_url=quickchart_url, transport=transport)
 
     async def chart(self, chart: Chart) -> bytes:
         """
@@ -104,6 +112,28 @@ class QuickChart:
                 'backgroundColor': 'white',
             },
         )
-        await response.raise_for_status()
+        response.raise_for_status()
 
         return response.content
+
+    def url(self, chart: Chart) -> str:
+        """
+        Get URL rendering a chart image when requested.
+
+        Args:
+            chart (Chart): Chart configuration object.
+
+        Returns:
+            str: Chart image URL
+        """
+        query = urlencode(
+            {
+                'c': chart.model_dump_json(exclude_none=True),
+                'bkg': 'white',
+            }
+        )
+        return f'{self.quickchart_url}/chart?{query}'
+
+    async def close(self) -> None:
+        """Close connections to QuickChart API."""
+        await self.client.aclose()
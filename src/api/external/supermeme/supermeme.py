@@ -4,7 +4,7 @@ import json
 from typing import List
 
 from bs4 import BeautifulSoup
-from httpx import AsyncClient, Timeout
+from httpx import AsyncBaseTransport, AsyncClient, Timeout
 from pydantic import BaseModel, Field, ValidationError
 
 
@@ -56,6 +56,7 @@ class Supermeme:
         self,
         base_url: str = 'https://supermeme.ai',
         timeout: float = 30.0,
+        transport: AsyncBaseTransport | None = None,
     ):
         """
         Initialize a Supermeme instance.
@@ -63,10 +64,13 @@ class Supermeme:
         Args:
             base_url (str): Base url of Supermeme.
             timeout (float): Timeout for requests to Supermeme.
+            transport (AsyncBaseTransport | None): Transport sending
+                requests, the default one if omitted.
         """
         self.client = AsyncClient(
             base_url=base_url,
             timeout=Timeout(timeout),
+            transport=transport,
         )
 
     async def search_meme_templates(self, query: str) -> List[MemeTemplate]:
@@ -75,10 +79,10 @@ class Supermeme:
             '/api/search',
             params={'searchQuery': query},
         )
-        await response.raise_for_status()
+        response.raise_for_status()
 
         try:
-            response_data = await response.json()
+            response_data = response.json()
             meme_templates = [
                 MemeTemplate.model_validate(template)
                 for template in response_data['memeTemplates']
@@ -94,7 +98,7 @@ class Supermeme:
     ) -> MemeTemplateProps:
         """Get MemeTemplateProps for MemeTemplate instance."""
         response = await self.client.get(f'/meme/{meme.name}')
-        await response.raise_for_status()
+        response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'html.parser')
         next_data = soup.find(id='__NEXT_DATA__')
@@ -112,3 +116,14 @@ class Supermeme:
             raise ValueError('Invalid __NEXT_DATA__ schema') from e
 
         return meme_template_props
+
+    async def get_meme_image(self, meme: MemeTemplateProps) -> bytes:
+        """Get image of MemeTemplateProps instance."""
+        response = await self.client.get(meme.image_src)
+        response.raise_for_status()
+
+        return response.content
+
+    async def close(self) -> None:
+        """Close connections to Supermeme."""
+        await self.client.aclose()
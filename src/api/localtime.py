@@ -0,0 +1,34 @@
+"""Local time of analytics."""
+
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from api.config import settings
+
+TIMEZONE = ZoneInfo(settings.analytics.timezone)
+"""Timezone of local dates and graphs."""
+
+
+def to_local(moment: datetime) -> datetime:
+    """
+    Convert datetime to the analytics timezone.
+
+    Args:
+        moment (datetime): Datetime, naive ones are taken as UTC
+
+    Returns:
+        Aware datetime in the analytics timezone
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(TIMEZONE)
+
+
+def utcnow() -> datetime:
+    """
+    Get current UTC datetime.
+
+    Returns:
+        Aware datetime
+    """
+    return datetime.now(tz=timezone.utc)
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import service
-from api.database import get_async_session
+from api.database import get_read_session
 
 router = APIRouter(tags=['Memes'], prefix='/memes')
 
@@ -16,7 +16,7 @@ router = APIRouter(tags=['Memes'], prefix='/memes')
 )
 async def generate_meme(
     scream_id: int = Query(..., title='Scream ID'),
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """Generate meme from scream."""
     return Response(
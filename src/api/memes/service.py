@@ -2,13 +2,20 @@
 
 from io import BytesIO
 
-import httpx
 from PIL import Image, ImageDraw, ImageFont
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.config import settings
 from api.screams import get_scream
 from api.external.supermeme import Supermeme, MemeTemplateProps
+from api.metrics import MetricsTransport
+
+supermeme = Supermeme(
+    settings.supermeme.url,
+    settings.supermeme.timeout,
+    MetricsTransport('supermeme') if settings.metrics.enabled else None,
+)
+"""Supermeme API client shared by requests."""
 
 
 def get_text_sizes(text: str, font: ImageFont) -> tuple[float, float]:
@@ -121,7 +128,7 @@ def insert_text_on_image(
     return image
 
 
-def fetch_meme_image(meme: MemeTemplateProps) -> Image:
+async def fetch_meme_image(meme: MemeTemplateProps) -> Image:
     """
     Fetch meme image from MemeTemplateProps.
 
@@ -131,10 +138,9 @@ def fetch_meme_image(meme: MemeTemplateProps) -> Image:
     Returns:
         Meme as PIL image
     """
-    response = httpx.get(meme.image_src)
-    response.raise_for_status()
+    content = await supermeme.get_meme_image(meme)
 
-    image = Image.open(BytesIO(response.content))
+    image = Image.open(BytesIO(content))
     image.thumbnail((meme.image_width, meme.image_height))
 
     return image
@@ -171,13 +177,12 @@ async def generate_meme(
     """
     scream = await get_scream(session, scream_id)
 
-    supermeme = Supermeme()
     meme_templates = await supermeme.search_meme_templates(scream.text)
     meme_template_props = await supermeme.get_meme_template_props(
         meme_templates[0]
     )
 
-    image = fetch_meme_image(meme_template_props)
+    image = await fetch_meme_image(meme_template_props)
     caption = meme_template_props.initial_captions[0]
 
     insert_text_on_image(
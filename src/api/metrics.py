@@ -0,0 +1,308 @@
+"""API Prometheus metrics.
+
+`MetricsMiddleware` times every request by the route template it matched
+and counts requests in flight. `instrument_engine` times SQL statements
+and pool checkouts of a database engine through SQLAlchemy events, and
+`MetricsTransport` times requests of external API clients. Metrics are
+collected in `registry` and served by `router` at `/metrics`.
+"""
+
+from time import perf_counter
+from weakref import WeakSet
+
+import httpx
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    GCCollector,
+    Histogram,
+    PlatformCollector,
+    ProcessCollector,
+    generate_latest,
+)
+from sqlalchemy import Engine, Pool, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+registry = CollectorRegistry()
+"""Registry of API metrics."""
+
+ProcessCollector(registry=registry)
+PlatformCollector(registry=registry)
+GCCollector(registry=registry)
+
+QUERY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+)
+"""Histogram buckets of SQL statement and pool checkout seconds."""
+
+requests_in_flight = Gauge(
+    'http_requests_in_flight',
+    'HTTP requests being handled',
+    ['method'],
+    registry=registry,
+)
+
+request_duration = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request handling time by route template',
+    ['method', 'route', 'status'],
+    registry=registry,
+)
+
+query_duration = Histogram(
+    'db_query_duration_seconds',
+    'SQL statement execution time',
+    ['engine', 'statement'],
+    buckets=QUERY_BUCKETS,
+    registry=registry,
+)
+
+query_errors = Counter(
+    'db_query_errors',
+    'SQL statements failed with an error',
+    ['engine', 'statement'],
+    registry=registry,
+)
+
+pool_checkout_duration = Histogram(
+    'db_pool_checkout_duration_seconds',
+    'Time waiting for a pooled connection, connecting included',
+    ['engine'],
+    buckets=QUERY_BUCKETS,
+    registry=registry,
+)
+
+pool_checked_out = Gauge(
+    'db_pool_checked_out_connections',
+    'Pooled connections in use',
+    ['engine'],
+    registry=registry,
+)
+
+external_request_duration = Histogram(
+    'external_request_duration_seconds',
+    'External API response time until headers',
+    ['service', 'method', 'status'],
+    registry=registry,
+)
+
+STATEMENTS = frozenset({'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH'})
+"""Statement kinds told apart in metrics, the rest counted as `OTHER`."""
+
+
+def statement_kind(statement: str) -> str:
+    """
+    Get kind of SQL statement by its first keyword.
+
+    Args:
+        statement (str): SQL statement
+
+    Returns:
+        Kind like `SELECT`, or `OTHER` for pragmas, DDL and others
+    """
+    keyword = statement.lstrip().split(None, 1)[:1]
+    kind = keyword[0].upper() if keyword else ''
+    return kind if kind in STATEMENTS else 'OTHER'
+
+
+instrumented_engines: WeakSet[Engine] = WeakSet()
+"""Engines whose statements are recorded."""
+
+instrumented_pools: WeakSet[Pool] = WeakSet()
+"""Connection pools whose checkouts are recorded."""
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """
+    Record SQL statement and pool checkout metrics of an engine.
+
+    Engines already instrumented are left as they are.
+
+    Args:
+        engine (AsyncEngine): Engine
+        name (str): Engine label like `primary` or `replica-0`
+    """
+    sync_engine = engine.sync_engine
+    if sync_engine in instrumented_engines:
+        return
+    instrumented_engines.add(sync_engine)
+
+    @event.listens_for(sync_engine, 'before_cursor_execute')
+    def start_query(conn, cursor, statement, *_) -> None:
+        conn.info.setdefault('query_started', []).append(perf_counter())
+
+    @event.listens_for(sync_engine, 'after_cursor_execute')
+    def finish_query(conn, cursor, statement, *_) -> None:
+        started = conn.info['query_started'].pop()
+        query_duration.labels(name, statement_kind(statement)).observe(
+            perf_counter() - started
+        )
+
+    @event.listens_for(sync_engine, 'handle_error')
+    def fail_query(context) -> None:
+        if context.connection is None:
+            return
+        started = context.connection.info.get('query_started')
+        if started:
+            started.pop()
+        query_errors.labels(
+            name, statement_kind(context.statement or '')
+        ).inc()
+
+    instrument_pool(engine, name)
+
+    # Disposing an engine replaces its pool
+    @event.listens_for(sync_engine, 'engine_disposed')
+    def replace_pool(_) -> None:
+        instrument_pool(engine, name)
+
+
+def instrument_pool(engine: AsyncEngine, name: str) -> None:
+    """
+    Record checkout metrics of the current connection pool of an engine.
+
+    There is no pool event before a checkout, so the time waiting for
+    a connection is measured around the `connect` method of the pool.
+    Pools already instrumented are left as they are, so their `connect`
+    is wrapped only once.
+
+    Args:
+        engine (AsyncEngine): Engine
+        name (str): Engine label
+    """
+    pool = engine.sync_engine.pool
+    if pool in instrumented_pools:
+        return
+    instrumented_pools.add(pool)
+
+    connect = pool.connect
+
+    def timed_connect():
+        started = perf_counter()
+        try:
+            return connect()
+        finally:
+            pool_checkout_duration.labels(name).observe(
+                perf_counter() - started
+            )
+
+    pool.connect = timed_connect
+    checked_out = pool_checked_out.labels(name)
+    event.listen(pool, 'checkout', lambda *_: checked_out.inc())
+    event.listen(pool, 'checkin', lambda *_: checked_out.dec())
+
+
+class MetricsTransport(httpx.AsyncBaseTransport):
+    """Transport recording response times of an external API."""
+
+    def __init__(
+        self,
+        service: str,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Create MetricsTransport instance.
+
+        Args:
+            service (str): Service label like `quickchart`
+            transport (httpx.AsyncBaseTransport | None): Transport
+                sending the requests, a default HTTP one if omitted
+        """
+        self.service = service
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(
+        self,
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """Send request, recording its response time and status."""
+        status = 'error'
+        started = perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            external_request_duration.labels(
+                self.service, request.method, status
+            ).observe(perf_counter() - started)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
+class MetricsMiddleware:
+    """
+    Record handling time of requests by route template and status.
+
+    Requests matching no route are labelled with the `unmatched` route,
+    so unknown paths do not add series.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Create MetricsMiddleware instance.
+
+        Args:
+            app (ASGIApp): Wrapped application
+        """
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Handle ASGI call."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        status = '500'
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = str(message['status'])
+            await send(message)
+
+        in_flight = requests_in_flight.labels(method)
+        in_flight.inc()
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            route = scope.get('route')
+            request_duration.labels(
+                method,
+                route.path if route is not None else 'unmatched',
+                status,
+            ).observe(perf_counter() - started)
+
+
+router = APIRouter(tags=['Metrics'])
+
+
+@router.get('/metrics', include_in_schema=False)
+async def metrics() -> Response:
+    """Get metrics in Prometheus text format."""
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
@@ -1,24 +1,59 @@
 """API models."""
 
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import Integer, String, ForeignKey, DateTime, func
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Integer,
+    SmallInteger,
+    String,
+    ForeignKey,
+    Date,
+    DateTime,
+    Index,
+    event,
+    func,
+)
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from api.database import Base
+from api.localtime import to_local, utcnow
+
+
+def created_local_date(context: DefaultExecutionContext) -> date:
+    """Get date of the inserted row creation in the analytics timezone."""
+    return to_local(context.get_current_parameters()['created_at']).date()
+
+
+def created_local_hour(context: DefaultExecutionContext) -> int:
+    """Get hour of the inserted row creation in the analytics timezone."""
+    return to_local(context.get_current_parameters()['created_at']).hour
 
 
 class Scream(Base):
     """Scream model."""
 
     __tablename__ = 'screams'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index('ix_screams_user_id_local_date', 'user_id', 'local_date'),
+        Index('ix_screams_local_date', 'local_date'),
+        Index('ix_screams_created_at_id', 'created_at', 'id'),
+        {'extend_existing': True},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer)
     text: Mapped[str] = mapped_column(String)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=utcnow, server_default=func.now()
+    )
+    local_date: Mapped[date | None] = mapped_column(
+        Date, default=created_local_date
+    )
+    local_hour: Mapped[int | None] = mapped_column(
+        SmallInteger, default=created_local_hour
     )
 
     reactions: Mapped[list['Reaction']] = relationship(
@@ -29,11 +64,59 @@ class Scream(Base):
     )
 
 
+SCREAMS_SEARCH_DDL = {
+    'sqlite': [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS screams_fts USING fts5("
+        "text, content='screams', content_rowid='id')",
+        "CREATE TRIGGER IF NOT EXISTS screams_fts_insert "
+        "AFTER INSERT ON screams BEGIN "
+        "INSERT INTO screams_fts (rowid, text) VALUES (new.id, new.text); "
+        "END",
+        "CREATE TRIGGER IF NOT EXISTS screams_fts_delete "
+        "AFTER DELETE ON screams BEGIN "
+        "INSERT INTO screams_fts (screams_fts, rowid, text) "
+        "VALUES ('delete', old.id, old.text); "
+        "END",
+        "CREATE TRIGGER IF NOT EXISTS screams_fts_update "
+        "AFTER UPDATE OF text ON screams BEGIN "
+        "INSERT INTO screams_fts (screams_fts, rowid, text) "
+        "VALUES ('delete', old.id, old.text); "
+        "INSERT INTO screams_fts (rowid, text) VALUES (new.id, new.text); "
+        "END",
+    ],
+    'postgresql': [
+        "CREATE INDEX IF NOT EXISTS ix_screams_text_search ON screams "
+        "USING gin (to_tsvector('simple'::regconfig, text))",
+    ],
+}
+"""Statements creating the full-text search index of screams per dialect.
+
+SQLite uses an FTS5 external-content table kept in sync by triggers,
+PostgreSQL a GIN index on the text `tsvector`.
+"""
+
+for dialect, statements in SCREAMS_SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(
+            Scream.__table__,
+            'after_create',
+            DDL(statement).execute_if(dialect=dialect),
+        )
+event.listen(
+    Scream.__table__,
+    'after_drop',
+    DDL('DROP TABLE IF EXISTS screams_fts').execute_if(dialect='sqlite'),
+)
+
+
 class Reaction(Base):
     """Reaction model."""
 
     __tablename__ = 'reactions'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index('ix_reactions_scream_id', 'scream_id'),
+        {'extend_existing': True},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer)
@@ -41,10 +124,79 @@ class Reaction(Base):
     reaction: Mapped[str] = mapped_column(String)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utcnow,
         server_default=func.now(),
     )
+    local_date: Mapped[date | None] = mapped_column(
+        Date, default=created_local_date
+    )
+    local_hour: Mapped[int | None] = mapped_column(
+        SmallInteger, default=created_local_hour
+    )
 
     scream: Mapped['Scream'] = relationship(
         'Scream',
         back_populates='reactions',
     )
+
+
+class Subscriber(Base):
+    """Subscriber model."""
+
+    __tablename__ = 'subscribers'
+    __table_args__ = {'extend_existing': True}
+
+    chat_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+
+
+class ArchivedScream(Base):
+    """Scream moved from the live tables to the archive."""
+
+    __tablename__ = 'archived_screams'
+    __table_args__ = (
+        Index(
+            'ix_archived_screams_user_id_local_date', 'user_id', 'local_date'
+        ),
+        Index('ix_archived_screams_month_votes', 'month', 'votes'),
+        {'extend_existing': True},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer)
+    text: Mapped[str] = mapped_column(String)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    local_date: Mapped[date | None] = mapped_column(Date)
+    month: Mapped[int] = mapped_column(Integer)
+    votes: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class ArchivedReactionCount(Base):
+    """Count of a reaction to an archived scream."""
+
+    __tablename__ = 'archived_reaction_counts'
+    __table_args__ = {'extend_existing': True}
+
+    scream_id: Mapped[int] = mapped_column(
+        ForeignKey('archived_screams.id'), primary_key=True
+    )
+    reaction: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer)
+
+
+class ScreamPartition(Base):
+    """Monthly partition of screams moved to the archive."""
+
+    __tablename__ = 'scream_partitions'
+    __table_args__ = {'extend_existing': True}
+
+    month: Mapped[int] = mapped_column(Integer, primary_key=True)
+    screams: Mapped[int] = mapped_column(Integer, default=0)
+    reactions: Mapped[int] = mapped_column(Integer, default=0)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
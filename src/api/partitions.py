@@ -0,0 +1,219 @@
+"""Monthly partitions of screams.
+
+Screams are partitioned by the month of their `local_date`, the date
+in the analytics timezone that period queries filter on, keyed like
+`202405`. Recent months live in the `screams` and `reactions`
+tables. Old months are moved by `api.tools.archive` to
+`archived_screams`, with their reactions collapsed into counts, and
+recorded in `scream_partitions`.
+"""
+
+from datetime import date, datetime
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import FromClause, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api import models
+from api.localtime import to_local
+
+
+class PartitionRoute(NamedTuple):
+    """Partitions a query reads."""
+
+    live: bool = True
+    """Whether the live tables are read."""
+
+    archived: tuple[int, ...] = ()
+    """Archived months read."""
+
+
+LIVE = PartitionRoute()
+"""Route reading only the live tables."""
+
+
+def month_key(moment: date) -> int:
+    """
+    Get key of the month of a date in the analytics timezone.
+
+    Args:
+        moment (date): Local date or datetime, aware datetimes are
+            converted to the analytics timezone
+
+    Returns:
+        Month key like `202405`
+    """
+    if isinstance(moment, datetime) and moment.tzinfo is not None:
+        moment = to_local(moment)
+    return moment.year * 100 + moment.month
+
+
+def add_months(month: int, months: int) -> int:
+    """
+    Get key of the month a number of months after a month.
+
+    Args:
+        month (int): Month key
+        months (int): Number of months, negative ones go back
+
+    Returns:
+        Month key
+    """
+    year, month = divmod(month, 100)
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    return year * 100 + month + 1
+
+
+def month_start(month: int) -> date:
+    """
+    Get first day of a month.
+
+    Args:
+        month (int): Month key
+
+    Returns:
+        Local date of the month start
+    """
+    return date(month // 100, month % 100, 1)
+
+
+def months_between(start: date, end: date) -> list[int]:
+    """
+    Get months overlapping a time range.
+
+    Args:
+        start (date): Range start
+        end (date): Range end
+
+    Returns:
+        Month keys in ascending order
+    """
+    months = []
+    month, last = month_key(start), month_key(end)
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+
+    return months
+
+
+def route_period(
+    archived: Iterable[int],
+    start: date,
+    end: date,
+) -> PartitionRoute:
+    """
+    Route query of a time range to the partitions holding it.
+
+    The live tables are skipped when every month of the range is
+    archived.
+
+    Args:
+        archived (Iterable[int]): Archived month keys
+        start (date): Range start
+        end (date): Range end
+
+    Returns:
+        Partition route
+    """
+    months = months_between(start, end)
+    archived = set(archived)
+    archived_months = tuple(month for month in months if month in archived)
+
+    return PartitionRoute(
+        live=len(archived_months) < len(months),
+        archived=archived_months,
+    )
+
+
+async def get_archived_months(session: AsyncSession) -> list[int]:
+    """
+    Get archived months.
+
+    Args:
+        session (AsyncSession): Session
+
+    Returns:
+        Month keys in ascending order
+    """
+    result = await session.execute(
+        select(models.ScreamPartition.month).order_by(
+            models.ScreamPartition.month
+        )
+    )
+    return list(result.scalars())
+
+
+def select_screams(route: PartitionRoute = LIVE) -> FromClause:
+    """
+    Build source of screams in the partitions of a route.
+
+    Args:
+        route (PartitionRoute): Partition route
+
+    Returns:
+        Screams table or subquery with its `id`, `user_id`, `text`,
+        `created_at` and `local_date` columns
+    """
+    live = models.Scream.__table__
+    if not route.archived:
+        return live
+
+    archived = models.ArchivedScream.__table__
+    queries = [
+        select(
+            archived.c.id,
+            archived.c.user_id,
+            archived.c.text,
+            archived.c.created_at,
+            archived.c.local_date,
+        ).where(archived.c.month.in_(route.archived))
+    ]
+    if route.live:
+        queries.append(
+            select(
+                live.c.id,
+                live.c.user_id,
+                live.c.text,
+                live.c.created_at,
+                live.c.local_date,
+            )
+        )
+
+    return union_all(*queries).subquery('partitioned_screams')
+
+
+def select_reactions(route: PartitionRoute = LIVE) -> FromClause:
+    """
+    Build source of reaction counts in the partitions of a route.
+
+    Live reactions count one each. Join the source with screams of the
+    same route to restrict it to the routed months.
+
+    Args:
+        route (PartitionRoute): Partition route
+
+    Returns:
+        Subquery with `scream_id`, `reaction` and `count` columns
+    """
+    queries = []
+    if route.live:
+        queries.append(
+            select(
+                models.Reaction.scream_id,
+                models.Reaction.reaction,
+                literal(1).label('count'),
+            )
+        )
+    if route.archived:
+        queries.append(
+            select(
+                models.ArchivedReactionCount.scream_id,
+                models.ArchivedReactionCount.reaction,
+                models.ArchivedReactionCount.count,
+            )
+        )
+
+    if len(queries) == 1:
+        return queries[0].subquery('partitioned_reactions')
+    return union_all(*queries).subquery('partitioned_reactions')
@@ -0,0 +1,264 @@
+"""Per-request SQL query profiling.
+
+`profile_engine` makes an engine record every statement it executes into
+the `QueryProfile` of the current context, opened by `profile_queries`.
+`QueryProfilerMiddleware` opens one per request and logs the statements
+of requests that were slow or ran the same statement many times, the
+usual sign of N+1 queries. Statements run by background tasks, like
+group commits and reaction buffer flushes, belong to no request.
+"""
+
+import logging
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+class StatementStats:
+    """Executions of a statement within a profile."""
+
+    def __init__(self):
+        """Create StatementStats instance."""
+        self.count = 0
+        self.seconds = 0.0
+
+
+class QueryProfile:
+    """Statements executed within a profiling context."""
+
+    def __init__(self):
+        """Create QueryProfile instance."""
+        self.statements: dict[str, StatementStats] = {}
+
+    @property
+    def count(self) -> int:
+        """Number of executed statements."""
+        return sum(stats.count for stats in self.statements.values())
+
+    @property
+    def seconds(self) -> float:
+        """Seconds spent executing statements."""
+        return sum(stats.seconds for stats in self.statements.values())
+
+    def record(self, statement: str, seconds: float) -> None:
+        """
+        Record execution of a statement.
+
+        Args:
+            statement (str): SQL statement with parameter placeholders
+            seconds (float): Execution time
+        """
+        key = _WHITESPACE.sub(' ', statement).strip()
+        stats = self.statements.get(key)
+        if stats is None:
+            stats = self.statements[key] = StatementStats()
+        stats.count += 1
+        stats.seconds += seconds
+
+    def duplicates(self, threshold: int = 2) -> dict[str, StatementStats]:
+        """
+        Get statements executed repeatedly.
+
+        Args:
+            threshold (int): Minimal number of executions
+
+        Returns:
+            Stats of statements executed at least `threshold` times
+        """
+        return {
+            statement: stats
+            for statement, stats in self.statements.items()
+            if stats.count >= threshold
+        }
+
+    def report(self, limit: int = 10, width: int = 160) -> str:
+        """
+        Describe the statements taking most time.
+
+        Args:
+            limit (int): Maximal number of described statements
+            width (int): Length statements are shortened to
+
+        Returns:
+            Line per statement with its executions and total time
+        """
+        slowest = sorted(
+            self.statements.items(),
+            key=lambda item: item[1].seconds,
+            reverse=True,
+        )
+        lines = [
+            f'{stats.count:>5}x {stats.seconds * 1000:>9.2f} ms  '
+            + (
+                statement
+                if len(statement) <= width
+                else statement[: width - 3] + '...'
+            )
+            for statement, stats in slowest[:limit]
+        ]
+        if len(slowest) > limit:
+            lines.append(f'and {len(slowest) - limit} more statements')
+        return '\n'.join(lines)
+
+
+current_profile: ContextVar[QueryProfile | None] = ContextVar(
+    'current_profile', default=None
+)
+"""Profile recording statements of the current context."""
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    """
+    Record statements of profiled engines executed within the context.
+
+    Yields:
+        Profile filled as statements execute
+    """
+    profile = QueryProfile()
+    token = current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        current_profile.reset(token)
+
+
+def _start_statement(conn, cursor, statement, *_) -> None:
+    if current_profile.get() is not None:
+        conn.info.setdefault('profile_started', []).append(perf_counter())
+
+
+def _finish_statement(conn, cursor, statement, *_) -> None:
+    profile = current_profile.get()
+    started = conn.info.get('profile_started')
+    if profile is not None and started:
+        profile.record(statement, perf_counter() - started.pop())
+
+
+def _fail_statement(context) -> None:
+    if context.connection is None:
+        return
+    profile = current_profile.get()
+    started = context.connection.info.get('profile_started')
+    if profile is not None and started:
+        profile.record(context.statement or '', perf_counter() - started.pop())
+
+
+def profile_engine(engine: AsyncEngine) -> None:
+    """
+    Record statements of an engine into the current profile.
+
+    Engines already profiled are left as they are.
+
+    Args:
+        engine (AsyncEngine): Engine
+    """
+    sync_engine = engine.sync_engine
+    for name, listener in (
+        ('before_cursor_execute', _start_statement),
+        ('after_cursor_execute', _finish_statement),
+        ('handle_error', _fail_statement),
+    ):
+        if not event.contains(sync_engine, name, listener):
+            event.listen(sync_engine, name, listener)
+
+
+class QueryProfilerMiddleware:
+    """
+    Profile statements of every request and log the suspicious ones.
+
+    A request is logged with its statements when it took at least
+    `slow_ms` milliseconds or ran a statement `duplicate_threshold` times.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        slow_ms: float = 500,
+        duplicate_threshold: int = 5,
+    ):
+        """
+        Create QueryProfilerMiddleware instance.
+
+        Args:
+            app (ASGIApp): Wrapped application
+            slow_ms (float): Request duration logged as slow
+            duplicate_threshold (int): Executions of a statement within
+                a request logged as probable N+1 queries
+        """
+        self.app = app
+        self.slow_ms = slow_ms
+        self.duplicate_threshold = duplicate_threshold
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Handle ASGI call."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        started = perf_counter()
+        with profile_queries() as profile:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                self.log(scope, status, perf_counter() - started, profile)
+
+    def log(
+        self,
+        scope: Scope,
+        status: int,
+        seconds: float,
+        profile: QueryProfile,
+    ) -> None:
+        """
+        Log statements of a request if it was slow or repeated statements.
+
+        Args:
+            scope (Scope): Request scope
+            status (int): Response status
+            seconds (float): Request duration
+            profile (QueryProfile): Statements of the request
+        """
+        duplicates = profile.duplicates(self.duplicate_threshold)
+        if seconds * 1000 < self.slow_ms and not duplicates:
+            return
+
+        logger.warning(
+            '%s %s %d took %.1f ms, %d queries in %.1f ms%s\n%s',
+            scope['method'],
+            scope['path'],
+            status,
+            seconds * 1000,
+            profile.count,
+            profile.seconds * 1000,
+            (
+                f', {len(duplicates)} statements repeated at least '
+                f'{self.duplicate_threshold} times (N+1?)'
+                if duplicates
+                else ''
+            ),
+            profile.report(),
+        )
@@ -0,0 +1,125 @@
+"""Read replicas."""
+
+from collections import OrderedDict
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from itertools import count
+from time import monotonic
+from typing import AsyncIterator, Callable, Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ReadPolicy = Literal['round-robin', 'least-busy']
+"""Way of choosing a replica for a read."""
+
+
+class ReadReplicas:
+    """
+    Chooser of database replicas serving reads.
+
+    With `round-robin` policy replicas take turns. With `least-busy`
+    the replica with the fewest open sessions is chosen, taking turns
+    among equally busy ones.
+    """
+
+    def __init__(
+        self,
+        session_factories: list[
+            Callable[[], AbstractAsyncContextManager[AsyncSession]]
+        ],
+        policy: ReadPolicy = 'round-robin',
+    ):
+        """
+        Initialize the ReadReplicas.
+
+        Args:
+            session_factories (list[Callable]): Session factory of each
+                replica
+            policy (ReadPolicy): Way of choosing a replica
+        """
+        self.session_factories = session_factories
+        self.policy = policy
+        self.busy = [0] * len(session_factories)
+        self._turns = count()
+
+    def choose(self) -> int:
+        """
+        Choose replica for the next read.
+
+        Returns:
+            Index of the replica
+        """
+        turn = next(self._turns)
+        if self.policy == 'round-robin':
+            return turn % len(self.busy)
+
+        least = min(self.busy)
+        idle = [i for i, busy in enumerate(self.busy) if busy == least]
+        return idle[turn % len(idle)]
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Open session on the chosen replica.
+
+        Yields:
+            Read session
+        """
+        replica = self.choose()
+        self.busy[replica] += 1
+        try:
+            async with self.session_factories[replica]() as session:
+                yield session
+        finally:
+            self.busy[replica] -= 1
+
+
+class RecentWriters:
+    """
+    Users who wrote recently and should read their own writes.
+
+    Replicas may lag behind the primary database, so reads of such users
+    go to the primary for `window` seconds after their last write.
+    """
+
+    def __init__(self, window: float = 5.0, max_users: int = 100000):
+        """
+        Initialize the RecentWriters.
+
+        Args:
+            window (float): Seconds reads stick to the primary
+            max_users (int): Number of remembered users
+        """
+        self.window = window
+        self.max_users = max_users
+        self._until: OrderedDict[str, float] = OrderedDict()
+
+    def mark(self, user_id: int | str) -> None:
+        """
+        Remember write of user.
+
+        Args:
+            user_id (int | str): User ID
+        """
+        now = monotonic()
+        key = str(user_id)
+        self._until[key] = now + self.window
+        self._until.move_to_end(key)
+
+        while self._until and (
+            len(self._until) > self.max_users
+            or next(iter(self._until.values())) <= now
+        ):
+            self._until.popitem(last=False)
+
+    def recent(self, user_id: int | str) -> bool:
+        """
+        Check whether user wrote within the window.
+
+        Args:
+            user_id (int | str): User ID
+
+        Returns:
+            True if reads of the user should go to the primary
+        """
+        until = self._until.get(str(user_id))
+        return until is not None and until > monotonic()
@@ -2,13 +2,23 @@
 
 from .routes import router
 from .schemas import Scream
-from .exceptions import ScreamNotFound
-from .service import get_scream, scream_orm2schema
+from .exceptions import InvalidCursor, ScreamNotFound
+from .service import (
+    get_scream,
+    scream_orm2schema,
+    scream_rows2schemas,
+    select_archived_screams_with_reactions,
+    select_screams_with_reactions,
+)
 
 __all__ = [
     'router',
     'Scream',
+    'InvalidCursor',
     'ScreamNotFound',
     'get_scream',
     'scream_orm2schema',
+    'scream_rows2schemas',
+    'select_archived_screams_with_reactions',
+    'select_screams_with_reactions',
 ]
@@ -0,0 +1,318 @@
+"""Write-behind buffering of reactions."""
+
+import asyncio
+import logging
+from collections import Counter, OrderedDict
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import bindparam, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import schemas
+from api import models
+from api.config import settings
+from api.database import write_session
+from .exceptions import ScreamNotFound
+
+logger = logging.getLogger(__name__)
+
+
+class ScreamReactions:
+    """
+    Reactions of a single scream kept in memory.
+
+    Attributes:
+        scream_id (int): Scream ID
+        user_id (int): Scream author ID
+        text (str): Scream text
+        created_at (datetime): Scream creation time
+        reactions (dict[int, str]): Reaction of each reacting user
+        dirty (set[int]): Users whose reaction is not written yet
+    """
+
+    def __init__(
+        self,
+        scream_id: int,
+        user_id: int,
+        text: str,
+        created_at: datetime,
+        reactions: dict[int, str],
+    ):
+        """Initialize the ScreamReactions."""
+        self.scream_id = scream_id
+        self.user_id = user_id
+        self.text = text
+        self.created_at = created_at
+        self.reactions = reactions
+        self.dirty: set[int] = set()
+
+    def counts(self) -> dict[str, int]:
+        """Get number of reactions of each kind."""
+        return dict(Counter(self.reactions.values()))
+
+    def to_schema(self) -> schemas.Scream:
+        """Convert to Scream schema."""
+        return schemas.Scream(
+            scream_id=self.scream_id,
+            user_id=self.user_id,
+            text=self.text,
+            created_at=self.created_at,
+            reactions=self.counts(),
+        )
+
+
+class ReactionBuffer:
+    """
+    Write-behind buffer of reaction toggles.
+
+    Toggles are applied to the in-memory reactions of a scream (loaded
+    from the database on first use) and answered right away. Changed
+    (scream, user) pairs are written in a single transaction every
+    `flush_interval` seconds, or as soon as `max_pending` of them
+    accumulate, and on close.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[
+            [], AbstractAsyncContextManager[AsyncSession]
+        ],
+        flush_interval: float = 0.2,
+        max_pending: int = 1000,
+        max_screams: int = 10000,
+    ):
+        """
+        Initialize the ReactionBuffer.
+
+        Args:
+            session_factory (Callable): Factory of sessions
+                used for loading and flushing
+            flush_interval (float): Seconds between flushes
+            max_pending (int): Number of unwritten reactions triggering
+                an immediate flush
+            max_screams (int): Number of screams kept in memory
+        """
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_screams = max_screams
+        self._screams: OrderedDict[int, ScreamReactions] = OrderedDict()
+        self._loading: dict[int, asyncio.Task] = {}
+        self._pending = 0
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of reactions not written to the database yet."""
+        return self._pending
+
+    def start(self) -> None:
+        """Start flushing periodically."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop flushing periodically and write pending reactions."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        await self.flush()
+
+    async def react(
+        self,
+        scream_id: int,
+        user_id: int,
+        reaction: str,
+    ) -> schemas.Scream:
+        """
+        Toggle user reaction to scream.
+
+        Args:
+            scream_id (int): Scream ID
+            user_id (int): Reacting user ID
+            reaction (str): Reaction text
+
+        Returns:
+            Updated Scream schema
+        """
+        scream = await self._get(scream_id)
+
+        if scream.reactions.get(user_id) == reaction:
+            del scream.reactions[user_id]
+        else:
+            scream.reactions[user_id] = reaction
+        self._mark_dirty(scream, user_id)
+
+        if self.pending >= self.max_pending:
+            await self.flush()
+
+        return scream.to_schema()
+
+    def overlay(self, screams: list[schemas.Scream]) -> list[schemas.Scream]:
+        """
+        Replace reaction counts with buffered ones where known.
+
+        Args:
+            screams (list[Scream]): Screams read from the database
+
+        Returns:
+            The same screams with up-to-date reaction counts
+        """
+        for scream in screams:
+            buffered = self._screams.get(scream.scream_id)
+            if buffered is not None:
+                scream.reactions = buffered.counts()
+        return screams
+
+    def forget(self, scream_id: int) -> None:
+        """
+        Drop buffered reactions of a deleted scream.
+
+        Args:
+            scream_id (int): Scream ID
+        """
+        scream = self._screams.pop(scream_id, None)
+        if scream is not None:
+            self._pending -= len(scream.dirty)
+
+    async def flush(self) -> int:
+        """
+        Write pending reactions in a single transaction.
+
+        Returns:
+            Number of written (scream, user) reaction states
+        """
+        async with self._flush_lock:
+            batch = [
+                (scream, user_id, scream.reactions.get(user_id))
+                for scream in self._screams.values()
+                for user_id in scream.dirty
+            ]
+            if not batch:
+                return 0
+            for scream in self._screams.values():
+                scream.dirty.clear()
+            self._pending = 0
+
+            try:
+                await self._write(batch)
+            except BaseException:
+                for scream, user_id, _ in batch:
+                    if self._screams.get(scream.scream_id) is scream:
+                        self._mark_dirty(scream, user_id)
+                raise
+
+            self._evict()
+            return len(batch)
+
+    def _mark_dirty(self, scream: ScreamReactions, user_id: int) -> None:
+        if user_id not in scream.dirty:
+            scream.dirty.add(user_id)
+            self._pending += 1
+
+    async def _write(
+        self,
+        batch: list[tuple[ScreamReactions, int, str | None]],
+    ) -> None:
+        reactions = models.Reaction.__table__
+
+        async with self.session_factory() as session:
+            await session.execute(
+                reactions.delete().where(
+                    reactions.c.scream_id == bindparam('b_scream_id'),
+                    reactions.c.user_id == bindparam('b_user_id'),
+                ),
+                [
+                    {'b_scream_id': scream.scream_id, 'b_user_id': user_id}
+                    for scream, user_id, _ in batch
+                ],
+            )
+
+            rows = [
+                {
+                    'scream_id': scream.scream_id,
+                    'user_id': user_id,
+                    'reaction': reaction,
+                }
+                for scream, user_id, reaction in batch
+                if reaction is not None
+            ]
+            if rows:
+                await session.execute(insert(reactions), rows)
+
+            await session.commit()
+
+    async def _get(self, scream_id: int) -> ScreamReactions:
+        scream = self._screams.get(scream_id)
+        if scream is not None:
+            self._screams.move_to_end(scream_id)
+            return scream
+
+        task = self._loading.get(scream_id)
+        if task is None:
+            task = self._loading[scream_id] = asyncio.create_task(
+                self._load(scream_id)
+            )
+            task.add_done_callback(
+                lambda _: self._loading.pop(scream_id, None)
+            )
+        return await asyncio.shield(task)
+
+    async def _load(self, scream_id: int) -> ScreamReactions:
+        async with self.session_factory() as session:
+            scream = await session.get(models.Scream, scream_id)
+            if not scream:
+                raise ScreamNotFound()
+
+            loaded = ScreamReactions(
+                scream_id=scream.id,
+                user_id=scream.user_id,
+                text=scream.text,
+                created_at=scream.created_at,
+                reactions={
+                    r.user_id: r.reaction
+                    for r in sorted(scream.reactions, key=lambda r: r.id)
+                },
+            )
+
+        self._screams[scream_id] = loaded
+        if not self._flush_lock.locked():
+            self._evict()
+        return loaded
+
+    def _evict(self) -> None:
+        excess = len(self._screams) - self.max_screams
+        if excess <= 0:
+            return
+
+        clean = [
+            scream_id
+            for scream_id, scream in self._screams.items()
+            if not scream.dirty
+        ]
+        for scream_id in clean[:excess]:
+            del self._screams[scream_id]
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception('Failed to flush reactions')
+
+
+reaction_buffer = (
+    ReactionBuffer(
+        write_session,
+        flush_interval=settings.reaction_writes.flush_interval_ms / 1000,
+        max_pending=settings.reaction_writes.max_pending,
+        max_screams=settings.reaction_writes.max_screams,
+    )
+    if settings.reaction_writes.write_behind
+    else None
+)
+"""Application reaction buffer, `None` unless write-behind is enabled."""
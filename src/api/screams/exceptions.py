@@ -13,3 +13,17 @@ class ScreamNotFound(Exception):
         """
         self.message = message
         super().__init__(message)
+
+
+class InvalidCursor(Exception):
+    """Pagination cursor is malformed."""
+
+    def __init__(self, message: str = 'Invalid cursor'):
+        """
+        Create InvalidCursor instance.
+
+        Args:
+            message (str): Exception message
+        """
+        self.message = message
+        super().__init__(message)
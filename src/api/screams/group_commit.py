@@ -0,0 +1,165 @@
+"""Group commit of scream creation."""
+
+import asyncio
+from contextlib import AbstractAsyncContextManager
+from typing import Callable
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import schemas
+from api import models
+from api.config import settings
+from api.database import write_session
+
+
+async def insert_screams(
+    session: AsyncSession,
+    screams: list[schemas.ScreamCreate],
+) -> list[schemas.Scream]:
+    """
+    Insert screams with a single executemany `INSERT ... RETURNING`.
+
+    The transaction is left open for the caller to commit.
+
+    Args:
+        session (AsyncSession): Session
+        screams (list[ScreamCreate]): ScreamCreate schemas
+
+    Returns:
+        List of created Scream schema in order of `screams`
+    """
+    if not screams:
+        return []
+
+    screams_table = models.Scream.__table__
+    result = await session.execute(
+        insert(screams_table).returning(
+            screams_table.c.id,
+            screams_table.c.user_id,
+            screams_table.c.text,
+            screams_table.c.created_at,
+            sort_by_parameter_order=True,
+        ),
+        [scream.model_dump() for scream in screams],
+    )
+
+    return [
+        schemas.Scream(
+            scream_id=row.id,
+            user_id=row.user_id,
+            text=row.text,
+            created_at=row.created_at,
+            reactions={},
+        )
+        for row in result
+    ]
+
+
+class GroupCommit:
+    """
+    Creator of screams sharing transactions between concurrent requests.
+
+    The first scream to arrive opens a batch which is inserted and
+    committed in one transaction after `window` seconds, or as soon as
+    it holds `max_batch` screams. Every caller waits for the commit of
+    its batch, so a failed commit fails all screams of the batch.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[
+            [], AbstractAsyncContextManager[AsyncSession]
+        ],
+        window: float = 0.005,
+        max_batch: int = 100,
+    ):
+        """
+        Initialize the GroupCommit.
+
+        Args:
+            session_factory (Callable): Factory of sessions
+                used for committing batches
+            window (float): Seconds a batch waits for more screams
+            max_batch (int): Number of screams committed immediately
+        """
+        self.session_factory = session_factory
+        self.window = window
+        self.max_batch = max_batch
+        self._batch: list[tuple[schemas.ScreamCreate, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._commits: set[asyncio.Task] = set()
+
+    async def create(self, user_id: int, text: str) -> schemas.Scream:
+        """
+        Create scream in the next group commit.
+
+        Args:
+            user_id (int): User ID
+            text (str): Scream text
+
+        Returns:
+            Scream schema once the scream is committed
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append(
+            (schemas.ScreamCreate(user_id=user_id, text=text), future)
+        )
+
+        if len(self._batch) >= self.max_batch:
+            self._commit_batch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._commit_batch)
+
+        return await future
+
+    async def close(self) -> None:
+        """Commit the open batch and wait for running commits."""
+        self._commit_batch()
+        await asyncio.gather(*self._commits, return_exceptions=True)
+
+    def _commit_batch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._commit(batch))
+        self._commits.add(task)
+        task.add_done_callback(self._commits.discard)
+
+    async def _commit(
+        self,
+        batch: list[tuple[schemas.ScreamCreate, asyncio.Future]],
+    ) -> None:
+        try:
+            async with self.session_factory() as session:
+                created = await insert_screams(
+                    session, [scream for scream, _ in batch]
+                )
+                await session.commit()
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), scream in zip(batch, created):
+            if not future.done():
+                future.set_result(scream)
+
+
+scream_committer = (
+    GroupCommit(
+        write_session,
+        window=settings.scream_writes.group_commit_window_ms / 1000,
+        max_batch=settings.scream_writes.group_commit_max_batch,
+    )
+    if settings.scream_writes.group_commit
+    else None
+)
+"""Application scream group commit, `None` unless it is enabled."""
@@ -1,10 +1,11 @@
 """`screams` routes."""
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Body, Depends, Path, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import schemas, service
-from ..database import get_async_session
+from ..config import settings
+from ..database import get_read_session, get_write_session, recent_writers
 
 router = APIRouter(tags=['Screams'], prefix='/screams')
 
@@ -16,11 +17,13 @@ router = APIRouter(tags=['Screams'], prefix='/screams')
 async def get_screams(
     page: int = Query(..., title='Page'),
     limit: int = Query(..., title='Limit'),
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """
     Get specified page of scream list.
 
+    Only live screams are listed, archived ones are left out.
+
     Args:
         page (int): Page number
         limit (int): Number of elements per page
@@ -35,7 +38,7 @@ async def get_screams(
 )
 async def create_scream(
     scream: schemas.ScreamCreate,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_write_session),
 ):
     """
     Create Scream.
@@ -44,7 +47,56 @@ async def create_scream(
         scream (ScreamCreate): ScreamCreate schema
         session (AsyncSession): Session
     """
-    return await service.create_scream(session, scream.user_id, scream.text)
+    created = await service.create_scream(
+        session, scream.user_id, scream.text
+    )
+    recent_writers.mark(scream.user_id)
+    return created
+
+
+@router.post(
+    '/bulk',
+    response_model=list[schemas.Scream],
+)
+async def create_screams(
+    screams: list[schemas.ScreamCreate] = Body(
+        ..., min_length=1, max_length=settings.scream_writes.bulk_max
+    ),
+    session: AsyncSession = Depends(get_write_session),
+):
+    """
+    Create multiple screams at once.
+
+    Args:
+        screams (list[ScreamCreate]): ScreamCreate schemas
+        session (AsyncSession): Session
+    """
+    created = await service.create_screams(session, screams)
+    for scream in screams:
+        recent_writers.mark(scream.user_id)
+    return created
+
+
+@router.get(
+    '/search',
+    response_model=schemas.ScreamSearchPage,
+)
+async def search_screams(
+    q: str = Query(..., title='Query', min_length=1, max_length=256),
+    limit: int = Query(20, title='Limit', ge=1, le=100),
+    cursor: str | None = Query(None, title='Cursor'),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Search screams containing every word of query, best matching first.
+
+    Args:
+        q (str): Search query
+        limit (int): Number of screams per page
+        cursor (str | None): `next_cursor` of the previous page
+        session (AsyncSession): Session
+    """
+    return await service.search_screams(session, q, limit, cursor)
 
 
 @router.get(
@@ -53,16 +105,16 @@ async def create_scream(
 )
 async def get_scream(
     scream_id: int = Path(..., title='Scream ID'),
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
-    """Get scream from scream ID."""
+    """Get scream from scream ID, live or archived."""
     return await service.get_scream(session, scream_id)
 
 
 @router.delete('/{scream_id}')
 async def delete_scream(
     scream_id: int = Path(..., title='Scream ID'),
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_write_session),
 ):
     """Delete scream with specified ID."""
     await service.delete_scream(session, scream_id)
@@ -74,12 +126,14 @@ async def delete_scream(
 )
 async def react_on_scream(
     reaction: schemas.ReactionCreate,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_write_session),
 ):
-    """React on scream."""
-    return await service.react_on_scream(
+    """React on scream, archived screams are not found."""
+    updated = await service.react_on_scream(
         session,
         reaction.scream_id,
         reaction.user_id,
         reaction.reaction,
     )
+    recent_writers.mark(reaction.user_id)
+    return updated
@@ -28,3 +28,10 @@ class ReactionCreate(BaseModel):
     scream_id: int = Field(...)
     user_id: int = Field(...)
     reaction: str = Field(...)
+
+
+class ScreamSearchPage(BaseModel):
+    """Page of scream search results, best matching first."""
+
+    screams: list[Scream] = Field(...)
+    next_cursor: str | None = Field(None)
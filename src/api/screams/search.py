@@ -0,0 +1,152 @@
+"""Full-text search of screams.
+
+SQLite matches the FTS5 `screams_fts` table and ranks by `bm25`,
+PostgreSQL matches the `tsvector` of the text with `ts_rank_cd`. Both
+rank with a score where lower is better, so pages are read by the
+`(score, id)` keyset of the last result.
+"""
+
+import base64
+import binascii
+import re
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+
+from api import models
+from .exceptions import InvalidCursor
+
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+"""PostgreSQL text search configuration, the one of the GIN index."""
+
+screams_fts = table('screams_fts', column('rowid'))
+"""FTS5 table of scream texts, see `models.SCREAMS_SEARCH_DDL`."""
+
+TERM = re.compile(r'\w+')
+"""Search term."""
+
+
+def search_terms(query: str) -> list[str]:
+    """
+    Split search query into terms.
+
+    Args:
+        query (str): Search query
+
+    Returns:
+        List of terms, every one of them must match
+    """
+    return TERM.findall(query)
+
+
+def encode_cursor(score: float, scream_id: int) -> str:
+    """
+    Encode keyset of a search result as a cursor.
+
+    Args:
+        score (float): Result score
+        scream_id (int): Result scream ID
+
+    Returns:
+        Opaque cursor
+    """
+    keyset = f'{score!r}:{scream_id}'.encode()
+    return base64.urlsafe_b64encode(keyset).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    """
+    Decode keyset of a search result from a cursor.
+
+    Args:
+        cursor (str): Cursor of `encode_cursor`
+
+    Returns:
+        Result score and scream ID
+
+    Raises:
+        InvalidCursor: If cursor is malformed
+    """
+    try:
+        score, scream_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split(':')
+        )
+        return float(score), int(scream_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise InvalidCursor()
+
+
+def select_search_hits(
+    terms: list[str],
+    limit: int,
+    after: tuple[float, int] | None = None,
+    dialect: str = 'sqlite',
+    candidates: int = 5000,
+) -> Select:
+    """
+    Build query of a page of scream IDs matching all terms, best first.
+
+    Only the `candidates` newest matches are ranked, which bounds the
+    cost of terms found in most screams.
+
+    Args:
+        terms (list[str]): Search terms
+        limit (int): Number of hits
+        after (tuple[float, int] | None): Keyset of the previous page end
+        dialect (str): Database dialect name
+        candidates (int): Number of newest matches ranked
+
+    Returns:
+        Query selecting `id` and `score` of the hits
+    """
+    if dialect == 'postgresql':
+        screams = models.Scream.__table__
+        vector = func.to_tsvector(SEARCH_CONFIG, screams.c.text)
+        query = func.plainto_tsquery(SEARCH_CONFIG, ' '.join(terms))
+        matches = (
+            select(screams.c.id, screams.c.text)
+            .where(vector.bool_op('@@')(query))
+            .order_by(screams.c.id.desc())
+            .limit(candidates)
+            .subquery()
+        )
+        score: ColumnElement = -func.ts_rank_cd(
+            func.to_tsvector(SEARCH_CONFIG, matches.c.text), query
+        )
+    else:
+        matches = (
+            select(
+                screams_fts.c.rowid.label('id'),
+                func.bm25(literal_column('screams_fts')).label('score'),
+            )
+            .where(
+                literal_column('screams_fts').match(
+                    ' '.join(f'"{term}"' for term in terms)
+                )
+            )
+            .order_by(screams_fts.c.rowid.desc())
+            .limit(candidates)
+            .subquery()
+        )
+        score = matches.c.score
+
+    hits = select(matches.c.id, score.label('score'))
+    if after is not None:
+        after_score, after_id = after
+        hits = hits.where(
+            or_(
+                score > after_score,
+                and_(score == after_score, matches.c.id > after_id),
+            )
+        )
+
+    return hits.order_by(score, matches.c.id).limit(limit)
@@ -1,12 +1,24 @@
 """Utility functions for scream manipulation."""
 
 from collections import defaultdict
+from typing import Iterable
 
-from sqlalchemy import select
+from sqlalchemy import FromClause, Row, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import schemas
 from api import models
+from api.config import settings
+from api.database import writes
+from api.events import bus
+from .buffer import reaction_buffer
+from .group_commit import insert_screams, scream_committer
+from .search import (
+    decode_cursor,
+    encode_cursor,
+    search_terms,
+    select_search_hits,
+)
 from .exceptions import ScreamNotFound
 
 
@@ -38,6 +50,115 @@ def scream_orm2schema(scream: models.Scream) -> schemas.Scream:
     )
 
 
+def select_screams_with_reactions(screams: FromClause) -> Select:
+    """
+    Build a Core SELECT of scream columns with aggregated reaction counts.
+
+    Reactions are grouped per scream and reaction kind, so each resulting
+    row holds scream columns plus one reaction with its count (or `None`
+    for screams without reactions). No ORM entities are hydrated.
+
+    Args:
+        screams (FromClause): Screams table or subquery with its columns
+
+    Returns:
+        SELECT statement to be narrowed and ordered by the caller
+    """
+    return (
+        select(
+            screams.c.id,
+            screams.c.user_id,
+            screams.c.text,
+            screams.c.created_at,
+            models.Reaction.reaction,
+            func.count(models.Reaction.id).label('count'),
+        )
+        .select_from(screams)
+        .outerjoin(
+            models.Reaction,
+            models.Reaction.scream_id == screams.c.id,
+        )
+        .group_by(
+            screams.c.id,
+            screams.c.user_id,
+            screams.c.text,
+            screams.c.created_at,
+            models.Reaction.reaction,
+        )
+    )
+
+
+def select_archived_screams_with_reactions() -> Select:
+    """
+    Build a Core SELECT of archived screams with their reaction counts.
+
+    Rows have the shape of `select_screams_with_reactions` rows, so
+    `scream_rows2schemas` converts them.
+
+    Returns:
+        SELECT statement to be narrowed and ordered by the caller
+    """
+    return select(
+        models.ArchivedScream.id,
+        models.ArchivedScream.user_id,
+        models.ArchivedScream.text,
+        models.ArchivedScream.created_at,
+        models.ArchivedReactionCount.reaction,
+        models.ArchivedReactionCount.count,
+    ).outerjoin(
+        models.ArchivedReactionCount,
+        models.ArchivedReactionCount.scream_id == models.ArchivedScream.id,
+    )
+
+
+def scream_rows2schemas(rows: Iterable[Row]) -> list[schemas.Scream]:
+    """
+    Convert rows of `select_screams_with_reactions` to Scream schemas.
+
+    Args:
+        rows (Iterable[Row]): Rows ordered as screams should be returned
+
+    Returns:
+        List of Scream schema in order of first appearance
+    """
+    screams: dict[int, schemas.Scream] = {}
+    for row in rows:
+        scream = screams.get(row.id)
+        if scream is None:
+            scream = screams[row.id] = schemas.Scream(
+                scream_id=row.id,
+                user_id=row.user_id,
+                text=row.text,
+                created_at=row.created_at,
+                reactions={},
+            )
+        if row.reaction is not None:
+            scream.reactions[row.reaction] = row.count
+
+    return list(screams.values())
+
+
+@writes
+async def save_screams(
+    session: AsyncSession,
+    screams: list[schemas.ScreamCreate],
+) -> list[schemas.Scream]:
+    """
+    Insert screams and commit them.
+
+    Args:
+        session (AsyncSession): Session
+        screams (list[ScreamCreate]): ScreamCreate schemas
+
+    Returns:
+        List of created Scream schema in order of `screams`
+    """
+    created = await insert_screams(session, screams)
+    await session.commit()
+
+    return created
+
+
 async def create_scream(
     session: AsyncSession,
     user_id: int,
@@ -46,6 +167,9 @@ async def create_scream(
     """
     Create an instance of Scream schema.
 
+    With group commit enabled the scream shares a transaction with
+    screams created concurrently.
+
     Args:
         session (AsyncSession): Session
         user_id (int): User ID
@@ -54,19 +178,46 @@ async def create_scream(
     Returns:
         Scream schema
     """
-    scream = models.Scream(user_id=user_id, text=text)
-    session.add(scream)
+    if scream_committer is not None:
+        created = await scream_committer.create(user_id, text)
+    else:
+        [created] = await save_screams(
+            session, [schemas.ScreamCreate(user_id=user_id, text=text)]
+        )
 
-    await session.commit()
-    await session.refresh(scream)
+    bus.publish('scream-created', created.model_dump(mode='json'))
 
-    return scream_orm2schema(scream)
+    return created
+
+
+async def create_screams(
+    session: AsyncSession,
+    screams: list[schemas.ScreamCreate],
+) -> list[schemas.Scream]:
+    """
+    Create screams in a single transaction.
+
+    Args:
+        session (AsyncSession): Session
+        screams (list[ScreamCreate]): ScreamCreate schemas
+
+    Returns:
+        List of created Scream schema in order of `screams`
+    """
+    created = await save_screams(session, screams)
+
+    for scream in created:
+        bus.publish('scream-created', scream.model_dump(mode='json'))
+
+    return created
 
 
 async def get_scream(session: AsyncSession, scream_id: int) -> schemas.Scream:
     """
     Get Scream schema from scream ID.
 
+    Screams missing from the live tables are looked up in the archive.
+
     Args:
         session (AsyncSession): Session
         scream_id (int): Scream ID
@@ -74,11 +225,28 @@ async def get_scream(session: AsyncSession, scream_id: int) -> schemas.Scream:
     Returns:
         Scream schema
     """
-    scream = await session.get(models.Scream, scream_id)
-    if not scream:
+    screams_table = models.Scream.__table__
+    result = await session.execute(
+        select_screams_with_reactions(screams_table).where(
+            screams_table.c.id == scream_id
+        )
+    )
+
+    screams = scream_rows2schemas(result)
+    if not screams:
+        result = await session.execute(
+            select_archived_screams_with_reactions().where(
+                models.ArchivedScream.id == scream_id
+            )
+        )
+        screams = scream_rows2schemas(result)
+    if not screams:
         raise ScreamNotFound()
 
-    return scream_orm2schema(scream)
+    if reaction_buffer is not None:
+        reaction_buffer.overlay(screams)
+
+    return screams[0]
 
 
 async def get_screams(
@@ -89,6 +257,8 @@ async def get_screams(
     """
     Get specified page of scream list.
 
+    Archived screams are not listed.
+
     Args:
         session (AsyncSession): Session
         page (int): Page number
@@ -97,22 +267,89 @@ async def get_screams(
     Returns:
         List of Scream schema
     """
-    screams = (
-        (
-            await session.execute(
-                select(models.Scream)
-                .order_by(models.Scream.created_at.desc())
-                .offset((page - 1) * limit)
-                .limit(limit)
-            )
+    screams_table = models.Scream.__table__
+    page_screams = (
+        select(screams_table)
+        .order_by(
+            screams_table.c.created_at.desc(),
+            screams_table.c.id.desc(),
         )
-        .scalars()
-        .all()
+        .offset((page - 1) * limit)
+        .limit(limit)
+        .subquery()
     )
 
-    return list(map(scream_orm2schema, screams))
+    result = await session.execute(
+        select_screams_with_reactions(page_screams).order_by(
+            page_screams.c.created_at.desc(),
+            page_screams.c.id.desc(),
+        )
+    )
+
+    screams = scream_rows2schemas(result)
+    if reaction_buffer is not None:
+        reaction_buffer.overlay(screams)
+
+    return screams
 
 
+async def search_screams(
+    session: AsyncSession,
+    query: str,
+    limit: int,
+    cursor: str | None = None,
+) -> schemas.ScreamSearchPage:
+    """
+    Search screams containing every word of query, best matching first.
+
+    Args:
+        session (AsyncSession): Session
+        query (str): Search query
+        limit (int): Number of screams per page
+        cursor (str | None): Cursor of the previous page
+
+    Returns:
+        ScreamSearchPage schema
+    """
+    terms = search_terms(query)
+    if not terms:
+        return schemas.ScreamSearchPage(screams=[])
+
+    after = decode_cursor(cursor) if cursor is not None else None
+    hits = select_search_hits(
+        terms,
+        limit,
+        after,
+        session.bind.dialect.name,
+        settings.search.max_candidates,
+    ).subquery()
+
+    screams_table = models.Scream.__table__
+    page_screams = (
+        select(screams_table, hits.c.score)
+        .join(hits, hits.c.id == screams_table.c.id)
+        .subquery()
+    )
+    result = await session.execute(
+        select_screams_with_reactions(page_screams)
+        .add_columns(page_screams.c.score)
+        .group_by(page_screams.c.score)
+        .order_by(page_screams.c.score, page_screams.c.id)
+    )
+
+    rows = result.all()
+    screams = scream_rows2schemas(rows)
+    if reaction_buffer is not None:
+        reaction_buffer.overlay(screams)
+
+    next_cursor = None
+    if len(screams) == limit:
+        next_cursor = encode_cursor(rows[-1].score, rows[-1].id)
+
+    return schemas.ScreamSearchPage(screams=screams, next_cursor=next_cursor)
+
+
+@writes
 async def delete_scream(
     session: AsyncSession,
     scream_id: int,
@@ -128,27 +365,30 @@ async def delete_scream(
     if not scream:
         raise ScreamNotFound()
 
+    if reaction_buffer is not None:
+        reaction_buffer.forget(scream_id)
+
     await session.delete(scream)
     await session.commit()
 
+    bus.publish('scream-deleted', {'scream_id': scream_id})
 
-async def react_on_scream(
+
+@writes
+async def toggle_reaction(
     session: AsyncSession,
     scream_id: int,
     user_id: int,
     reaction: str,
-) -> schemas.Scream:
+) -> None:
     """
-    Add reaction to scream.
+    Toggle user reaction to scream in the database.
 
     Args:
         session (AsyncSession): Session
         scream_id (int): Scream ID
         user_id (int): Reacting user ID
         reaction (str): Reaction text
-
-    Returns:
-        Updated Scream schema
     """
     scream = await session.get(models.Scream, scream_id)
     if not scream:
@@ -171,6 +411,45 @@ async def react_on_scream(
         session.add(reaction)
 
     await session.commit()
-    await session.refresh(scream)
 
-    return scream_orm2schema(scream)
+
+async def react_on_scream(
+    session: AsyncSession,
+    scream_id: int,
+    user_id: int,
+    reaction: str,
+) -> schemas.Scream:
+    """
+    Add reaction to scream.
+
+    Repeating the same reaction removes it, a different one replaces it.
+    Archived screams keep only reaction counts and take no reactions.
+    With write-behind enabled the change is only buffered and written
+    to the database shortly after.
+
+    Args:
+        session (AsyncSession): Session
+        scream_id (int): Scream ID
+        user_id (int): Reacting user ID
+        reaction (str): Reaction text
+
+    Returns:
+        Updated Scream schema
+    """
+    if reaction_buffer is not None:
+        updated = await reaction_buffer.react(scream_id, user_id, reaction)
+        bus.publish(
+            'reaction-changed',
+            {'scream_id': scream_id, 'reactions': updated.reactions},
+        )
+        return updated
+
+    await toggle_reaction(session, scream_id, user_id, reaction)
+
+    updated = await get_scream(session, scream_id)
+    bus.publish(
+        'reaction-changed',
+        {'scream_id': scream_id, 'reactions': updated.reactions},
+    )
+
+    return updated
@@ -0,0 +1,5 @@
+"""`/subscribers` route module."""
+
+from .routes import router
+
+__all__ = ['router']
@@ -0,0 +1,56 @@
+"""`subscribers` routes."""
+
+from fastapi import APIRouter, Depends, Path, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import schemas, service
+from api.database import get_read_session, get_write_session
+
+router = APIRouter(tags=['Subscribers'], prefix='/subscribers')
+
+
+@router.get(
+    '/',
+    response_model=list[int],
+)
+async def get_subscribers(
+    after: int | None = Query(None, title='Last chat ID of previous page'),
+    limit: int = Query(1000, title='Limit', ge=1, le=10000),
+    shard: int = Query(0, title='Shard', ge=0),
+    shards: int = Query(1, title='Number of shards', ge=1),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Get page of subscriber chat IDs.
+
+    Args:
+        after (int | None): Last chat ID of the previous page
+        limit (int): Number of elements per page
+        shard (int): Shard number
+        shards (int): Number of shards
+        session (AsyncSession): Session
+    """
+    return await service.get_subscribers(
+        session, after, limit, shard, shards
+    )
+
+
+@router.put(
+    '/{chat_id}',
+    response_model=schemas.Subscriber,
+)
+async def add_subscriber(
+    chat_id: int = Path(..., title='Chat ID'),
+    session: AsyncSession = Depends(get_write_session),
+):
+    """Add subscriber."""
+    return await service.add_subscriber(session, chat_id)
+
+
+@router.delete('/{chat_id}')
+async def remove_subscriber(
+    chat_id: int = Path(..., title='Chat ID'),
+    session: AsyncSession = Depends(get_write_session),
+):
+    """Remove subscriber."""
+    await service.remove_subscriber(session, chat_id)
@@ -0,0 +1,9 @@
+"""`/subscribers` route schemas."""
+
+from pydantic import BaseModel, Field
+
+
+class Subscriber(BaseModel):
+    """Subscriber object."""
+
+    chat_id: int = Field(...)
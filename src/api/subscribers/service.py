@@ -0,0 +1,106 @@
+"""Utility functions for subscribers manipulation."""
+
+from sqlalchemy import delete, exists, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import schemas
+from api import models
+from api.database import writes
+
+
+@writes
+async def add_subscriber(
+    session: AsyncSession,
+    chat_id: int,
+) -> schemas.Subscriber:
+    """
+    Add subscriber, doing nothing if it already exists.
+
+    Args:
+        session (AsyncSession): Session
+        chat_id (int): Chat ID
+
+    Returns:
+        Subscriber schema
+    """
+    match session.bind.dialect.name:
+        case 'sqlite':
+            stmt = sqlite.insert(models.Subscriber).on_conflict_do_nothing()
+        case 'postgresql':
+            stmt = postgresql.insert(
+                models.Subscriber
+            ).on_conflict_do_nothing()
+        case _:
+            stmt = None
+
+    if stmt is not None:
+        stmt = stmt.values(chat_id=chat_id)
+    else:
+        stmt = insert(models.Subscriber).from_select(
+            ['chat_id'],
+            select(literal(chat_id)).where(
+                ~exists().where(models.Subscriber.chat_id == chat_id)
+            ),
+        )
+
+    await session.execute(stmt)
+    await session.commit()
+
+    return schemas.Subscriber(chat_id=chat_id)
+
+
+@writes
+async def remove_subscriber(session: AsyncSession, chat_id: int) -> None:
+    """
+    Remove subscriber if it exists.
+
+    Args:
+        session (AsyncSession): Session
+        chat_id (int): Chat ID
+    """
+    await session.execute(
+        delete(models.Subscriber).where(
+            models.Subscriber.chat_id == chat_id
+        )
+    )
+    await session.commit()
+
+
+async def get_subscribers(
+    session: AsyncSession,
+    after: int | None,
+    limit: int,
+    shard: int = 0,
+    shards: int = 1,
+) -> list[int]:
+    """
+    Get page of subscriber chat IDs ordered by chat ID.
+
+    Pages are addressed by the last chat ID of the previous page, so
+    reading a page costs the same regardless of its position.
+
+    Args:
+        session (AsyncSession): Session
+        after (int | None): Last chat ID of the previous page
+        limit (int): Number of elements per page
+        shard (int): Shard number in range [0, shards)
+        shards (int): Number of shards subscribers are split into
+
+    Returns:
+        List of chat IDs
+    """
+    query = (
+        select(models.Subscriber.chat_id)
+        .order_by(models.Subscriber.chat_id)
+        .limit(limit)
+    )
+
+    if after is not None:
+        query = query.where(models.Subscriber.chat_id > after)
+    if shards > 1:
+        query = query.where(
+            func.abs(models.Subscriber.chat_id) % shards == shard
+        )
+
+    return list((await session.execute(query)).scalars())
@@ -0,0 +1 @@
+"""API maintenance tools."""
@@ -0,0 +1,217 @@
+"""Archive old monthly partitions of screams.
+
+Every month older than the kept recent ones is moved, one transaction
+per month, from the `screams` and `reactions` tables to
+`archived_screams`. Reactions are collapsed into a count per scream and
+reaction, and the month is recorded in `scream_partitions`, so queries
+of its period read the archive. Archived screams stay readable by ID
+but no longer take reactions.
+
+Usage:
+    python -m api.tools.archive --keep-months 12 --vacuum
+"""
+
+import argparse
+import asyncio
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from api import models
+from api.config import settings
+from api.database import AsyncSessionLocal, create_database, engine
+from api.partitions import (
+    add_months,
+    get_archived_months,
+    month_key,
+    month_start,
+)
+
+
+async def archive_month(
+    session: AsyncSession,
+    month: int,
+) -> models.ScreamPartition:
+    """
+    Move screams of a month to the archive and commit.
+
+    Args:
+        session (AsyncSession): Session
+        month (int): Month key
+
+    Returns:
+        Recorded ScreamPartition model
+    """
+    screams = models.Scream.__table__
+    reactions = models.Reaction.__table__
+    in_month = (screams.c.local_date >= month_start(month)) & (
+        screams.c.local_date < month_start(add_months(month, 1))
+    )
+    month_screams = select(screams.c.id).where(in_month)
+
+    votes = (
+        select(func.count(reactions.c.id))
+        .where(reactions.c.scream_id == screams.c.id)
+        .scalar_subquery()
+    )
+    await session.execute(
+        insert(models.ArchivedScream.__table__).from_select(
+            [
+                'id',
+                'user_id',
+                'text',
+                'created_at',
+                'local_date',
+                'month',
+                'votes',
+            ],
+            select(
+                screams.c.id,
+                screams.c.user_id,
+                screams.c.text,
+                screams.c.created_at,
+                screams.c.local_date,
+                literal(month),
+                votes,
+            ).where(in_month),
+        )
+    )
+    await session.execute(
+        insert(models.ArchivedReactionCount.__table__).from_select(
+            ['scream_id', 'reaction', 'count'],
+            select(
+                reactions.c.scream_id,
+                reactions.c.reaction,
+                func.count(reactions.c.id),
+            )
+            .where(reactions.c.scream_id.in_(month_screams))
+            .group_by(reactions.c.scream_id, reactions.c.reaction),
+        )
+    )
+
+    deleted_reactions = await session.execute(
+        delete(reactions).where(reactions.c.scream_id.in_(month_screams))
+    )
+    deleted_screams = await session.execute(delete(screams).where(in_month))
+
+    partition = models.ScreamPartition(
+        month=month,
+        screams=deleted_screams.rowcount,
+        reactions=deleted_reactions.rowcount,
+    )
+    session.add(partition)
+    await session.commit()
+
+    return partition
+
+
+async def archive(
+    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    keep_months: int,
+    now: datetime | None = None,
+) -> list[models.ScreamPartition]:
+    """
+    Archive every month older than the kept ones.
+
+    Months from the oldest live scream up to the kept ones are archived,
+    the empty ones included, so that their periods skip the live tables.
+
+    Args:
+        session_factory (Callable): Factory of sessions
+        keep_months (int): Number of recent months kept live, the
+            current one included
+        now (datetime | None): Current datetime
+
+    Returns:
+        List of archived ScreamPartition models
+    """
+    now = now or datetime.now(tz=timezone.utc)
+    cutoff = add_months(month_key(now), -max(keep_months - 1, 0))
+
+    async with session_factory() as session:
+        oldest = await session.scalar(
+            select(func.min(models.Scream.local_date))
+        )
+        archived = set(await get_archived_months(session))
+
+    if oldest is None:
+        return []
+
+    partitions = []
+    month = month_key(oldest)
+    while month < cutoff:
+        if month not in archived:
+            async with session_factory() as session:
+                partitions.append(await archive_month(session, month))
+        month = add_months(month, 1)
+
+    return partitions
+
+
+async def vacuum(engine: AsyncEngine) -> None:
+    """
+    Reclaim space freed by archiving.
+
+    Args:
+        engine (AsyncEngine): Engine
+    """
+    statement = {
+        'sqlite': 'VACUUM',
+        'postgresql': 'VACUUM ANALYZE screams, reactions',
+    }.get(engine.dialect.name)
+    if statement is None:
+        return
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level='AUTOCOMMIT')
+        await conn.exec_driver_sql(statement)
+
+
+async def run(keep_months: int, vacuum_after: bool) -> None:
+    """
+    Archive old months of the application database and report them.
+
+    Args:
+        keep_months (int): Number of recent months kept live
+        vacuum_after (bool): Reclaim freed space afterwards
+    """
+    await create_database()
+    partitions = await archive(AsyncSessionLocal, keep_months)
+    for partition in partitions:
+        print(
+            f'{partition.month}: {partition.screams} screams, '
+            f'{partition.reactions} reactions archived'
+        )
+    if not partitions:
+        print('Nothing to archive')
+
+    if vacuum_after and partitions:
+        await vacuum(engine)
+
+    await engine.dispose()
+
+
+def main() -> None:
+    """Run archive tool."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--keep-months',
+        type=int,
+        default=settings.archive.keep_months,
+        help='Number of recent months kept live, the current one included',
+    )
+    parser.add_argument(
+        '--vacuum',
+        action='store_true',
+        help='Reclaim space freed by archiving',
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.keep_months, args.vacuum))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,404 @@
+"""Seed the database with synthetic screams for scale testing.
+
+Screams, their reactions and subscribers are generated in batches and
+bulk inserted, a transaction per batch, so memory stays bounded by the
+batch size however many rows are seeded. Scream IDs continue after the
+existing ones and grow with creation time, like real ones. Users, times
+and reactions follow the distributions of a `SeedPlan`, and the same
+plan always generates the same rows.
+
+Usage:
+    python -m api.tools.seed --screams 10000000 --users 100000 \\
+        --user-exponent 1.1 --days 365 --growth 4 --reactions 2.5 \\
+        --reaction-weights 👍=5 👎=1 ❤️=3 --subscribers 50000
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from time import perf_counter
+from typing import Iterator, NamedTuple
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from api import models
+from api.database import create_database, engine
+
+
+class SeedPlan(NamedTuple):
+    """Amounts and distributions of seeded rows."""
+
+    screams: int
+    """Number of screams."""
+
+    end: datetime
+    """Creation time of the newest scream."""
+
+    days: float = 365
+    """Days the creation times of screams span until `end`."""
+
+    growth: float = 1
+    """Scream rate at `end` relative to the rate at the span start."""
+
+    users: int = 1000
+    """Number of users screaming and reacting."""
+
+    user_exponent: float = 0
+    """Zipf exponent of user activity, 0 for uniform activity."""
+
+    reactions: float = 1
+    """Mean number of reactions to a scream."""
+
+    reaction_weights: tuple[tuple[str, float], ...] = (
+        ('👍', 1),
+        ('👎', 1),
+        ('❤️', 1),
+    )
+    """Reactions and their relative frequencies."""
+
+    reaction_delay: float = 3600
+    """Mean seconds between a scream and a reaction to it."""
+
+    subscribers: int = 0
+    """Number of subscribed chats."""
+
+    words: int = 20000
+    """Number of distinct words of scream texts, Zipf distributed."""
+
+    seed: int = 0
+    """Seed of the random generator."""
+
+
+class SeedBatch(NamedTuple):
+    """Rows inserted in one transaction."""
+
+    screams: list[dict]
+    reactions: list[dict]
+
+
+def vocabulary(size: int, seed: int = 0) -> list[str]:
+    """
+    Generate distinct random words.
+
+    Args:
+        size (int): Number of words
+        seed (int): Seed of the random generator
+
+    Returns:
+        Sorted list of words
+    """
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choices(letters, k=rng.randint(3, 9))))
+    return sorted(words)
+
+
+def zipf_cum_weights(size: int, exponent: float) -> list[float]:
+    """
+    Get cumulative weights of a Zipf distribution over ranks.
+
+    Args:
+        size (int): Number of ranks
+        exponent (float): Zipf exponent, 0 for a uniform distribution
+
+    Returns:
+        Cumulative weights of ranks from the first one
+    """
+    return list(
+        accumulate(1 / rank**exponent for rank in range(1, size + 1))
+    )
+
+
+def growth_quantile(p: float, growth: float) -> float:
+    """
+    Get quantile of a linearly growing distribution on [0, 1].
+
+    Args:
+        p (float): Probability
+        growth (float): Density at 1 relative to the density at 0
+
+    Returns:
+        Point where the cumulative probability reaches `p`
+    """
+    slope = growth - 1
+    if abs(slope) < 1e-9:
+        return p
+    return (math.sqrt(1 + slope * (2 + slope) * p) - 1) / slope
+
+
+def poisson(rng: random.Random, mean: float) -> int:
+    """Draw a Poisson distributed count."""
+    limit, count, product = math.exp(-mean), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def generate(
+    plan: SeedPlan,
+    first_id: int = 1,
+    batch_size: int = 10000,
+) -> Iterator[SeedBatch]:
+    """
+    Generate batches of screams and their reactions.
+
+    Args:
+        plan (SeedPlan): Seed plan
+        first_id (int): ID of the first scream
+        batch_size (int): Number of screams per batch
+
+    Yields:
+        Batches of scream and reaction rows
+    """
+    rng = random.Random(plan.seed)
+    words = vocabulary(plan.words, plan.seed)
+    word_weights = zipf_cum_weights(len(words), 1)
+    user_ids = range(plan.users)
+    user_weights = zipf_cum_weights(plan.users, plan.user_exponent)
+    reactions, reaction_weights = zip(*plan.reaction_weights)
+    reaction_weights = list(accumulate(reaction_weights))
+    span = timedelta(days=plan.days)
+    start = plan.end - span
+
+    for batch_start in range(0, plan.screams, batch_size):
+        batch = SeedBatch([], [])
+        batch_end = min(batch_start + batch_size, plan.screams)
+        for n in range(batch_start, batch_end):
+            scream_id = first_id + n
+            created_at = start + span * growth_quantile(
+                (n + rng.random()) / plan.screams, plan.growth
+            )
+            [user_id] = rng.choices(user_ids, cum_weights=user_weights)
+            batch.screams.append(
+                {
+                    'id': scream_id,
+                    'user_id': user_id,
+                    'text': ' '.join(
+                        rng.choices(
+                            words,
+                            cum_weights=word_weights,
+                            k=rng.randint(3, 20),
+                        )
+                    ),
+                    'created_at': created_at,
+                }
+            )
+
+            count = min(poisson(rng, plan.reactions), plan.users)
+            reacted = set()
+            while len(reacted) < count:
+                [user_id] = rng.choices(user_ids, cum_weights=user_weights)
+                if user_id in reacted:
+                    continue
+                reacted.add(user_id)
+                delay = rng.expovariate(1 / plan.reaction_delay)
+                batch.reactions.append(
+                    {
+                        'user_id': user_id,
+                        'scream_id': scream_id,
+                        'reaction': rng.choices(
+                            reactions, cum_weights=reaction_weights
+                        )[0],
+                        'created_at': min(
+                            created_at + timedelta(seconds=delay), plan.end
+                        ),
+                    }
+                )
+        yield batch
+
+
+async def seed(
+    engine: AsyncEngine,
+    plan: SeedPlan,
+    batch_size: int = 10000,
+    progress: bool = False,
+) -> tuple[int, int]:
+    """
+    Seed database with screams, reactions and subscribers of a plan.
+
+    Args:
+        engine (AsyncEngine): Engine
+        plan (SeedPlan): Seed plan
+        batch_size (int): Number of screams per transaction
+        progress (bool): Report progress to stderr
+
+    Returns:
+        Numbers of seeded screams and reactions
+    """
+    screams = models.Scream.__table__
+    reactions = models.Reaction.__table__
+    subscribers = models.Subscriber.__table__
+
+    async with engine.connect() as conn:
+        last_id = (await conn.scalar(select(func.max(screams.c.id)))) or 0
+        last_chat_id = (
+            await conn.scalar(select(func.max(subscribers.c.chat_id)))
+        ) or 0
+
+    started = perf_counter()
+    screams_count = reactions_count = 0
+    async with engine.connect() as conn:
+        if engine.dialect.name == 'sqlite':
+            await conn.exec_driver_sql('PRAGMA synchronous = OFF')
+
+        for batch in generate(plan, last_id + 1, batch_size):
+            await conn.execute(insert(screams), batch.screams)
+            if batch.reactions:
+                await conn.execute(insert(reactions), batch.reactions)
+            await conn.commit()
+
+            screams_count += len(batch.screams)
+            reactions_count += len(batch.reactions)
+            if progress:
+                rate = screams_count / (perf_counter() - started)
+                print(
+                    f'\r{screams_count}/{plan.screams} screams, '
+                    f'{reactions_count} reactions, {rate:.0f} screams/s',
+                    end='',
+                    file=sys.stderr,
+                )
+
+        for chat_start in range(0, plan.subscribers, batch_size):
+            chat_end = min(chat_start + batch_size, plan.subscribers)
+            await conn.execute(
+                insert(subscribers),
+                [
+                    {'chat_id': last_chat_id + n + 1}
+                    for n in range(chat_start, chat_end)
+                ],
+            )
+            await conn.commit()
+
+        if engine.dialect.name == 'postgresql':
+            await conn.execute(
+                text(
+                    "SELECT setval(pg_get_serial_sequence('screams', 'id'), "
+                    'max(id)) FROM screams'
+                )
+            )
+        await conn.exec_driver_sql('ANALYZE')
+        await conn.commit()
+
+    if progress:
+        print(file=sys.stderr)
+
+    return screams_count, reactions_count
+
+
+def reaction_weight(value: str) -> tuple[str, float]:
+    """Parse reaction weight argument like `👍=5`."""
+    reaction, _, weight = value.rpartition('=')
+    if not reaction:
+        raise argparse.ArgumentTypeError(f'Expected REACTION=WEIGHT: {value}')
+    return reaction, float(weight)
+
+
+async def run(plan: SeedPlan, batch_size: int) -> None:
+    """
+    Seed the application database and report it.
+
+    Args:
+        plan (SeedPlan): Seed plan
+        batch_size (int): Number of screams per transaction
+    """
+    await create_database()
+
+    started = perf_counter()
+    screams, reactions = await seed(engine, plan, batch_size, progress=True)
+    print(
+        f'{screams} screams, {reactions} reactions and {plan.subscribers} '
+        f'subscribers seeded in {perf_counter() - started:.1f} s'
+    )
+
+    await engine.dispose()
+
+
+def main() -> None:
+    """Run seed tool."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--screams', type=int, required=True, help='Number of screams'
+    )
+    parser.add_argument(
+        '--days',
+        type=float,
+        default=SeedPlan._field_defaults['days'],
+        help='Days the screams span until now',
+    )
+    parser.add_argument(
+        '--growth',
+        type=float,
+        default=SeedPlan._field_defaults['growth'],
+        help='Scream rate now relative to the rate at the span start',
+    )
+    parser.add_argument(
+        '--users',
+        type=int,
+        default=SeedPlan._field_defaults['users'],
+        help='Number of users',
+    )
+    parser.add_argument(
+        '--user-exponent',
+        type=float,
+        default=SeedPlan._field_defaults['user_exponent'],
+        help='Zipf exponent of user activity, 0 for uniform activity',
+    )
+    parser.add_argument(
+        '--reactions',
+        type=float,
+        default=SeedPlan._field_defaults['reactions'],
+        help='Mean number of reactions to a scream',
+    )
+    parser.add_argument(
+        '--reaction-weights',
+        type=reaction_weight,
+        nargs='+',
+        default=SeedPlan._field_defaults['reaction_weights'],
+        metavar='REACTION=WEIGHT',
+        help='Reactions and their relative frequencies',
+    )
+    parser.add_argument(
+        '--subscribers',
+        type=int,
+        default=SeedPlan._field_defaults['subscribers'],
+        help='Number of subscribed chats',
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=SeedPlan._field_defaults['seed'],
+        help='Seed of the random generator',
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=10000,
+        help='Number of screams per transaction',
+    )
+    args = parser.parse_args()
+
+    plan = SeedPlan(
+        screams=args.screams,
+        end=datetime.now(tz=timezone.utc),
+        days=args.days,
+        growth=args.growth,
+        users=args.users,
+        user_exponent=args.user_exponent,
+        reactions=args.reactions,
+        reaction_weights=tuple(args.reaction_weights),
+        subscribers=args.subscribers,
+        seed=args.seed,
+    )
+    asyncio.run(run(plan, args.batch_size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Single database writer."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseWriter:
+    """
+    Task running database writes one at a time in order of arrival.
+
+    SQLite allows a single writer, so concurrent write transactions only
+    wait for each other's lock or fail with `database is locked`. Writes
+    are instead queued and run by a single task over its own session,
+    while reads use separate connections.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        """
+        Initialize the DatabaseWriter.
+
+        Args:
+            session_factory (async_sessionmaker): Factory of sessions
+                bound to the write connection
+        """
+        self.session_factory = session_factory
+        self._queue: asyncio.Queue[asyncio.Future] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def queued(self) -> int:
+        """Number of writes waiting for their turn."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start running queued writes."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Run queued writes and stop."""
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Wait for the turn of a write and get the write session.
+
+        The writer is held until the context exits, and changes left
+        uncommitted are rolled back.
+
+        Yields:
+            Write session
+        """
+        self.start()
+        turn = asyncio.get_running_loop().create_future()
+        await self._queue.put(turn)
+
+        try:
+            session, done = await turn
+        except asyncio.CancelledError:
+            if turn.done() and not turn.cancelled():
+                turn.result()[1].set_result(None)
+            raise
+
+        try:
+            yield session
+        finally:
+            done.set_result(None)
+
+    async def run(
+        self,
+        operation: Callable[..., Awaitable[T]],
+        *args,
+        **kwargs,
+    ) -> T:
+        """
+        Run write operation in its turn.
+
+        Args:
+            operation (Callable): Coroutine function taking the write
+                session followed by `args`
+            *args: Operation arguments
+            **kwargs: Operation keyword arguments
+
+        Returns:
+            Operation result
+        """
+        async with self.session() as session:
+            return await operation(session, *args, **kwargs)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            turn = await self._queue.get()
+            try:
+                done = loop.create_future()
+                async with self.session_factory() as session:
+                    if turn.cancelled():
+                        continue
+                    turn.set_result((session, done))
+                    await done
+            except Exception:
+                logger.exception('Failed to close write session')
+            finally:
+                self._queue.task_done()
@@ -11,6 +11,7 @@ import sys
 import logging
 import asyncio
 from datetime import datetime, timedelta
+from typing import AsyncIterator
 
 from aiogram import Bot, Dispatcher, F
 from aiogram.filters import Command, CommandStart
@@ -23,13 +24,29 @@ from aiogram.types import (
     CallbackQuery,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
-    BufferedInputFile,
 )
+from httpx import Limits
 
 from bot.config import settings
+from bot.delivery import (
+    Broadcast,
+    Broadcaster,
+    EditCoalescer,
+    KeyboardPropagator,
+    PhotoCache,
+    RateLimiter,
+    ScreamCopies,
+)
+from bot.delivery.edits import render_keyboard
+from bot.metrics import (
+    HandlerMetricsMiddleware,
+    StatsCollector,
+    TelegramMetricsMiddleware,
+    registry,
+    start_exporter,
+)
 from bot.services.innoscream import InnoScreamAPI, Scream
-
-subscribers = set(settings.bot.admins)
+from bot.webhook import create_app, run_workers, serve
 
 dp = Dispatcher()
 bot = Bot(
@@ -37,7 +54,119 @@ bot = Bot(
     default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN),
 )
 
-innoscream = InnoScreamAPI(base_url=settings.innoscream.base_url)
+innoscream = InnoScreamAPI(
+    base_url=settings.innoscream.base_url,
+    uds=settings.innoscream.uds,
+    timeout=settings.innoscream.timeout,
+    timeouts=settings.innoscream.timeouts,
+    limits=Limits(
+        max_connections=settings.innoscream.max_connections,
+        max_keepalive_connections=settings.innoscream.max_keepalive,
+        keepalive_expiry=settings.innoscream.keepalive_expiry,
+    ),
+    http2=settings.innoscream.http2,
+    retries=settings.innoscream.retries,
+    backoff=settings.innoscream.retry_backoff,
+    failure_threshold=settings.innoscream.breaker_threshold,
+    reset_timeout=settings.innoscream.breaker_reset,
+)
+
+
+def iter_subscribers() -> AsyncIterator[int]:
+    """
+    Stream subscribers served by this bot instance page by page.
+
+    Returns:
+        AsyncIterator[int]: Subscriber chat IDs.
+    """
+    return innoscream.iter_subscribers(
+        page_size=settings.broadcast.page_size,
+        shard=settings.broadcast.shard,
+        shards=settings.broadcast.shards,
+    )
+
+
+async def unsubscribe(chat_id: int) -> None:
+    """
+    Remove a chat from subscribers, e.g. after it blocked the bot.
+
+    Args:
+        chat_id (int): Chat ID to remove.
+    """
+    await innoscream.remove_subscriber(chat_id)
+
+
+def worker_rate(rate: float) -> float:
+    """
+    Share of a bot-wide rate limit spent by this process.
+
+    Every webhook worker has its own rate limiter, so the configured
+    rates are split evenly between workers to keep their total within
+    Telegram limits.
+
+    Args:
+        rate (float): Rate configured for the whole bot.
+
+    Returns:
+        float: Rate for a single worker.
+    """
+    if settings.webhook.enabled:
+        return rate / settings.webhook.workers
+    return rate
+
+
+limiter = RateLimiter(
+    worker_rate(settings.broadcast.rate),
+    worker_rate(settings.broadcast.chat_rate),
+)
+
+broadcaster = Broadcaster(
+    limiter,
+    workers=settings.broadcast.workers,
+    max_retries=settings.broadcast.max_retries,
+    queue_size=settings.broadcast.queue_size,
+    on_blocked=unsubscribe,
+)
+
+editor = EditCoalescer(limiter, delay=settings.broadcast.edit_delay)
+
+
+def edit_reactions_keyboard(
+    chat_id: int,
+    message_id: int,
+    markup: InlineKeyboardMarkup,
+):
+    """
+    Replace reactions keyboard of a delivered scream copy.
+
+    Args:
+        chat_id (int): Chat ID of the copy.
+        message_id (int): Message ID of the copy.
+        markup (InlineKeyboardMarkup): New keyboard.
+    """
+    return bot.edit_message_reply_markup(
+        chat_id=chat_id,
+        message_id=message_id,
+        reply_markup=markup,
+    )
+
+
+copies = ScreamCopies(max_screams=settings.broadcast.tracked_screams)
+
+propagator = KeyboardPropagator(
+    copies,
+    edit_reactions_keyboard,
+    limiter,
+    rate=worker_rate(settings.broadcast.propagation_rate),
+    batch_size=settings.broadcast.propagation_batch,
+    editor=editor,
+)
+
+photos = PhotoCache()
+
+if settings.metrics.enabled:
+    dp.message.middleware(HandlerMetricsMiddleware())
+    dp.callback_query.middleware(HandlerMetricsMiddleware())
 
 
 class ReactionsCallbackFactory(CallbackData, prefix='reactions'):
@@ -57,13 +186,15 @@ async def start(message: Message) -> None:
     Adds the user to the subscriber list and displays usage help.
     """
 
-    subscribers.add(message.from_user.id)
-    await message.reply(
-        '👋 Welcome to the Anonymous Scream Bot!\n'
-        'Send anonymous messages with /scream [text]\n'
-        'Vote on screams using reaction buttons.\n'
-        'Use /stats to see your post reactions.\n'
-        'Use /exit to stop receiving updates.'
+    await asyncio.gather(
+        innoscream.add_subscriber(message.from_user.id),
+        message.reply(
+            '👋 Welcome to the Anonymous Scream Bot!\n'
+            'Send anonymous messages with /scream [text]\n'
+            'Vote on screams using reaction buttons.\n'
+            'Use /stats to see your post reactions.\n'
+            'Use /exit to stop receiving updates.'
+        ),
     )
 
 
@@ -74,10 +205,12 @@ async def exit_bot(message: Message) -> None:
     Removes the user from the subscriber list.
     """
 
-    subscribers.discard(message.chat.id)
-    await message.reply(
-        "👋 You've unsubscribed from updates. "
-        'Use /start to join again anytime.'
+    await asyncio.gather(
+        innoscream.remove_subscriber(message.chat.id),
+        message.reply(
+            "👋 You've unsubscribed from updates. "
+            'Use /start to join again anytime.'
+        ),
     )
 
 
@@ -131,23 +264,28 @@ def extend_reactions_with_defaults(scream: Scream) -> Scream:
 async def create_scream(message: Message) -> None:
     """
     Handle /scream command.
-    Posts an anonymous message and sends it to all subscribers.
+    Posts an anonymous message and starts broadcasting it to all
+    subscribers in the background.
     """
 
-    subscribers.add(message.from_user.id)
-
     text = message.text.removeprefix('/scream').strip()
     if not text:
-        await message.reply('Usage: /scream [your anonymous message]')
+        await asyncio.gather(
+            innoscream.add_subscriber(message.from_user.id),
+            message.reply('Usage: /scream [your anonymous message]'),
+        )
         return
 
-    scream = await innoscream.create_scream(message.from_user.id, text)
+    _, scream = await asyncio.gather(
+        innoscream.add_subscriber(message.from_user.id),
+        innoscream.create_scream(message.from_user.id, text),
+    )
     extend_reactions_with_defaults(scream)
 
     kb = build_reactions_keyboard(scream)
 
-    for sub in subscribers:
-        await message.bot.send_message(
+    def send_scream(sub: int):
+        return message.bot.send_message(
             chat_id=sub,
             text=f'📢 *Student screams:*\n\n{scream.text}'
             + (
@@ -161,6 +299,17 @@ async def create_scream(message: Message) -> None:
             reply_markup=kb,
         )
 
+    rendered = render_keyboard(kb)
+
+    broadcaster.broadcast(
+        iter_subscribers(),
+        send_scream,
+        on_sent=lambda sub, sent: copies.add(
+            scream.scream_id, (sub, sent.message_id), rendered
+        ),
+        name=f'scream {scream.scream_id}',
+    )
+
 
 @dp.callback_query(ReactionsCallbackFactory.filter())
 async def create_reaction(
@@ -169,7 +318,10 @@ async def create_reaction(
 ) -> None:
     """
     Handle reaction button press.
-    Updates reaction count and refreshes the inline keyboard.
+    Updates reaction count and schedules a refresh of the inline keyboard.
+    Refreshes of the same message are debounced, so a burst of taps ends
+    in a single edit with the latest counts. Copies of the scream sent to
+    other subscribers are refreshed in the background.
     """
 
     scream = await innoscream.react_on_scream(
@@ -179,9 +331,17 @@ async def create_reaction(
     )
     extend_reactions_with_defaults(scream)
 
-    await callback.message.edit_reply_markup(
-        reply_markup=build_reactions_keyboard(scream)
+    message = callback.message
+    key = (message.chat.id, message.message_id)
+    kb = build_reactions_keyboard(scream)
+
+    editor.submit(
+        key,
+        kb,
+        lambda markup: message.edit_reply_markup(reply_markup=markup),
+        current=message.reply_markup,
     )
+    propagator.update(scream.scream_id, kb, applied=key)
 
 
 @dp.message(Command('stats'))
@@ -189,30 +349,32 @@ async def get_stats(message: Message) -> None:
     """Handle /stats command.
 
     Sends the user a summary of their scream statistics,
-    including a reaction graph.
+    including a reaction graph, fetched with a single API request.
+    A graph identical to an already sent one is sent by its `file_id`
+    instead of being uploaded again.
 
     Args:
         message (Message): Incoming message object from the user.
     """
-    stats = await innoscream.get_stats(message.from_user.id)
-    graph = await innoscream.get_graph(message.from_user.id, 'week')
-
-    await message.reply_photo(
-        photo=BufferedInputFile(graph, 'graph.png'),
-        caption=(
-            "📊 Here's your scream statistics\n\n"
-            '*Total number of posts*\n'
-            f'{stats.screams_count}\n\n'
-            '*Top reactions*\n'
+    summary = await innoscream.get_summary(message.from_user.id, 'week')
+    stats = summary.stats
+
+    caption = (
+        "📊 Here's your scream statistics\n\n"
+        '*Total number of posts*\n'
+        f'{stats.screams_count}\n\n'
+        '*Top reactions*\n'
+    ) + '\n'.join(
+        f'{r} {c}'
+        for r, c in sorted(
+            stats.reactions_count.items(),
+            key=lambda r: r[1],
+            reverse=True,
         )
-        + '\n'.join(
-            f'{r} {c}'
-            for r, c in sorted(
-                stats.reactions_count.items(),
-                key=lambda r: r[1],
-                reverse=True,
-            )
-        ),
+    )
+
+    await photos.get(summary.graph.image, 'graph.png').send(
+        lambda photo: message.reply_photo(photo=photo, caption=caption)
     )
 
 
@@ -232,10 +394,40 @@ async def delete(message: Message) -> None:
         return
 
     await innoscream.delete_scream(int(scream_id))
+    copies.forget(int(scream_id))
 
     await message.reply('Scream deleted')
 
 
+def broadcast_top_scream(scream: Scream, meme: bytes) -> Broadcast:
+    """
+    Start broadcasting the top scream meme to all subscribers.
+
+    The meme is uploaded with the first delivery only, the rest of
+    subscribers receive it by `file_id`.
+
+    Args:
+        scream (Scream): Top voted scream.
+        meme (bytes): Meme image generated from the scream.
+
+    Returns:
+        Broadcast: Handle of the started broadcast.
+    """
+    photo = photos.get(meme, 'meme.png')
+
+    return broadcaster.broadcast(
+        iter_subscribers(),
+        lambda sub: photo.send(
+            lambda file: bot.send_photo(
+                chat_id=sub,
+                photo=file,
+                caption=f'🌟 *Top Scream of the Day*\n\n{scream.text}',
+            )
+        ),
+        name=f'top scream {scream.scream_id}',
+    )
+
+
 async def send_daily_top_scream():
     """
     Send the top voted scream of the day to all subscribers.
@@ -256,23 +448,123 @@ async def send_daily_top_scream():
 
         meme = await innoscream.generate_meme(scream.scream_id)
 
-        for sub in subscribers:
-            await bot.send_photo(
-                chat_id=sub,
-                photo=BufferedInputFile(meme, 'meme.png'),
-                caption=f'🌟 *Top Scream of the Day*\n\n{scream.text}',
-            )
+        broadcast_top_scream(scream, meme)
+
+
+@dp.shutdown()
+async def shutdown() -> None:
+    """Stop background delivery workers and log InnoScream API metrics."""
+    await propagator.close()
+    await editor.close()
+    await broadcaster.close()
+
+    for endpoint, stats in innoscream.stats.items():
+        logging.info(
+            '%s: %d requests, %d errors, %d retries, %d rejected, '
+            '%.1f ms mean latency, %.1f ms max latency',
+            endpoint,
+            stats.requests,
+            stats.errors,
+            stats.retries,
+            stats.rejected,
+            stats.latency_mean * 1000,
+            stats.latency_max * 1000,
+        )
 
 
-async def main() -> None:
+async def main(worker: int = 0) -> None:
     """Start the bot.
 
-    Starts the background task for daily top scream and begins polling.
+    The first worker subscribes admins, starts the background task for
+    daily top scream and registers the webhook. Every worker then
+    receives updates through the webhook server if it is enabled,
+    otherwise the bot begins polling.
+
+    Metrics of every worker are served on its own port, counted from
+    the configured one.
+
+    Args:
+        worker (int): Index of the worker process.
     """
-    asyncio.create_task(send_daily_top_scream())
-    await dp.start_polling(bot)
+    if settings.metrics.enabled:
+        bot.session.middleware(TelegramMetricsMiddleware())
+        registry.register(
+            StatsCollector(lambda: broadcaster.stats, lambda: innoscream.stats)
+        )
+        start_exporter(settings.metrics.host, settings.metrics.port + worker)
 
+    if worker == 0:
+        await asyncio.gather(
+            *(
+                innoscream.add_subscriber(admin)
+                for admin in settings.bot.admins
+            )
+        )
+        asyncio.create_task(send_daily_top_scream())
 
-if __name__ == '__main__':
+    if not settings.webhook.enabled:
+        await bot.delete_webhook()
+        await dp.start_polling(bot)
+        return
+
+    if worker == 0 and settings.webhook.url:
+        await bot.set_webhook(
+            settings.webhook.url.rstrip('/') + settings.webhook.path,
+            secret_token=settings.webhook.secret,
+            max_connections=settings.webhook.max_connections,
+        )
+
+    app = create_app(
+        dp,
+        bot,
+        path=settings.webhook.path,
+        secret_token=settings.webhook.secret,
+        background=settings.webhook.background,
+        max_concurrency=settings.webhook.max_concurrency,
+    )
+    await serve(
+        app,
+        settings.webhook.host,
+        settings.webhook.port,
+        reuse_port=settings.webhook.workers > 1,
+    )
+
+
+def check_workers() -> None:
+    """Fail if several webhook workers would track scream copies.
+
+    Copies of screams are remembered in memory by the worker that
+    delivered them, so counts are propagated to them only when a single
+    worker handles every reaction. Several workers need propagation
+    disabled with `BROADCAST_TRACKED_SCREAMS=0`.
+
+    Raises:
+        SystemExit: If several webhook workers track scream copies.
+    """
+    if (
+        settings.webhook.enabled
+        and settings.webhook.workers > 1
+        and settings.broadcast.tracked_screams > 0
+    ):
+        raise SystemExit(
+            'Propagating reactions to scream copies needs a single worker, '
+            'set WEBHOOK_WORKERS=1 or BROADCAST_TRACKED_SCREAMS=0'
+        )
+
+
+def run_worker(worker: int = 0) -> None:
+    """Run the bot in the current process.
+
+    Args:
+        worker (int): Index of the worker process.
+    """
     logging.basicConfig(level=logging.INFO, stream=sys.stdout)
-    asyncio.run(main())
+    asyncio.run(main(worker))
+
+
+if __name__ == '__main__':
+    check_workers()
+    if settings.webhook.enabled:
+        run_workers(run_worker, settings.webhook.workers)
+    else:
+        run_worker()
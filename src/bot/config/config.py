@@ -6,6 +6,9 @@ environment-based configuration using `pydantic` and `pydantic-settings`.
 It includes settings for:
 - Telegram bot authentication and behavior
 - InnoScream backend service endpoint
+- Broadcast concurrency and rate limits
+- Webhook server receiving updates
+- Prometheus metrics exporter
 """
 
 from pydantic import Field
@@ -41,24 +44,157 @@ class InnoScream(BaseSettings):
 
     Attributes:
         base_url (str): Base URL of the InnoScream API service.
+        uds (str | None): Unix socket path to connect to the API through,
+            `base_url` then only provides the host name and path prefix.
+        timeout (float): Default request timeout in seconds.
+        timeouts (dict[str, float]): Timeouts by endpoint,
+            e.g. `{"GET /screams/{id}": 2}`, for requests not setting
+            their own timeout.
+        max_connections (int): Maximum number of open connections.
+        max_keepalive (int): Maximum number of idle kept-alive connections.
+        keepalive_expiry (float): Seconds an idle connection is kept.
+        http2 (bool): Use HTTP/2 when the API supports it.
+        retries (int): Retries of a failed idempotent request.
+        retry_backoff (float): Base of the jittered retry backoff
+            in seconds.
+        breaker_threshold (int): Consecutive failures of an endpoint
+            after which its requests fail fast.
+        breaker_reset (float): Seconds before a failing endpoint
+            is tried again.
     """
 
     base_url: str = Field(...)
+    uds: str | None = Field(None)
+    timeout: float = Field(5.0)
+    timeouts: dict[str, float] = Field(default_factory=dict)
+    max_connections: int = Field(100)
+    max_keepalive: int = Field(20)
+    keepalive_expiry: float = Field(30.0)
+    http2: bool = Field(True)
+    retries: int = Field(2)
+    retry_backoff: float = Field(0.2)
+    breaker_threshold: int = Field(5)
+    breaker_reset: float = Field(30.0)
 
     model_config = dotenv_settings_config
     model_config['env_prefix'] = 'innoscream_'
 
 
+class Broadcast(BaseSettings):
+    """Configuration for broadcasting messages to subscribers.
+
+    Attributes:
+        workers (int): Number of concurrent delivery workers.
+        rate (float): Messages per second for the whole bot, split
+            evenly between webhook workers.
+        chat_rate (float): Messages per second to a single chat, split
+            evenly between webhook workers.
+        max_retries (int): Attempts after the first failed delivery.
+        queue_size (int): Maximum number of queued deliveries.
+        page_size (int): Number of subscribers fetched per API request.
+        shard (int): Subscribers shard served by this bot instance.
+        shards (int): Number of bot instances sharing subscribers.
+        edit_delay (float): Seconds reaction keyboard edits of a message
+            are collected before the latest one is applied.
+        propagation_rate (float): Edits per second spent on refreshing
+            counts in other subscribers' copies of a scream, split evenly
+            between webhook workers.
+        propagation_batch (int): Copies refreshed between checks for
+            a more recently active scream.
+        tracked_screams (int): Number of recent screams whose copies
+            are remembered for refreshing, 0 disables refreshing.
+            Copies are remembered in memory, so refreshing needs a
+            single webhook worker.
+    """
+
+    workers: int = Field(16)
+    rate: float = Field(25.0)
+    chat_rate: float = Field(1.0)
+    max_retries: int = Field(3)
+    queue_size: int = Field(1000)
+    page_size: int = Field(1000)
+    shard: int = Field(0)
+    shards: int = Field(1)
+    edit_delay: float = Field(0.5)
+    propagation_rate: float = Field(10.0)
+    propagation_batch: int = Field(50)
+    tracked_screams: int = Field(1000)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'broadcast_'
+
+
+class Webhook(BaseSettings):
+    """Configuration for receiving updates through a webhook.
+
+    Attributes:
+        enabled (bool): Receive updates through a webhook instead of
+            long polling.
+        url (str | None): Public base URL Telegram sends updates to,
+            the webhook is not registered if omitted.
+        path (str): Webhook route path.
+        secret (str | None): Secret token Telegram sends with updates.
+        host (str): Host the webhook server listens on.
+        port (int): Port the webhook server listens on.
+        workers (int): Number of server processes sharing the port,
+            more than one needs refreshing of scream copies disabled.
+            Broadcast rates are split evenly between workers.
+        max_concurrency (int): Updates processed at once by a worker.
+        background (bool): Answer Telegram immediately and process
+            updates in the background.
+        max_connections (int): Simultaneous connections Telegram opens
+            to the webhook.
+    """
+
+    enabled: bool = Field(False)
+    url: str | None = Field(None)
+    path: str = Field('/webhook')
+    secret: str | None = Field(None)
+    host: str = Field('0.0.0.0')
+    port: int = Field(8081)
+    workers: int = Field(1)
+    max_concurrency: int = Field(100)
+    background: bool = Field(True)
+    max_connections: int = Field(40)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'webhook_'
+
+
+class Metrics(BaseSettings):
+    """Configuration for the Prometheus metrics exporter.
+
+    Attributes:
+        enabled (bool): Serve metrics over HTTP.
+        host (str): Host the exporter listens on.
+        port (int): Port the exporter listens on, webhook workers
+            after the first one listen on the following ports.
+    """
+
+    enabled: bool = Field(False)
+    host: str = Field('0.0.0.0')
+    port: int = Field(9101)
+
+    model_config = dotenv_settings_config
+    model_config['env_prefix'] = 'metrics_'
+
+
 class Settings(BaseSettings):
     """Aggregated settings for the application.
 
     Attributes:
         bot (TelegramBot): Settings related to the Telegram bot.
         innoscream (InnoScream): Settings related to the InnoScream service.
+        broadcast (Broadcast): Settings related to broadcasting.
+        webhook (Webhook): Settings related to the webhook server.
+        metrics (Metrics): Settings related to the metrics exporter.
     """
 
     bot: TelegramBot = TelegramBot()
     innoscream: InnoScream = InnoScream()
+    broadcast: Broadcast = Broadcast()
+    webhook: Webhook = Webhook()
+    metrics: Metrics = Metrics()
 
 
 settings = Settings()
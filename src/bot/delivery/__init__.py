@@ -0,0 +1,22 @@
+"""Rate-limited delivery of bot messages."""
+
+from .broadcast import Broadcast, Broadcaster, BroadcastStats
+from .edits import EditCoalescer, EditStats
+from .propagation import KeyboardPropagator, PropagationStats, ScreamCopies
+from .ratelimit import RateLimiter, TokenBucket
+from .uploads import CachedPhoto, PhotoCache
+
+__all__ = [
+    'Broadcast',
+    'Broadcaster',
+    'BroadcastStats',
+    'CachedPhoto',
+    'EditCoalescer',
+    'EditStats',
+    'KeyboardPropagator',
+    'PropagationStats',
+    'PhotoCache',
+    'RateLimiter',
+    'ScreamCopies',
+    'TokenBucket',
+]
@@ -0,0 +1,305 @@
+"""Concurrent broadcasting of messages to many chats.
+
+`Broadcaster` runs a bounded pool of worker tasks fed from a bounded queue.
+Every delivery waits for the shared `RateLimiter`, retries after
+`RetryAfter` and network errors and reports chats that blocked the bot,
+so handlers can start a broadcast and return immediately.
+"""
+
+import asyncio
+import inspect
+import logging
+from time import monotonic
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable
+
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramForbiddenError,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from pydantic import BaseModel
+
+from .ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+Send = Callable[[int], Awaitable[Any]]
+"""Coroutine function delivering something to a chat ID."""
+
+OnSent = Callable[[int, Any], Any]
+"""Callback receiving chat ID and result of a successful `Send`."""
+
+OnBlocked = Callable[[int], Any]
+"""Callback receiving chat ID that blocked the bot."""
+
+
+class BroadcastStats(BaseModel):
+    """Delivery metrics of a broadcast.
+
+    Attributes:
+        total (int): Number of queued deliveries.
+        sent (int): Number of successful deliveries.
+        failed (int): Number of deliveries given up on.
+        blocked (int): Number of chats that blocked the bot.
+        retries (int): Number of repeated attempts.
+        started_at (float): Monotonic start time.
+        finished_at (float | None): Monotonic finish time.
+    """
+
+    total: int = 0
+    sent: int = 0
+    failed: int = 0
+    blocked: int = 0
+    retries: int = 0
+    started_at: float = 0.0
+    finished_at: float | None = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent on the broadcast so far."""
+        return (self.finished_at or monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Successful deliveries per second."""
+        return self.sent / self.duration if self.duration else 0.0
+
+
+class Broadcast:
+    """A single broadcast started by `Broadcaster.broadcast`.
+
+    Attributes:
+        name (str): Name used in logs.
+        send (Send): Delivery coroutine function.
+        on_sent (OnSent | None): Callback for successful deliveries.
+        stats (BroadcastStats): Delivery metrics.
+    """
+
+    def __init__(self, name: str, send: Send, on_sent: OnSent | None):
+        """Initialize the Broadcast.
+
+        Args:
+            name (str): Name used in logs.
+            send (Send): Delivery coroutine function.
+            on_sent (OnSent | None): Callback for successful deliveries.
+        """
+        self.name = name
+        self.send = send
+        self.on_sent = on_sent
+        self.stats = BroadcastStats(started_at=monotonic())
+        self._pending = 0
+        self._queued_all = False
+        self._done = asyncio.Event()
+
+    def done(self) -> bool:
+        """Check whether all deliveries are finished."""
+        return self._done.is_set()
+
+    async def wait(self) -> BroadcastStats:
+        """Wait until all deliveries are finished.
+
+        Returns:
+            BroadcastStats: Final delivery metrics.
+        """
+        await self._done.wait()
+        return self.stats
+
+    def _add(self) -> None:
+        self._pending += 1
+        self.stats.total += 1
+
+    def _complete(self) -> None:
+        self._pending -= 1
+        self._check_done()
+
+    def _finish_queueing(self) -> None:
+        self._queued_all = True
+        self._check_done()
+
+    def _check_done(self) -> None:
+        if self._queued_all and not self._pending and not self.done():
+            self.stats.finished_at = monotonic()
+            self._done.set()
+            logger.info(
+                'Broadcast %s finished in %.2fs: %d sent, %d failed, '
+                '%d blocked, %d retries (%.1f msg/s)',
+                self.name,
+                self.stats.duration,
+                self.stats.sent,
+                self.stats.failed,
+                self.stats.blocked,
+                self.stats.retries,
+                self.stats.throughput,
+            )
+
+
+class Broadcaster:
+    """Bounded worker pool delivering broadcasts under rate limits.
+
+    Attributes:
+        limiter (RateLimiter): Shared Telegram rate limiter.
+        workers (int): Number of concurrent delivery workers.
+        max_retries (int): Attempts after the first one for a delivery.
+        on_blocked (OnBlocked | None): Callback for chats
+            that blocked the bot.
+        stats (BroadcastStats): Metrics accumulated over all broadcasts.
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        workers: int = 16,
+        max_retries: int = 3,
+        queue_size: int = 1000,
+        on_blocked: OnBlocked | None = None,
+    ):
+        """Initialize the Broadcaster.
+
+        Args:
+            limiter (RateLimiter): Shared Telegram rate limiter.
+            workers (int): Number of concurrent delivery workers.
+            max_retries (int): Attempts after the first one.
+            queue_size (int): Maximum number of queued deliveries,
+                producers wait when the queue is full.
+            on_blocked (OnBlocked | None): Callback for chats
+                that blocked the bot.
+        """
+        self.limiter = limiter
+        self.workers = workers
+        self.max_retries = max_retries
+        self.on_blocked = on_blocked
+        self.stats = BroadcastStats(started_at=monotonic())
+        self._queue: asyncio.Queue[tuple[Broadcast, int]] = asyncio.Queue(
+            queue_size
+        )
+        self._workers: list[asyncio.Task] = []
+        self._broadcasts: set[Broadcast] = set()
+        self._producers: set[asyncio.Task] = set()
+
+    def broadcast(
+        self,
+        recipients: Iterable[int] | AsyncIterable[int],
+        send: Send,
+        on_sent: OnSent | None = None,
+        name: str = 'broadcast',
+    ) -> Broadcast:
+        """Start delivering to recipients in the background.
+
+        Args:
+            recipients (Iterable[int] | AsyncIterable[int]): Chat IDs,
+                consumed lazily.
+            send (Send): Delivery coroutine function.
+            on_sent (OnSent | None): Callback for successful deliveries.
+            name (str): Name used in logs.
+
+        Returns:
+            Broadcast: Handle to wait for and inspect the broadcast.
+        """
+        self._start_workers()
+
+        job = Broadcast(name, send, on_sent)
+        self._broadcasts.add(job)
+
+        producer = asyncio.create_task(self._produce(job, recipients))
+        self._producers.add(producer)
+        producer.add_done_callback(self._producers.discard)
+
+        return job
+
+    async def join(self) -> None:
+        """Wait until all started broadcasts are finished."""
+        while self._broadcasts:
+            await asyncio.gather(*(b.wait() for b in list(self._broadcasts)))
+
+    async def close(self) -> None:
+        """Stop workers, dropping undelivered messages."""
+        for task in [*self._producers, *self._workers]:
+            task.cancel()
+        await asyncio.gather(
+            *self._producers, *self._workers, return_exceptions=True
+        )
+        self._workers.clear()
+
+    def _start_workers(self) -> None:
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._work())
+                for _ in range(self.workers)
+            ]
+
+    async def _produce(
+        self,
+        job: Broadcast,
+        recipients: Iterable[int] | AsyncIterable[int],
+    ) -> None:
+        try:
+            if isinstance(recipients, AsyncIterable):
+                async for chat_id in recipients:
+                    await self._enqueue(job, chat_id)
+            else:
+                for chat_id in recipients:
+                    await self._enqueue(job, chat_id)
+        except Exception:
+            logger.exception('Failed to list recipients of %s', job.name)
+        finally:
+            job._finish_queueing()
+            if job.done():
+                self._broadcasts.discard(job)
+
+    async def _enqueue(self, job: Broadcast, chat_id: int) -> None:
+        job._add()
+        self.stats.total += 1
+        await self._queue.put((job, chat_id))
+
+    async def _work(self) -> None:
+        while True:
+            job, chat_id = await self._queue.get()
+            try:
+                await self._deliver(job, chat_id)
+            except Exception:
+                logger.exception('Delivery of %s failed', job.name)
+            finally:
+                job._complete()
+                if job.done():
+                    self._broadcasts.discard(job)
+                self._queue.task_done()
+
+    async def _deliver(self, job: Broadcast, chat_id: int) -> None:
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                job.stats.retries += 1
+                self.stats.retries += 1
+
+            await self.limiter.acquire(chat_id)
+            try:
+                result = await job.send(chat_id)
+            except TelegramRetryAfter as e:
+                self.limiter.pause(e.retry_after)
+            except (TelegramNetworkError, TelegramServerError):
+                await asyncio.sleep(2**attempt)
+            except TelegramForbiddenError:
+                job.stats.blocked += 1
+                self.stats.blocked += 1
+                if self.on_blocked:
+                    await _maybe_await(self.on_blocked(chat_id))
+                return
+            except TelegramAPIError as e:
+                logger.warning('Failed to deliver to %d: %s', chat_id, e)
+                break
+            else:
+                job.stats.sent += 1
+                self.stats.sent += 1
+                if job.on_sent:
+                    await _maybe_await(job.on_sent(chat_id, result))
+                return
+
+        job.stats.failed += 1
+        self.stats.failed += 1
+
+
+async def _maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
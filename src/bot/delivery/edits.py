@@ -0,0 +1,194 @@
+"""Coalescing of inline keyboard edits.
+
+A popular scream gets many reaction taps per second, and editing the
+keyboard after each of them quickly hits Telegram flood limits.
+`EditCoalescer` delays the edit of every message by a short debounce
+window, applies only the latest keyboard and skips edits that would not
+change what the user already sees.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+from aiogram.types import InlineKeyboardMarkup
+from pydantic import BaseModel
+
+from .ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+Edit = Callable[[InlineKeyboardMarkup], Awaitable[Any]]
+"""Coroutine function replacing keyboard of a message."""
+
+MessageKey = tuple[int, int]
+"""Chat ID and message ID."""
+
+
+def render_keyboard(markup: InlineKeyboardMarkup | None) -> str:
+    """Render keyboard to a string comparable between edits.
+
+    Args:
+        markup (InlineKeyboardMarkup | None): Keyboard markup.
+
+    Returns:
+        str: Keyboard rendering.
+    """
+    if not isinstance(markup, InlineKeyboardMarkup):
+        return ''
+    return markup.model_dump_json(exclude_none=True)
+
+
+class EditStats(BaseModel):
+    """Keyboard edit metrics.
+
+    Attributes:
+        submitted (int): Number of requested edits.
+        applied (int): Number of edits sent to Telegram.
+        unchanged (int): Number of edits skipped as not changing anything.
+        failed (int): Number of edits failed with an error.
+    """
+
+    submitted: int = 0
+    applied: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of edits superseded by a later one."""
+        return self.submitted - self.applied - self.unchanged - self.failed
+
+
+class EditCoalescer:
+    """Debounced per-message keyboard editor.
+
+    Attributes:
+        limiter (RateLimiter): Shared Telegram rate limiter.
+        delay (float): Debounce window in seconds.
+        stats (EditStats): Edit metrics.
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        delay: float = 0.5,
+        max_messages: int = 10_000,
+    ):
+        """Initialize the EditCoalescer.
+
+        Args:
+            limiter (RateLimiter): Shared Telegram rate limiter.
+            delay (float): Debounce window in seconds.
+            max_messages (int): Number of messages whose shown keyboard
+                is remembered.
+        """
+        self.limiter = limiter
+        self.delay = delay
+        self.max_messages = max_messages
+        self.stats = EditStats()
+        self._pending: dict[
+            MessageKey, tuple[InlineKeyboardMarkup, Edit]
+        ] = {}
+        self._tasks: dict[MessageKey, asyncio.Task] = {}
+        self._shown: OrderedDict[MessageKey, str] = OrderedDict()
+
+    def shown(self, key: MessageKey) -> str | None:
+        """Get rendering of the keyboard currently shown in a message.
+
+        Args:
+            key (MessageKey): Chat ID and message ID.
+
+        Returns:
+            str | None: Keyboard rendering or None if unknown.
+        """
+        return self._shown.get(key)
+
+    def remember(self, key: MessageKey, rendered: str) -> None:
+        """Remember keyboard shown in a message.
+
+        Args:
+            key (MessageKey): Chat ID and message ID.
+            rendered (str): Keyboard rendering.
+        """
+        self._shown[key] = rendered
+        self._shown.move_to_end(key)
+        if len(self._shown) > self.max_messages:
+            self._shown.popitem(last=False)
+
+    def submit(
+        self,
+        key: MessageKey,
+        markup: InlineKeyboardMarkup,
+        edit: Edit,
+        current: InlineKeyboardMarkup | None = None,
+    ) -> None:
+        """Request a keyboard edit, replacing a pending one.
+
+        Args:
+            key (MessageKey): Chat ID and message ID.
+            markup (InlineKeyboardMarkup): New keyboard.
+            edit (Edit): Function applying the keyboard.
+            current (InlineKeyboardMarkup | None): Keyboard the message
+                is known to show, used if nothing was remembered yet.
+        """
+        self.stats.submitted += 1
+        if key not in self._shown and current is not None:
+            self.remember(key, render_keyboard(current))
+
+        self._pending[key] = (markup, edit)
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.create_task(self._apply_later(key))
+
+    async def flush(self) -> None:
+        """Wait until all pending edits are applied."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel pending edits."""
+        self._pending.clear()
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def _apply_later(self, key: MessageKey) -> None:
+        try:
+            await asyncio.sleep(self.delay)
+            await self.limiter.acquire(key[0])
+            await self._apply(key, *self._pending.pop(key))
+        except Exception:
+            self.stats.failed += 1
+            logger.exception('Failed to edit keyboard of %s', key)
+        finally:
+            del self._tasks[key]
+            if key in self._pending:
+                self._tasks[key] = asyncio.create_task(self._apply_later(key))
+
+    async def _apply(
+        self,
+        key: MessageKey,
+        markup: InlineKeyboardMarkup,
+        edit: Edit,
+    ) -> None:
+        rendered = render_keyboard(markup)
+        if self.shown(key) == rendered:
+            self.stats.unchanged += 1
+            return
+
+        try:
+            await edit(markup)
+        except TelegramRetryAfter as e:
+            self.limiter.pause(e.retry_after)
+            self._pending.setdefault(key, (markup, edit))
+            return
+        except TelegramBadRequest as e:
+            if 'message is not modified' not in e.message:
+                raise
+            self.stats.unchanged += 1
+        else:
+            self.stats.applied += 1
+
+        self.remember(key, rendered)
@@ -0,0 +1,289 @@
+"""Propagation of reaction counts to every copy of a scream.
+
+Each subscriber gets its own copy of a scream, so a reaction changes
+the keyboard of many messages. `ScreamCopies` remembers where copies of
+recent screams were delivered and which keyboard each one shows, and
+`KeyboardPropagator` refreshes them in the background in batches, most
+recently reacted screams first and under a cap of edits per second.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+from aiogram.types import InlineKeyboardMarkup
+from pydantic import BaseModel
+
+from .edits import EditCoalescer, MessageKey, render_keyboard
+from .ratelimit import RateLimiter, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+EditMessage = Callable[[int, int, InlineKeyboardMarkup], Awaitable[Any]]
+"""Coroutine function replacing keyboard of a message by chat/message ID."""
+
+
+class ScreamCopies:
+    """Registry of delivered copies of recent screams.
+
+    Attributes:
+        max_screams (int): Number of most recent screams tracked.
+    """
+
+    def __init__(self, max_screams: int = 1000):
+        """Initialize the ScreamCopies.
+
+        Args:
+            max_screams (int): Number of most recent screams tracked,
+                copies of older ones are forgotten.
+        """
+        self.max_screams = max_screams
+        self._screams: OrderedDict[int, dict[MessageKey, str]] = (
+            OrderedDict()
+        )
+
+    def add(self, scream_id: int, key: MessageKey, rendered: str) -> None:
+        """Record a delivered copy of a scream.
+
+        Args:
+            scream_id (int): Scream ID.
+            key (MessageKey): Chat ID and message ID of the copy.
+            rendered (str): Rendering of the keyboard the copy shows.
+        """
+        copies = self._screams.get(scream_id)
+        if copies is None:
+            copies = self._screams[scream_id] = {}
+            if len(self._screams) > self.max_screams:
+                self._screams.popitem(last=False)
+        copies[key] = rendered
+
+    def get(self, scream_id: int) -> list[tuple[MessageKey, str]]:
+        """Get copies of a scream with the keyboards they show.
+
+        Args:
+            scream_id (int): Scream ID.
+
+        Returns:
+            list[tuple[MessageKey, str]]: Copies and keyboard renderings.
+        """
+        return list(self._screams.get(scream_id, {}).items())
+
+    def shown(self, scream_id: int, key: MessageKey, rendered: str) -> None:
+        """Record keyboard shown by a known copy.
+
+        Args:
+            scream_id (int): Scream ID.
+            key (MessageKey): Chat ID and message ID of the copy.
+            rendered (str): Rendering of the shown keyboard.
+        """
+        copies = self._screams.get(scream_id)
+        if copies is not None and key in copies:
+            copies[key] = rendered
+
+    def discard(self, scream_id: int, key: MessageKey) -> None:
+        """Forget a copy that can no longer be edited.
+
+        Args:
+            scream_id (int): Scream ID.
+            key (MessageKey): Chat ID and message ID of the copy.
+        """
+        self._screams.get(scream_id, {}).pop(key, None)
+
+    def forget(self, scream_id: int) -> None:
+        """Forget all copies of a scream.
+
+        Args:
+            scream_id (int): Scream ID.
+        """
+        self._screams.pop(scream_id, None)
+
+
+class PropagationStats(BaseModel):
+    """Keyboard propagation metrics.
+
+    Attributes:
+        updates (int): Number of received count updates.
+        edits (int): Number of edited copies.
+        skipped (int): Number of copies already showing latest counts.
+        failed (int): Number of failed edits.
+        preempted (int): Number of times propagation of a scream was
+            interrupted in favour of a more recently active one.
+    """
+
+    updates: int = 0
+    edits: int = 0
+    skipped: int = 0
+    failed: int = 0
+    preempted: int = 0
+
+
+class KeyboardPropagator:
+    """Background worker refreshing keyboards of all scream copies.
+
+    Attributes:
+        copies (ScreamCopies): Registry of delivered copies.
+        limiter (RateLimiter): Shared Telegram rate limiter.
+        batch_size (int): Copies edited between priority checks.
+        editor (EditCoalescer | None): Coalescer told about every edited
+            copy, so it does not skip a later edit of the same message.
+        stats (PropagationStats): Propagation metrics.
+    """
+
+    def __init__(
+        self,
+        copies: ScreamCopies,
+        edit: EditMessage,
+        limiter: RateLimiter,
+        rate: float = 10.0,
+        batch_size: int = 50,
+        editor: EditCoalescer | None = None,
+    ):
+        """Initialize the KeyboardPropagator.
+
+        Args:
+            copies (ScreamCopies): Registry of delivered copies.
+            edit (EditMessage): Function editing keyboard of a message.
+            limiter (RateLimiter): Shared Telegram rate limiter.
+            rate (float): Maximum edits per second spent on propagation.
+            batch_size (int): Copies edited between priority checks.
+            editor (EditCoalescer | None): Coalescer editing copies on
+                reaction taps, which shares what each copy shows.
+        """
+        self.copies = copies
+        self.edit = edit
+        self.limiter = limiter
+        self.batch_size = batch_size
+        self.editor = editor
+        self.stats = PropagationStats()
+        self._bucket = TokenBucket(rate)
+        self._latest: dict[int, InlineKeyboardMarkup] = {}
+        self._activity: dict[int, float] = {}
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task | None = None
+
+    def update(
+        self,
+        scream_id: int,
+        markup: InlineKeyboardMarkup,
+        applied: MessageKey | None = None,
+    ) -> None:
+        """Schedule refresh of all copies of a scream with new keyboard.
+
+        Args:
+            scream_id (int): Scream ID.
+            markup (InlineKeyboardMarkup): Keyboard with latest counts.
+            applied (MessageKey | None): Copy updated by the caller
+                itself, which is not edited again.
+        """
+        self.stats.updates += 1
+        if applied is not None:
+            self.copies.shown(scream_id, applied, render_keyboard(markup))
+
+        self._latest[scream_id] = markup
+        self._activity[scream_id] = monotonic()
+        self._idle.clear()
+        self._wakeup.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def join(self) -> None:
+        """Wait until all scheduled refreshes are done."""
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stop the worker, dropping scheduled refreshes."""
+        self._latest.clear()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._idle.set()
+
+    def _next_scream(self) -> int:
+        return max(self._latest, key=self._activity.__getitem__)
+
+    async def _run(self) -> None:
+        while True:
+            if not self._latest:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            scream_id = self._next_scream()
+            markup = self._latest.pop(scream_id)
+            try:
+                await self._propagate(scream_id, markup)
+            except Exception:
+                logger.exception('Failed to propagate scream %d', scream_id)
+
+    async def _propagate(
+        self,
+        scream_id: int,
+        markup: InlineKeyboardMarkup,
+    ) -> None:
+        rendered = render_keyboard(markup)
+        copies = self.copies.get(scream_id)
+
+        for start in range(0, len(copies), self.batch_size):
+            if self._preempted(scream_id):
+                self._latest.setdefault(scream_id, markup)
+                self.stats.preempted += 1
+                return
+
+            for key, shown in copies[start:start + self.batch_size]:
+                if shown == rendered:
+                    self.stats.skipped += 1
+                    continue
+                await self._edit(scream_id, key, markup, rendered)
+
+        if scream_id not in self._latest:
+            self._activity.pop(scream_id, None)
+
+    def _preempted(self, scream_id: int) -> bool:
+        if scream_id in self._latest:
+            return True
+        if not self._latest:
+            return False
+        other = self._next_scream()
+        return self._activity[other] > self._activity[scream_id]
+
+    async def _edit(
+        self,
+        scream_id: int,
+        key: MessageKey,
+        markup: InlineKeyboardMarkup,
+        rendered: str,
+    ) -> None:
+        await self._bucket.acquire()
+        await self.limiter.acquire(key[0])
+        try:
+            await self.edit(key[0], key[1], markup)
+        except TelegramRetryAfter as e:
+            self.limiter.pause(e.retry_after)
+            self._latest.setdefault(scream_id, markup)
+            return
+        except TelegramForbiddenError:
+            self.copies.discard(scream_id, key)
+            self.stats.failed += 1
+            return
+        except TelegramBadRequest as e:
+            if 'message is not modified' not in e.message:
+                self.copies.discard(scream_id, key)
+                self.stats.failed += 1
+                return
+        else:
+            self.stats.edits += 1
+
+        self.copies.shown(scream_id, key, rendered)
+        if self.editor is not None:
+            self.editor.remember(key, rendered)
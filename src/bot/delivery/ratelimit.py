@@ -0,0 +1,136 @@
+"""Rate limiting of outgoing Telegram requests.
+
+Telegram allows a bot roughly 30 messages per second in total and about
+one message per second to a single chat. `RateLimiter` combines a global
+token bucket with lazily created per-chat buckets to stay under both.
+"""
+
+import asyncio
+from time import monotonic
+
+
+class TokenBucket:
+    """Token bucket limiting the rate of some action.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum number of stored tokens (burst size).
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize the TokenBucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float | None): Burst size, defaults to `rate`
+                (but at least one token).
+        """
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        """Get seconds to wait until a token is available.
+
+        Returns:
+            float: Delay in seconds, 0 if a token is available now.
+        """
+        now = monotonic()
+        self._refill(now)
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def is_idle(self) -> bool:
+        """Check whether the bucket is full and can be forgotten."""
+        return self.delay() == 0 and self._tokens >= self.capacity
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds.
+
+        Args:
+            seconds (float): Pause duration.
+        """
+        self._paused_until = max(self._paused_until, monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait for a token and consume it."""
+        async with self._lock:
+            while (delay := self.delay()) > 0:
+                await asyncio.sleep(delay)
+            self._tokens -= 1
+
+
+class RateLimiter:
+    """Global and per-chat rate limiter for Telegram requests.
+
+    Attributes:
+        global_bucket (TokenBucket): Bucket shared by all chats.
+        chat_rate (float): Requests per second allowed for one chat.
+    """
+
+    def __init__(
+        self,
+        rate: float = 30.0,
+        chat_rate: float = 1.0,
+        max_chats: int = 10_000,
+    ):
+        """Initialize the RateLimiter.
+
+        Args:
+            rate (float): Requests per second for the whole bot.
+            chat_rate (float): Requests per second for a single chat.
+            max_chats (int): Number of per-chat buckets kept before
+                idle ones are dropped.
+        """
+        self.global_bucket = TokenBucket(rate)
+        self.chat_rate = chat_rate
+        self.max_chats = max_chats
+        self._chats: dict[int, TokenBucket] = {}
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= self.max_chats:
+                self._chats = {
+                    chat: b
+                    for chat, b in self._chats.items()
+                    if not b.is_idle()
+                }
+            bucket = self._chats[chat_id] = TokenBucket(self.chat_rate, 1)
+        return bucket
+
+    async def acquire(self, chat_id: int | None = None) -> None:
+        """Wait until a request to the chat is allowed.
+
+        The chat bucket is awaited first, so waiting for a busy chat
+        does not hold global tokens.
+
+        Args:
+            chat_id (int | None): Target chat, `None` for global only.
+        """
+        if chat_id is not None:
+            await self._chat_bucket(chat_id).acquire()
+        await self.global_bucket.acquire()
+
+    def pause(self, seconds: float, chat_id: int | None = None) -> None:
+        """Pause requests after Telegram asked to retry later.
+
+        Args:
+            seconds (float): Pause duration.
+            chat_id (int | None): Chat to pause, `None` to pause globally.
+        """
+        if chat_id is None:
+            self.global_bucket.pause(seconds)
+        else:
+            self._chat_bucket(chat_id).pause(seconds)
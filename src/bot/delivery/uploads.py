@@ -0,0 +1,103 @@
+"""Reuse of uploaded photos by their Telegram `file_id`.
+
+Sending the same `BufferedInputFile` to many chats uploads the image
+every time. `CachedPhoto` uploads it with the first successful delivery
+and sends the returned `file_id` afterwards; `PhotoCache` keeps such
+photos by content hash so unchanged images are never uploaded twice.
+"""
+
+import asyncio
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Awaitable, Callable
+
+from aiogram.types import BufferedInputFile, Message
+
+SendPhoto = Callable[[BufferedInputFile | str], Awaitable[Message]]
+"""Coroutine function sending a photo (file or `file_id`) somewhere."""
+
+
+class CachedPhoto:
+    """Photo uploaded to Telegram once and then sent by `file_id`.
+
+    Attributes:
+        content (bytes): Image content, released after the upload.
+        filename (str): File name used for the upload.
+        file_id (str | None): Telegram file ID after the first upload.
+    """
+
+    def __init__(self, content: bytes, filename: str):
+        """Initialize the CachedPhoto.
+
+        Args:
+            content (bytes): Image content.
+            filename (str): File name used for the upload.
+        """
+        self.content = content
+        self.filename = filename
+        self.file_id: str | None = None
+        self._lock = asyncio.Lock()
+
+    async def send(self, send_photo: SendPhoto) -> Message:
+        """Send the photo, uploading it only if no `file_id` is known.
+
+        Concurrent senders wait for the upload in progress; if it fails,
+        the next one uploads instead.
+
+        Args:
+            send_photo (SendPhoto): Function sending the photo.
+
+        Returns:
+            Message: Sent message.
+        """
+        if self.file_id is None:
+            async with self._lock:
+                if self.file_id is None:
+                    message = await send_photo(
+                        BufferedInputFile(self.content, self.filename)
+                    )
+                    if message.photo:
+                        self.file_id = message.photo[-1].file_id
+                        self.content = b''
+                    return message
+
+        return await send_photo(self.file_id)
+
+
+class PhotoCache:
+    """LRU cache of `CachedPhoto` by image content.
+
+    Attributes:
+        maxsize (int): Maximum number of kept photos.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """Initialize the PhotoCache.
+
+        Args:
+            maxsize (int): Maximum number of kept photos.
+        """
+        self.maxsize = maxsize
+        self._photos: OrderedDict[bytes, CachedPhoto] = OrderedDict()
+
+    def get(self, content: bytes, filename: str) -> CachedPhoto:
+        """Get photo for the content, reusing a known one if unchanged.
+
+        Args:
+            content (bytes): Image content.
+            filename (str): File name used if it has to be uploaded.
+
+        Returns:
+            CachedPhoto: Photo to send.
+        """
+        digest = sha256(content).digest()
+
+        photo = self._photos.get(digest)
+        if photo is None:
+            photo = self._photos[digest] = CachedPhoto(content, filename)
+            if len(self._photos) > self.maxsize:
+                self._photos.popitem(last=False)
+        else:
+            self._photos.move_to_end(digest)
+
+        return photo
@@ -0,0 +1,192 @@
+"""Prometheus metrics exporter of the bot.
+
+`HandlerMetricsMiddleware` times update handlers and
+`TelegramMetricsMiddleware` times Bot API requests by method, so send
+throughput shows as the rate of `sendMessage` and `sendPhoto` requests.
+`StatsCollector` exports the counters the broadcaster and the InnoScream
+API client keep anyway. `start_exporter` serves `registry` over HTTP
+from a background thread.
+"""
+
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterator
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.types import TelegramObject
+from prometheus_client import (
+    CollectorRegistry,
+    GCCollector,
+    Histogram,
+    PlatformCollector,
+    ProcessCollector,
+    start_http_server,
+)
+from prometheus_client.core import CounterMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+from .delivery import BroadcastStats
+from .services.innoscream import EndpointStats
+
+registry = CollectorRegistry()
+"""Registry of bot metrics."""
+
+ProcessCollector(registry=registry)
+PlatformCollector(registry=registry)
+GCCollector(registry=registry)
+
+handler_duration = Histogram(
+    'bot_handler_duration_seconds',
+    'Update handling time by handler',
+    ['handler', 'outcome'],
+    registry=registry,
+)
+
+telegram_request_duration = Histogram(
+    'telegram_request_duration_seconds',
+    'Telegram Bot API request time by method',
+    ['method', 'outcome'],
+    registry=registry,
+)
+
+
+class HandlerMetricsMiddleware(BaseMiddleware):
+    """Inner middleware recording handling time of every handler."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        """Run the handler and record its duration and outcome."""
+        name = data['handler'].callback.__name__
+        outcome = 'error'
+        started = perf_counter()
+        try:
+            result = await handler(event, data)
+            outcome = 'ok'
+            return result
+        finally:
+            handler_duration.labels(name, outcome).observe(
+                perf_counter() - started
+            )
+
+
+class TelegramMetricsMiddleware(BaseRequestMiddleware):
+    """Session middleware recording time of every Bot API request."""
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        bot: Bot,
+        method: TelegramMethod,
+    ) -> Response:
+        """Make the request and record its duration and outcome."""
+        outcome = 'error'
+        started = perf_counter()
+        try:
+            response = await make_request(bot, method)
+            outcome = 'ok'
+            return response
+        except TelegramRetryAfter:
+            outcome = 'retry_after'
+            raise
+        finally:
+            telegram_request_duration.labels(
+                method.__api_method__, outcome
+            ).observe(perf_counter() - started)
+
+
+class StatsCollector(Collector):
+    """Collector exporting broadcast and InnoScream API client counters.
+
+    Attributes:
+        broadcast (Callable[[], BroadcastStats]): Function getting
+            metrics accumulated over all broadcasts.
+        api (Callable[[], dict[str, EndpointStats]]): Function getting
+            InnoScream API request metrics by endpoint.
+    """
+
+    def __init__(
+        self,
+        broadcast: Callable[[], BroadcastStats],
+        api: Callable[[], dict[str, EndpointStats]],
+    ):
+        """Initialize the StatsCollector.
+
+        Args:
+            broadcast (Callable[[], BroadcastStats]): Function getting
+                metrics accumulated over all broadcasts.
+            api (Callable[[], dict[str, EndpointStats]]): Function
+                getting InnoScream API request metrics by endpoint.
+        """
+        self.broadcast = broadcast
+        self.api = api
+
+    def collect(self) -> Iterator[Metric]:
+        """Collect current values of the counters.
+
+        Yields:
+            Metric: Counter families.
+        """
+        stats = self.broadcast()
+        deliveries = CounterMetricFamily(
+            'bot_broadcast_deliveries',
+            'Finished broadcast deliveries by outcome',
+            labels=['outcome'],
+        )
+        deliveries.add_metric(['sent'], stats.sent)
+        deliveries.add_metric(['failed'], stats.failed)
+        deliveries.add_metric(['blocked'], stats.blocked)
+        yield deliveries
+        yield CounterMetricFamily(
+            'bot_broadcast_queued',
+            'Queued broadcast deliveries',
+            value=stats.total,
+        )
+        yield CounterMetricFamily(
+            'bot_broadcast_retries',
+            'Repeated broadcast delivery attempts',
+            value=stats.retries,
+        )
+
+        families = {
+            field: CounterMetricFamily(
+                f'bot_api_{field}',
+                description,
+                labels=['endpoint'],
+            )
+            for field, description in (
+                ('requests', 'InnoScream API requests, retries included'),
+                ('errors', 'InnoScream API network errors and 5xx responses'),
+                ('retries', 'Repeated InnoScream API requests'),
+                ('rejected', 'InnoScream API requests rejected by circuit'),
+            )
+        }
+        latency = CounterMetricFamily(
+            'bot_api_latency_seconds',
+            'Seconds spent waiting for InnoScream API responses',
+            labels=['endpoint'],
+        )
+        for endpoint, endpoint_stats in list(self.api().items()):
+            for field, family in families.items():
+                family.add_metric([endpoint], getattr(endpoint_stats, field))
+            latency.add_metric([endpoint], endpoint_stats.latency_total)
+        yield from families.values()
+        yield latency
+
+
+def start_exporter(host: str, port: int) -> None:
+    """Serve metrics of `registry` from a background thread.
+
+    Args:
+        host (str): Host to listen on.
+        port (int): Port to listen on.
+    """
+    start_http_server(port, addr=host, registry=registry)
@@ -2,5 +2,6 @@
 
 from .client import InnoScreamAPI
 from .models import Scream
+from .transport import CircuitOpenError, EndpointStats
 
-__all__ = ['InnoScreamAPI', 'Scream']
+__all__ = ['CircuitOpenError', 'EndpointStats', 'InnoScreamAPI', 'Scream']
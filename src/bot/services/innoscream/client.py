@@ -1,17 +1,82 @@
 """A simple abstraction over API for easier use."""
 
-from typing import Literal
-from httpx import AsyncClient
+from importlib.util import find_spec
+from typing import AsyncIterator, Literal
+from httpx import AsyncClient, AsyncHTTPTransport, Limits
 
-from .models import Scream, Stats
+from .models import Scream, Stats, Summary
+from .transport import EndpointStats, ResilientTransport
+
+
+def user_headers(user_id: int) -> dict[str, str]:
+    """
+    Build headers of a request made for a user.
+
+    The API sends reads of a user who wrote recently to the primary
+    database instead of a read replica, so the user sees their writes.
+
+    :param user_id: User ID
+    :return: Headers
+    """
+    return {'X-User-Id': str(user_id)}
 
 
 class InnoScreamAPI:
     """Class that abstracts the InnoScreamAPI."""
 
-    def __init__(self, base_url: str):
-        """Initialize the InnoScreamAPI."""
-        self.client = AsyncClient(base_url=base_url, follow_redirects=True)
+    def __init__(
+        self,
+        base_url: str,
+        uds: str | None = None,
+        timeout: float = 5.0,
+        timeouts: dict[str, float] | None = None,
+        limits: Limits | None = None,
+        http2: bool = True,
+        retries: int = 2,
+        backoff: float = 0.2,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        """
+        Initialize the InnoScreamAPI.
+
+        :param base_url: API base URL
+        :param uds: Unix socket path to connect through instead of TCP
+        :param timeout: Default request timeout in seconds
+        :param timeouts: Timeouts by endpoint like `GET /screams/{id}`
+        :param limits: Connection pool limits
+        :param http2: Use HTTP/2 if the `h2` package is installed
+        :param retries: Retries of a failed idempotent request
+        :param backoff: Base of the jittered retry backoff in seconds
+        :param failure_threshold: Consecutive failures of an endpoint
+            after which its requests fail fast
+        :param reset_timeout: Seconds before a failing endpoint is tried
+            again
+        """
+        self.transport = ResilientTransport(
+            AsyncHTTPTransport(
+                uds=uds,
+                limits=limits or Limits(),
+                http2=http2 and find_spec('h2') is not None,
+            ),
+            timeout=timeout,
+            timeouts=timeouts,
+            retries=retries,
+            backoff=backoff,
+            failure_threshold=failure_threshold,
+            reset_timeout=reset_timeout,
+        )
+        self.client = AsyncClient(
+            base_url=base_url,
+            follow_redirects=True,
+            timeout=timeout,
+            transport=self.transport,
+        )
+
+    @property
+    def stats(self) -> dict[str, EndpointStats]:
+        """Request metrics by endpoint like `GET /screams/{id}`."""
+        return self.transport.stats
 
     async def create_scream(self, user_id: int, text: str) -> Scream:
         """
@@ -27,6 +92,7 @@ class InnoScreamAPI:
                 'user_id': user_id,
                 'text': text,
             },
+            headers=user_headers(user_id),
         )
         res.raise_for_status()
 
@@ -74,6 +140,7 @@ class InnoScreamAPI:
                 'user_id': user_id,
                 'reaction': reaction,
             },
+            headers=user_headers(user_id),
         )
         res.raise_for_status()
 
@@ -86,7 +153,10 @@ class InnoScreamAPI:
         :param user_id: User ID
         :return: Stats
         """
-        res = await self.client.get(f'/analytics/{user_id}/stats')
+        res = await self.client.get(
+            f'/analytics/{user_id}/stats',
+            headers=user_headers(user_id),
+        )
         res.raise_for_status()
 
         return Stats.model_validate(res.json())
@@ -106,11 +176,35 @@ class InnoScreamAPI:
         res = await self.client.get(
             f'/analytics/{user_id}/graph',
             params={'period': period},
+            headers=user_headers(user_id),
         )
         res.raise_for_status()
 
         return res.content
 
+    async def get_summary(
+        self,
+        user_id: int,
+        period: Literal['week', 'month', 'year'],
+        graph: Literal['inline', 'url'] = 'inline',
+    ) -> Summary:
+        """
+        Get user statistics with statistics graph in one request.
+
+        :param user_id: User ID
+        :param period: Graph period
+        :param graph: Get rendered graph image or URL rendering it
+        :return: Summary
+        """
+        res = await self.client.get(
+            f'/analytics/{user_id}/summary',
+            params={'period': period, 'graph': graph},
+            headers=user_headers(user_id),
+        )
+        res.raise_for_status()
+
+        return Summary.model_validate_json(res.content)
+
     async def get_most_voted_scream(
         self, period: Literal['day', 'week', 'month', 'year']
     ) -> Scream | None:
@@ -143,3 +237,70 @@ class InnoScreamAPI:
         res.raise_for_status()
 
         return res.content
+
+    async def add_subscriber(self, chat_id: int) -> None:
+        """
+        Subscribe chat to broadcasts.
+
+        :param chat_id: Chat ID
+        """
+        res = await self.client.put(f'/subscribers/{chat_id}')
+        res.raise_for_status()
+
+    async def remove_subscriber(self, chat_id: int) -> None:
+        """
+        Unsubscribe chat from broadcasts.
+
+        :param chat_id: Chat ID
+        """
+        res = await self.client.delete(f'/subscribers/{chat_id}')
+        res.raise_for_status()
+
+    async def get_subscribers(
+        self,
+        after: int | None = None,
+        limit: int = 1000,
+        shard: int = 0,
+        shards: int = 1,
+    ) -> list[int]:
+        """
+        Get page of subscriber chat IDs.
+
+        :param after: Last chat ID of the previous page
+        :param limit: Page size
+        :param shard: Shard number
+        :param shards: Number of shards
+        :return: Chat IDs ordered ascending
+        """
+        params = {'limit': limit, 'shard': shard, 'shards': shards}
+        if after is not None:
+            params['after'] = after
+
+        res = await self.client.get('/subscribers/', params=params)
+        res.raise_for_status()
+
+        return res.json()
+
+    async def iter_subscribers(
+        self,
+        page_size: int = 1000,
+        shard: int = 0,
+        shards: int = 1,
+    ) -> AsyncIterator[int]:
+        """
+        Iterate over all subscriber chat IDs page by page.
+
+        :param page_size: Number of chat IDs fetched per request
+        :param shard: Shard number
+        :param shards: Number of shards
+        :return: Async iterator of chat IDs
+        """
+        after = None
+        while True:
+            page = await self.get_subscribers(after, page_size, shard, shards)
+            for chat_id in page:
+                yield chat_id
+
+            if len(page) < page_size:
+                return
+            after = page[-1]
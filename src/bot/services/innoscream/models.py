@@ -6,7 +6,7 @@ to represent scream messages and user statistics related to scream reactions.
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Scream(BaseModel):
@@ -38,3 +38,30 @@ class Stats(BaseModel):
 
     screams_count: int
     reactions_count: dict[str, int]
+
+
+class Graph(BaseModel):
+    """Statistics graph of a user's screams.
+
+    Attributes:
+        url (str | None): URL rendering the graph image.
+        image (bytes | None): Rendered graph image,
+        base64 encoded in JSON.
+    """
+
+    url: str | None = None
+    image: bytes | None = None
+
+    model_config = ConfigDict(val_json_bytes='base64')
+
+
+class Summary(BaseModel):
+    """Statistics for a user's scream activity with its graph.
+
+    Attributes:
+        stats (Stats): Statistics.
+        graph (Graph): Statistics graph.
+    """
+
+    stats: Stats
+    graph: Graph
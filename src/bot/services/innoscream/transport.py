@@ -0,0 +1,272 @@
+"""Resilient HTTP transport for the InnoScream API.
+
+`ResilientTransport` wraps the connection pool of the client and, per
+API endpoint, applies timeouts, retries idempotent requests that failed
+on the network or with a gateway error after a jittered exponential
+backoff, and fails fast with `CircuitOpenError` while the endpoint keeps
+failing. It also counts requests, errors and latency of every endpoint.
+"""
+
+import asyncio
+import random
+import re
+from time import monotonic
+from typing import Literal
+
+import httpx
+from pydantic import BaseModel
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+"""Methods safe to repeat after a failure."""
+
+RETRY_STATUSES = frozenset({502, 503, 504})
+"""Response statuses worth retrying."""
+
+_ID_SEGMENT = re.compile(r'(?<=/)-?\d+(?=/|$)')
+
+
+def endpoint_name(request: httpx.Request) -> str:
+    """
+    Get endpoint of a request with IDs in the path replaced.
+
+    :param request: Request
+    :return: Endpoint name like `GET /screams/{id}`
+    """
+    return f'{request.method} {_ID_SEGMENT.sub("{id}", request.url.path)}'
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Request rejected without sending while its endpoint is failing."""
+
+
+class EndpointStats(BaseModel):
+    """Request metrics of an endpoint.
+
+    Attributes:
+        requests (int): Number of sent requests, retries included.
+        errors (int): Number of network errors and 5xx responses.
+        retries (int): Number of repeated requests.
+        rejected (int): Number of requests rejected by open circuit.
+        latency_total (float): Seconds spent waiting for responses.
+        latency_max (float): Longest wait for a response in seconds.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    rejected: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def latency_mean(self) -> float:
+        """Mean seconds spent waiting for a response."""
+        return self.latency_total / self.requests if self.requests else 0.0
+
+
+class CircuitBreaker:
+    """Circuit breaker of a single endpoint.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests are rejected. Once `reset_timeout` passes, a single trial
+    request is let through: success closes the circuit, failure opens it
+    again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        """
+        Initialize the CircuitBreaker.
+
+        :param failure_threshold: Consecutive failures opening the circuit
+        :param reset_timeout: Seconds before a trial request is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._trial = False
+
+    @property
+    def state(self) -> Literal['closed', 'open', 'half-open']:
+        """Current state of the circuit."""
+        if self._opened_at is None:
+            return 'closed'
+        if monotonic() - self._opened_at < self.reset_timeout:
+            return 'open'
+        return 'half-open'
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent now.
+
+        :return: True if the request may be sent
+        """
+        match self.state:
+            case 'closed':
+                return True
+            case 'open':
+                return False
+        if self._trial:
+            return False
+        self._trial = True
+        return True
+
+    @property
+    def trial(self) -> bool:
+        """Whether a trial request is in flight."""
+        return self._trial
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit if needed."""
+        self.failures += 1
+        if self._trial or self.failures >= self.failure_threshold:
+            self._opened_at = monotonic()
+        self._trial = False
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    """Transport adding timeouts, retries and circuit breaking.
+
+    Attributes:
+        transport (httpx.AsyncBaseTransport): Wrapped transport.
+        timeout (httpx.Timeout): Client default timeout.
+        timeouts (dict[str, float]): Timeouts by endpoint name,
+            replacing the client default timeout.
+        retries (int): Retries of a failed idempotent request.
+        backoff (float): Base of the exponential backoff in seconds.
+        max_backoff (float): Maximum backoff in seconds.
+        stats (dict[str, EndpointStats]): Metrics by endpoint name.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        timeout: httpx.Timeout | float | None = 5.0,
+        timeouts: dict[str, float] | None = None,
+        retries: int = 2,
+        backoff: float = 0.2,
+        max_backoff: float = 5.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        """
+        Initialize the ResilientTransport.
+
+        :param transport: Transport sending the requests
+        :param timeout: Client default timeout, requests with another
+            timeout set it explicitly and keep it
+        :param timeouts: Timeouts by endpoint name like `GET /screams/{id}`
+        :param retries: Retries of a failed idempotent request
+        :param backoff: Base of the exponential backoff in seconds
+        :param max_backoff: Maximum backoff in seconds
+        :param failure_threshold: Consecutive failures opening a circuit
+        :param reset_timeout: Seconds an open circuit rejects requests
+        """
+        self.transport = transport
+        self.timeout = httpx.Timeout(timeout)
+        self.timeouts = timeouts or {}
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.stats: dict[str, EndpointStats] = {}
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    async def handle_async_request(
+        self,
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """
+        Send a request with retries under the endpoint circuit breaker.
+
+        :param request: Request
+        :return: Response
+        :raises CircuitOpenError: If the endpoint circuit is open
+        """
+        endpoint = endpoint_name(request)
+        stats = self.stats.setdefault(endpoint, EndpointStats())
+        breaker = self.breakers.get(endpoint)
+        if breaker is None:
+            breaker = self.breakers[endpoint] = CircuitBreaker(
+                self.failure_threshold, self.reset_timeout
+            )
+
+        if (
+            endpoint in self.timeouts
+            and request.extensions.get('timeout') == self.timeout.as_dict()
+        ):
+            timeout = httpx.Timeout(self.timeouts[endpoint])
+            request.extensions['timeout'] = timeout.as_dict()
+
+        trial = breaker.state == 'half-open'
+        if not breaker.allow():
+            stats.rejected += 1
+            raise CircuitOpenError(
+                f'Circuit of {endpoint} is open', request=request
+            )
+
+        attempts = 1
+        if request.method in IDEMPOTENT_METHODS:
+            attempts += self.retries
+
+        try:
+            for attempt in range(attempts):
+                if attempt:
+                    stats.retries += 1
+                    await asyncio.sleep(self._backoff(attempt))
+
+                last = attempt + 1 == attempts
+                started = monotonic()
+                try:
+                    response = await self.transport.handle_async_request(
+                        request
+                    )
+                except httpx.TransportError:
+                    self._record(stats, started, failed=True)
+                    breaker.record_failure()
+                    if last or not breaker.allow():
+                        raise
+                    continue
+
+                failed = response.status_code >= 500
+                self._record(stats, started, failed)
+                if not failed:
+                    breaker.record_success()
+                    return response
+
+                breaker.record_failure()
+                if (
+                    last
+                    or response.status_code not in RETRY_STATUSES
+                    or not breaker.allow()
+                ):
+                    return response
+                await response.aclose()
+        finally:
+            # A trial ended by cancellation or an unexpected error would
+            # otherwise keep the circuit half-open with no trial allowed.
+            if trial and breaker.trial:
+                breaker.record_failure()
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+    def _backoff(self, attempt: int) -> float:
+        cap = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    @staticmethod
+    def _record(stats: EndpointStats, started: float, failed: bool) -> None:
+        latency = monotonic() - started
+        stats.requests += 1
+        stats.errors += failed
+        stats.latency_total += latency
+        stats.latency_max = max(stats.latency_max, latency)
@@ -0,0 +1,184 @@
+"""Webhook server receiving Telegram updates.
+
+Instead of long polling, Telegram pushes updates to an aiohttp
+application. `LimitedRequestHandler` feeds them to the dispatcher with
+a bounded number of updates processed at once, either answering
+Telegram after the handler finished or right away with the update
+handled in the background. Several worker processes can share a port
+with `SO_REUSEPORT`, letting the kernel balance connections between
+them.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+import sys
+from typing import Any, Callable
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import (
+    SimpleRequestHandler,
+    setup_application,
+)
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+
+class LimitedRequestHandler(SimpleRequestHandler):
+    """Webhook request handler with bounded update concurrency.
+
+    When all slots are busy, new requests wait before being read, so
+    Telegram slows down delivery instead of the bot piling up tasks.
+
+    Attributes:
+        max_concurrency (int): Maximum number of updates processed
+            at the same time.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        max_concurrency: int = 100,
+        **kwargs: Any,
+    ):
+        """Initialize the LimitedRequestHandler.
+
+        Args:
+            dispatcher (Dispatcher): Dispatcher processing updates.
+            bot (Bot): Bot the updates belong to.
+            max_concurrency (int): Maximum number of updates processed
+                at the same time.
+            **kwargs: Arguments of `SimpleRequestHandler`.
+        """
+        super().__init__(dispatcher, bot, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    async def _handle_request(
+        self,
+        bot: Bot,
+        request: web.Request,
+    ) -> web.Response:
+        async with self._slots:
+            return await super()._handle_request(bot, request)
+
+    async def _handle_request_background(
+        self,
+        bot: Bot,
+        request: web.Request,
+    ) -> web.Response:
+        await self._slots.acquire()
+        try:
+            return await super()._handle_request_background(bot, request)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _background_feed_update(
+        self,
+        bot: Bot,
+        update: dict[str, Any],
+    ) -> None:
+        try:
+            await super()._background_feed_update(bot, update)
+        except Exception:
+            logger.exception('Failed to process update in background')
+        finally:
+            self._slots.release()
+
+
+def create_app(
+    dispatcher: Dispatcher,
+    bot: Bot,
+    path: str = '/webhook',
+    secret_token: str | None = None,
+    background: bool = True,
+    max_concurrency: int = 100,
+) -> web.Application:
+    """Create aiohttp application serving the webhook.
+
+    Args:
+        dispatcher (Dispatcher): Dispatcher processing updates.
+        bot (Bot): Bot the updates belong to.
+        path (str): Webhook route path.
+        secret_token (str | None): Secret expected in the
+            `X-Telegram-Bot-Api-Secret-Token` header.
+        background (bool): Answer Telegram immediately and process
+            updates as background tasks.
+        max_concurrency (int): Maximum number of updates processed
+            at the same time.
+
+    Returns:
+        web.Application: Application with the webhook route and
+            dispatcher startup/shutdown hooks.
+    """
+    app = web.Application()
+    LimitedRequestHandler(
+        dispatcher,
+        bot,
+        max_concurrency=max_concurrency,
+        handle_in_background=background,
+        secret_token=secret_token,
+    ).register(app, path=path)
+    setup_application(app, dispatcher, bot=bot)
+    return app
+
+
+async def serve(
+    app: web.Application,
+    host: str,
+    port: int,
+    reuse_port: bool = False,
+) -> None:
+    """Serve the application until cancelled.
+
+    Args:
+        app (web.Application): Application to serve.
+        host (str): Host to listen on.
+        port (int): Port to listen on.
+        reuse_port (bool): Allow other processes to listen on the
+            same port.
+    """
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port, reuse_port=reuse_port)
+    await site.start()
+    logger.info('Webhook server listening on %s:%d', host, port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def run_workers(target: Callable[[int], Any], workers: int) -> None:
+    """Run a target in worker processes and wait for them.
+
+    A single worker runs in the current process. Otherwise workers are
+    terminated when the parent process exits or receives SIGTERM.
+
+    Args:
+        target (Callable[[int], Any]): Function receiving worker index.
+        workers (int): Number of worker processes.
+    """
+    if workers <= 1:
+        target(0)
+        return
+
+    processes = [
+        multiprocessing.Process(target=target, args=(index,))
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+                process.join()
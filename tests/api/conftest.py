@@ -1,19 +1,13 @@
-import sys
+import os
 import pytest
 import asyncio
-from pathlib import Path
-from dotenv import load_dotenv
+from contextlib import contextmanager
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-# Load test environment variables
-env_path = Path(__file__).parent / '.env.test'
-load_dotenv(dotenv_path=env_path)
-
-sys.path.append('src')
-
-from src.api.database import Base  # noqa: E402
-from src.api.models import Scream, Reaction  # noqa: E402
+from api.database import Base
+from api.models import Scream, Reaction
+from api.profiling import profile_engine, profile_queries
 
 
 @pytest.fixture(scope='session')
@@ -23,9 +17,14 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture(scope='session')
-async def test_engine():
-    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+TEST_DATABASES = {'sqlite': 'sqlite+aiosqlite:///:memory:'}
+if os.getenv('TEST_POSTGRES_URL'):
+    TEST_DATABASES['postgresql'] = os.environ['TEST_POSTGRES_URL']
+
+
+@pytest.fixture(scope='session', params=list(TEST_DATABASES))
+async def test_engine(request):
+    engine = create_async_engine(TEST_DATABASES[request.param])
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -48,6 +47,23 @@ async def test_session(test_engine):
         await session.rollback()
 
 
+@pytest.fixture
+def max_queries(test_engine):
+    """Assert that a block runs at most `limit` statements on test_engine."""
+    profile_engine(test_engine)
+
+    @contextmanager
+    def check(limit: int):
+        with profile_queries() as profile:
+            yield profile
+        assert profile.count <= limit, (
+            f'{profile.count} queries, at most {limit} expected:\n'
+            + profile.report()
+        )
+
+    return check
+
+
 @pytest.fixture
 async def override_get_session(test_session):
     async def _get_session():
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from api.events import bus as app_bus
+from src.api.events.bus import EventBus
+from api.events.routes import stream_events
+from src.api.screams import service
+
+
+async def take(iterator, count):
+    return [await anext(iterator) for _ in range(count)]
+
+
+def test_since_returns_events_after_cursor():
+    bus = EventBus(history=10)
+    for i in range(5):
+        bus.publish('scream-deleted', {'scream_id': i})
+
+    assert [e.id for e in bus.since(2)] == [3, 4, 5]
+    assert bus.since(5) == []
+
+
+def test_since_detects_lost_events():
+    bus = EventBus(history=3)
+    for i in range(5):
+        bus.publish('scream-deleted', {'scream_id': i})
+
+    assert bus.since(1) is None
+    assert [e.id for e in bus.since(2)] == [3, 4, 5]
+    assert bus.since(6) is None
+
+
+def test_event_sse_encoding():
+    event = EventBus().publish('reaction-changed', {'reactions': {'👍': 1}})
+
+    assert event.sse == (
+        'id: 1\nevent: reaction-changed\ndata: {"reactions": {"👍": 1}}\n\n'
+    )
+
+
+@pytest.mark.asyncio
+async def test_fans_out_to_all_subscribers():
+    bus = EventBus()
+    subscribers = [bus.subscribe() for _ in range(3)]
+    pending = [
+        asyncio.ensure_future(take(subscriber, 2))
+        for subscriber in subscribers
+    ]
+    await asyncio.sleep(0)
+
+    bus.publish('scream-created', {'scream_id': 1})
+    bus.publish('scream-deleted', {'scream_id': 1})
+
+    for events in await asyncio.gather(*pending):
+        assert [e.type for e in events] == ['scream-created', 'scream-deleted']
+
+
+@pytest.mark.asyncio
+async def test_resumes_from_cursor():
+    bus = EventBus()
+    for i in range(3):
+        bus.publish('scream-deleted', {'scream_id': i})
+
+    events = await take(bus.subscribe(cursor=1), 2)
+
+    assert [e.id for e in events] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_resets_lagging_subscriber():
+    bus = EventBus(history=2)
+    for i in range(5):
+        bus.publish('scream-deleted', {'scream_id': i})
+
+    subscriber = bus.subscribe(cursor=1)
+    reset = await anext(subscriber)
+    bus.publish('scream-created', {'scream_id': 6})
+    event = await anext(subscriber)
+
+    assert (reset.type, reset.id) == ('reset', 5)
+    assert (event.type, event.id) == ('scream-created', 6)
+
+
+@pytest.mark.asyncio
+async def test_heartbeat():
+    subscriber = EventBus().subscribe(heartbeat=0.01)
+
+    assert await anext(subscriber) is None
+
+
+@pytest.mark.asyncio
+async def test_services_publish_events(test_session):
+    cursor = app_bus.last_id
+
+    scream = await service.create_scream(test_session, 999, 'Event scream')
+    await service.react_on_scream(test_session, scream.scream_id, 1, '👍')
+    await service.delete_scream(test_session, scream.scream_id)
+
+    events = app_bus.since(cursor)
+    assert [e.type for e in events] == [
+        'scream-created',
+        'reaction-changed',
+        'scream-deleted',
+    ]
+    assert events[0].data['text'] == 'Event scream'
+    assert events[1].data == {
+        'scream_id': scream.scream_id,
+        'reactions': {'👍': 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_stream_events_resumes_after_last_event_id():
+    cursor = app_bus.last_id
+    app_bus.publish('scream-deleted', {'scream_id': 1})
+    app_bus.publish('scream-deleted', {'scream_id': 2})
+
+    response = await stream_events(cursor=None, last_event_id=cursor + 1)
+    chunk = await anext(response.body_iterator)
+    await response.body_iterator.aclose()
+
+    assert response.media_type == 'text/event-stream'
+    assert chunk == (
+        f'id: {cursor + 2}\nevent: scream-deleted\n'
+        'data: {"scream_id": 2}\n\n'
+    )
@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.api.external.quickchart.quickchart import (
     QuickChart,
@@ -38,9 +39,9 @@ async def test_quickchart_init():
 
 @pytest.mark.asyncio
 async def test_chart(sample_chart):
-    mock_response = AsyncMock()
+    mock_response = MagicMock()
     mock_response.content = b'test_chart_data'
-    mock_response.raise_for_status = AsyncMock()
+    mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
     mock_client.post.return_value = mock_response
@@ -106,3 +107,14 @@ async def test_chart_model():
     assert chart.type == 'bar'
     assert chart.data.labels == ['Mon', 'Tue', 'Wed']
     assert chart.options == {'legend': {'display': False}}
+
+
+def test_url(sample_chart):
+    url = QuickChart().url(sample_chart)
+
+    base, query = url.split('?', 1)
+    params = parse_qs(query)
+
+    assert base == 'https://quickchart.io/chart'
+    assert Chart.model_validate_json(params['c'][0]) == sample_chart
+    assert params['bkg'] == ['white']
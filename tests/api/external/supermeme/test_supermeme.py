@@ -69,11 +69,11 @@ async def test_supermeme_init():
 
 @pytest.mark.asyncio
 async def test_search_meme_templates(sample_meme_template):
-    mock_response = AsyncMock()
-    mock_response.json = AsyncMock(
+    mock_response = MagicMock()
+    mock_response.json = MagicMock(
         return_value={'memeTemplates': [sample_meme_template.model_dump()]}
     )
-    mock_response.raise_for_status = AsyncMock()
+    mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
@@ -105,11 +105,11 @@ async def test_search_meme_templates(sample_meme_template):
 
 @pytest.mark.asyncio
 async def test_search_meme_templates_invalid_json():
-    mock_response = AsyncMock()
-    mock_response.json = AsyncMock(
+    mock_response = MagicMock()
+    mock_response.json = MagicMock(
         side_effect=json.JSONDecodeError('Invalid JSON', '', 0)
     )
-    mock_response.raise_for_status = AsyncMock()
+    mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
@@ -125,13 +125,13 @@ async def test_search_meme_templates_invalid_json():
 
 @pytest.mark.asyncio
 async def test_get_meme_template_props(sample_meme_template, sample_next_data):
-    mock_response = AsyncMock()
+    mock_response = MagicMock()
     mock_response.content = (
         b"<html><body><script id='__NEXT_DATA__'>"
         + json.dumps(sample_next_data).encode()
         + b'</script></body></html>'
     )
-    mock_response.raise_for_status = AsyncMock()
+    mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
@@ -165,9 +165,9 @@ async def test_get_meme_template_props(sample_meme_template, sample_next_data):
 
 @pytest.mark.asyncio
 async def test_get_meme_template_props_no_next_data():
-    mock_response = AsyncMock()
+    mock_response = MagicMock()
     mock_response.content = b'<html><body></body></html>'
-    mock_response.raise_for_status = AsyncMock()
+    mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
@@ -183,13 +183,13 @@ async def test_get_meme_template_props_no_next_data():
 
 @pytest.mark.asyncio
 async def test_get_meme_template_props_invalid_schema():
-    mock_response = AsyncMock()
+    mock_response = MagicMock()
     mock_response.content = (
         b'<html><body>'
         b'<script id=\'__NEXT_DATA__\'>{"props":{}}</script>'
         b'</body></html>'
     )
-    mock_response.raise_for_status = AsyncMock()
+    mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
@@ -208,6 +208,26 @@ async def test_get_meme_template_props_invalid_schema():
                 await supermeme.get_meme_template_props(MagicMock())
 
 
+@pytest.mark.asyncio
+async def test_get_meme_image(sample_meme_template_props):
+    mock_response = MagicMock()
+    mock_response.content = b'test_image_data'
+
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_response
+
+    with patch(
+        'src.api.external.supermeme.supermeme.AsyncClient',
+        return_value=mock_client,
+    ):
+        supermeme = Supermeme()
+        result = await supermeme.get_meme_image(sample_meme_template_props)
+
+    assert result == b'test_image_data'
+    mock_client.get.assert_called_once_with('https://example.com/meme.jpg')
+    mock_response.raise_for_status.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_caption_model():
     caption = Caption(
@@ -107,16 +107,20 @@ async def test_insert_text_on_image(sample_image):
 
 @pytest.mark.asyncio
 async def test_fetch_meme_image(sample_meme_template_props):
-    mock_response = MagicMock()
-    mock_response.content = b'test_image_data'
-    mock_response.raise_for_status = MagicMock()
+    mock_get_meme_image = AsyncMock(return_value=b'test_image_data')
 
-    with patch('src.api.memes.service.httpx.get', return_value=mock_response):
+    with patch.object(
+        service.supermeme, 'get_meme_image', mock_get_meme_image
+    ):
         with patch('src.api.memes.service.Image.open') as mock_open:
             mock_image = MagicMock()
             mock_open.return_value = mock_image
 
-            result = service.fetch_meme_image(sample_meme_template_props)
+            result = await service.fetch_meme_image(sample_meme_template_props)
+
+            mock_get_meme_image.assert_called_once_with(
+                sample_meme_template_props
+            )
 
             assert result is mock_image
             mock_image.thumbnail.assert_called_once_with(
@@ -146,7 +150,7 @@ async def test_generate_meme(sample_scream, sample_meme_template_props):
         sample_meme_template_props
     )
 
-    mock_fetch_image = MagicMock()
+    mock_fetch_image = AsyncMock()
     mock_image = MagicMock()
     mock_fetch_image.return_value = mock_image
 
@@ -157,9 +161,7 @@ async def test_generate_meme(sample_scream, sample_meme_template_props):
     mock_image2bytes.return_value = b'test_meme_data'
 
     with patch('src.api.memes.service.get_scream', mock_get_scream):
-        with patch(
-            'src.api.memes.service.Supermeme', return_value=mock_supermeme
-        ):
+        with patch('src.api.memes.service.supermeme', mock_supermeme):
             with patch(
                 'src.api.memes.service.fetch_meme_image', mock_fetch_image
             ):
@@ -0,0 +1,142 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api import models
+from src.api.screams import service
+from src.api.screams.buffer import ReactionBuffer
+from src.api.screams.exceptions import ScreamNotFound
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return async_sessionmaker(
+        test_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+
+@pytest.fixture
+def buffer(session_factory):
+    return ReactionBuffer(session_factory, flush_interval=60)
+
+
+async def stored_reactions(session_factory, scream_id):
+    async with session_factory() as session:
+        result = await session.execute(
+            select(models.Reaction.user_id, models.Reaction.reaction).where(
+                models.Reaction.scream_id == scream_id
+            )
+        )
+        return dict(result.tuples().all())
+
+
+@pytest.mark.asyncio
+async def test_react_answers_before_flush(
+    buffer, session_factory, sample_reaction
+):
+    scream_id = sample_reaction.scream_id
+
+    scream = await buffer.react(scream_id, 1, '👍')
+    scream = await buffer.react(scream_id, 2, '👎')
+
+    assert scream.reactions == {'👍': 2, '👎': 1}
+    assert buffer.pending == 2
+    assert await stored_reactions(session_factory, scream_id) == {456: '👍'}
+
+
+@pytest.mark.asyncio
+async def test_toggle_and_replace(buffer, session_factory, sample_reaction):
+    scream_id = sample_reaction.scream_id
+
+    await buffer.react(scream_id, 456, '👍')
+    scream = await buffer.react(scream_id, 1, '👍')
+    scream = await buffer.react(scream_id, 1, '🔥')
+
+    assert scream.reactions == {'🔥': 1}
+    assert await buffer.flush() == 2
+    assert buffer.pending == 0
+    assert await stored_reactions(session_factory, scream_id) == {1: '🔥'}
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_too_many_pending(session_factory, sample_scream):
+    buffer = ReactionBuffer(session_factory, flush_interval=60, max_pending=3)
+
+    for user_id in range(3):
+        await buffer.react(sample_scream.id, user_id, '👍')
+
+    assert buffer.pending == 0
+    assert len(await stored_reactions(session_factory, sample_scream.id)) == 3
+
+
+@pytest.mark.asyncio
+async def test_flushes_periodically_and_on_close(
+    session_factory, sample_scream
+):
+    buffer = ReactionBuffer(session_factory, flush_interval=0.01)
+    buffer.start()
+
+    await buffer.react(sample_scream.id, 1, '👍')
+    await asyncio.sleep(0.05)
+    assert await stored_reactions(session_factory, sample_scream.id) == {
+        1: '👍'
+    }
+
+    await buffer.react(sample_scream.id, 2, '👎')
+    await buffer.close()
+    assert await stored_reactions(session_factory, sample_scream.id) == {
+        1: '👍',
+        2: '👎',
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_reactions_pending(buffer, sample_scream):
+    await buffer.react(sample_scream.id, 1, '👍')
+
+    with patch.object(buffer, '_write', side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+
+    assert buffer.pending == 1
+    assert await buffer.flush() == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_scream(buffer):
+    with pytest.raises(ScreamNotFound):
+        await buffer.react(10**9, 1, '👍')
+
+
+@pytest.mark.asyncio
+async def test_service_overlays_buffered_reactions(
+    buffer, test_session, sample_scream
+):
+    with patch.object(service, 'reaction_buffer', buffer):
+        reacted = await service.react_on_scream(
+            test_session, sample_scream.id, 1, '👍'
+        )
+        scream = await service.get_scream(test_session, sample_scream.id)
+
+    assert reacted.reactions == {'👍': 1}
+    assert scream.reactions == {'👍': 1}
+    assert buffer.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_pending_counts_unwritten_users(buffer, sample_scream):
+    await buffer.react(sample_scream.id, 1, '👍')
+    await buffer.react(sample_scream.id, 1, '🔥')
+    await buffer.react(sample_scream.id, 2, '👍')
+    assert buffer.pending == 2
+
+    buffer.forget(sample_scream.id)
+    assert buffer.pending == 0
+
+    await buffer.react(sample_scream.id, 1, '👍')
+    assert buffer.pending == 1
+    assert await buffer.flush() == 1
+    assert buffer.pending == 0
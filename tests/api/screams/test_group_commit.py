@@ -0,0 +1,73 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.api.screams import service
+from src.api.screams.group_commit import GroupCommit
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return async_sessionmaker(
+        test_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_screams_share_commit(session_factory, test_session):
+    committer = GroupCommit(session_factory, window=0.01)
+
+    with patch.object(
+        committer, '_commit', wraps=committer._commit
+    ) as commit:
+        screams = await asyncio.gather(
+            *(committer.create(i, f'scream {i}') for i in range(5))
+        )
+
+    commit.assert_called_once()
+    assert [s.user_id for s in screams] == list(range(5))
+    assert len({s.scream_id for s in screams}) == 5
+    stored = await service.get_scream(test_session, screams[-1].scream_id)
+    assert stored.text == 'scream 4'
+
+
+@pytest.mark.asyncio
+async def test_full_batch_commits_immediately(session_factory):
+    committer = GroupCommit(session_factory, window=60, max_batch=2)
+
+    screams = await asyncio.wait_for(
+        asyncio.gather(committer.create(1, 'a'), committer.create(2, 'b')),
+        timeout=1,
+    )
+
+    assert [s.text for s in screams] == ['a', 'b']
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_fails_whole_batch(session_factory):
+    committer = GroupCommit(session_factory, window=0.01)
+
+    with patch(
+        'src.api.screams.group_commit.insert_screams',
+        side_effect=RuntimeError,
+    ):
+        results = await asyncio.gather(
+            committer.create(1, 'a'),
+            committer.create(2, 'b'),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_close_commits_open_batch(session_factory):
+    committer = GroupCommit(session_factory, window=60)
+
+    pending = asyncio.ensure_future(committer.create(1, 'a'))
+    await asyncio.sleep(0)
+    await committer.close()
+
+    assert (await pending).text == 'a'
@@ -0,0 +1,76 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api.database import get_read_session, get_write_session
+from src.api.screams import router
+
+
+@pytest.fixture
+def client(test_session):
+    async def fresh_session():
+        # Requests get sessions with nothing loaded yet
+        test_session.expunge_all()
+        yield test_session
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_read_session] = fresh_session
+    app.dependency_overrides[get_write_session] = fresh_session
+
+    return AsyncClient(transport=ASGITransport(app), base_url='http://test')
+
+
+@pytest.mark.asyncio
+async def test_get_scream_queries(client, max_queries, sample_reaction):
+    with max_queries(1):
+        response = await client.get(f'/screams/{sample_reaction.scream_id}')
+
+    assert response.json()['reactions'] == {'👍': 1}
+
+
+@pytest.mark.asyncio
+async def test_get_screams_queries(client, max_queries, sample_reaction):
+    with max_queries(1):
+        response = await client.get(
+            '/screams/', params={'page': 1, 'limit': 20}
+        )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_create_scream_queries(client, max_queries):
+    with max_queries(1):
+        response = await client.post(
+            '/screams/', json={'user_id': 1, 'text': 'budget'}
+        )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_react_on_scream_queries(client, max_queries, sample_scream):
+    # Scream, its reactions, the new reaction and the updated scream
+    with max_queries(4):
+        response = await client.post(
+            f'/screams/{sample_scream.id}/react',
+            json={
+                'scream_id': sample_scream.id,
+                'user_id': 2,
+                'reaction': '🔥',
+            },
+        )
+
+    assert response.json()['reactions'] == {'🔥': 1}
+
+
+@pytest.mark.asyncio
+async def test_delete_scream_queries(client, max_queries, sample_reaction):
+    # Scream, its reactions and deletes of both
+    with max_queries(4):
+        response = await client.delete(
+            f'/screams/{sample_reaction.scream_id}'
+        )
+
+    assert response.status_code == 200
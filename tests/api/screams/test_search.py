@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from api import models
+from src.api.screams import service
+from src.api.screams.exceptions import InvalidCursor
+from src.api.screams.search import (
+    decode_cursor,
+    encode_cursor,
+    search_terms,
+    select_search_hits,
+)
+
+
+def test_search_terms_drop_syntax():
+    assert search_terms('exam* OR "help" -me') == ['exam', 'OR', 'help', 'me']
+    assert search_terms('"*') == []
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(-1.25e-06, 42)) == (-1.25e-06, 42)
+
+    with pytest.raises(InvalidCursor):
+        decode_cursor('not a cursor')
+
+
+def test_postgresql_search_uses_index_expression():
+    hits = str(
+        select_search_hits(['exam'], 20, (-0.5, 3), 'postgresql').compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert "to_tsvector('simple'::regconfig, screams.text) @@" in hits
+    assert 'LIKE' not in hits
+
+
+@pytest.mark.asyncio
+async def test_search_screams_pages(test_session):
+    screams = [
+        models.Scream(user_id=1, text='quokka quokka quokka'),
+        models.Scream(user_id=2, text='a quokka ate my homework'),
+        models.Scream(user_id=3, text='Quokka and wombat'),
+        models.Scream(user_id=4, text='only a wombat'),
+    ]
+    test_session.add_all(screams)
+    await test_session.commit()
+
+    first = await service.search_screams(test_session, 'quokka', 2)
+    second = await service.search_screams(
+        test_session, 'quokka', 2, first.next_cursor
+    )
+
+    assert first.screams[0].scream_id == screams[0].id
+    assert {s.scream_id for s in first.screams + second.screams} == {
+        scream.id for scream in screams[:3]
+    }
+    assert second.next_cursor is None
+
+    both = await service.search_screams(test_session, 'wombat quokka', 10)
+    assert [s.scream_id for s in both.screams] == [screams[2].id]
+
+    await test_session.delete(screams[2])
+    await test_session.commit()
+    both = await service.search_screams(test_session, 'wombat quokka', 10)
+    assert both.screams == []
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_newest_candidates(test_session):
+    screams = [
+        models.Scream(user_id=1, text='platypus platypus platypus'),
+        models.Scream(user_id=1, text='one platypus among many other words'),
+    ]
+    test_session.add_all(screams)
+    await test_session.commit()
+
+    hits = await test_session.execute(
+        select_search_hits(
+            ['platypus'],
+            10,
+            dialect=test_session.bind.dialect.name,
+            candidates=1,
+        )
+    )
+
+    assert [row.id for row in hits] == [screams[1].id]
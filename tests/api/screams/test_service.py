@@ -59,3 +59,78 @@
 # @pytest.mark.skip(reason="Test disabled due to implementation changes")
 # def test_react_on_scream_not_found():
 #     pass
+
+
+import pytest  # noqa: E402
+from types import SimpleNamespace  # noqa: E402
+from datetime import datetime  # noqa: E402
+
+from src.api.screams import service  # noqa: E402
+from src.api.screams.exceptions import ScreamNotFound  # noqa: E402
+
+
+def test_scream_rows2schemas():
+    created_at = datetime(2025, 1, 1)
+    rows = [
+        SimpleNamespace(
+            id=2,
+            user_id=1,
+            text='b',
+            created_at=created_at,
+            reaction='👍',
+            count=3,
+        ),
+        SimpleNamespace(
+            id=2,
+            user_id=1,
+            text='b',
+            created_at=created_at,
+            reaction='👎',
+            count=1,
+        ),
+        SimpleNamespace(
+            id=1,
+            user_id=1,
+            text='a',
+            created_at=created_at,
+            reaction=None,
+            count=0,
+        ),
+    ]
+
+    screams = service.scream_rows2schemas(rows)
+
+    assert [s.scream_id for s in screams] == [2, 1]
+    assert screams[0].reactions == {'👍': 3, '👎': 1}
+    assert screams[1].reactions == {}
+
+
+@pytest.mark.asyncio
+async def test_get_scream_core(test_session, sample_reaction):
+    scream = await service.get_scream(test_session, sample_reaction.scream_id)
+
+    assert scream.scream_id == sample_reaction.scream_id
+    assert scream.reactions == {'👍': 1}
+
+
+@pytest.mark.asyncio
+async def test_get_scream_core_not_found(test_session):
+    with pytest.raises(ScreamNotFound):
+        await service.get_scream(test_session, 10**9)
+
+
+@pytest.mark.asyncio
+async def test_create_screams(test_session):
+    screams = await service.create_screams(
+        test_session,
+        [
+            service.schemas.ScreamCreate(user_id=1, text='first'),
+            service.schemas.ScreamCreate(user_id=2, text='second'),
+        ],
+    )
+
+    assert [s.text for s in screams] == ['first', 'second']
+    assert screams[1].scream_id > screams[0].scream_id
+    assert all(s.reactions == {} for s in screams)
+    stored = await service.get_scream(test_session, screams[1].scream_id)
+    assert stored == screams[1]
@@ -0,0 +1,48 @@
+import pytest
+
+from src.api.subscribers import service
+
+
+@pytest.mark.asyncio
+async def test_add_subscriber_is_idempotent(test_session):
+    await service.add_subscriber(test_session, 1001)
+    await service.add_subscriber(test_session, 1001)
+
+    assert await service.get_subscribers(test_session, 1000, 10) == [1001]
+
+
+@pytest.mark.asyncio
+async def test_remove_subscriber(test_session):
+    await service.add_subscriber(test_session, 2001)
+    await service.remove_subscriber(test_session, 2001)
+    await service.remove_subscriber(test_session, 2001)
+
+    assert await service.get_subscribers(test_session, 2000, 10) == []
+
+
+@pytest.mark.asyncio
+async def test_get_subscribers_pages(test_session):
+    for chat_id in range(3001, 3006):
+        await service.add_subscriber(test_session, chat_id)
+
+    first = await service.get_subscribers(test_session, 3000, 2)
+    second = await service.get_subscribers(test_session, first[-1], 2)
+    last = await service.get_subscribers(test_session, 3004, 10)
+
+    assert first == [3001, 3002]
+    assert second == [3003, 3004]
+    assert last == [3005]
+
+
+@pytest.mark.asyncio
+async def test_get_subscribers_shards(test_session):
+    for chat_id in range(4001, 4007):
+        await service.add_subscriber(test_session, chat_id)
+
+    shards = [
+        await service.get_subscribers(test_session, 4000, 10, shard, 2)
+        for shard in range(2)
+    ]
+
+    assert [c for c in shards[0] if c < 4007] == [4002, 4004, 4006]
+    assert [c for c in shards[1] if c < 4007] == [4001, 4003, 4005]
@@ -0,0 +1,65 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from src.api.compression import CompressionMiddleware, negotiate_encoding
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get('/big')
+    def big():
+        return [{'text': 'scream', 'reactions': {'👍': 1}}] * 50
+
+    @app.get('/small')
+    def small():
+        return {'ok': True}
+
+    @app.get('/image')
+    def image():
+        return Response(content=b'\x89PNG' * 100, media_type='image/png')
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    'header, expected',
+    [
+        ('gzip, br, zstd', 'zstd'),
+        ('gzip, br', 'br'),
+        ('gzip;q=0.5, br;q=0', 'gzip'),
+        ('*', 'zstd'),
+        ('identity', None),
+        ('', None),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header, ['zstd', 'br', 'gzip']) == expected
+
+
+@pytest.mark.parametrize('encoding', ['gzip', 'br', 'zstd'])
+def test_compresses_large_json(client, encoding):
+    response = client.get('/big', headers={'Accept-Encoding': encoding})
+
+    assert response.headers['content-encoding'] == encoding
+    assert 'Accept-Encoding' in response.headers['vary']
+    assert int(response.headers['content-length']) < len(response.content)
+    assert response.json()[0]['text'] == 'scream'
+
+
+def test_skips_small_body(client):
+    response = client.get('/small', headers={'Accept-Encoding': 'gzip'})
+
+    assert 'content-encoding' not in response.headers
+    assert response.json() == {'ok': True}
+
+
+def test_skips_images(client):
+    response = client.get('/image', headers={'Accept-Encoding': 'gzip'})
+
+    assert 'content-encoding' not in response.headers
+    assert response.content == b'\x89PNG' * 100
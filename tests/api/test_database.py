@@ -1,7 +1,23 @@
+from unittest.mock import MagicMock, patch
+
 import pytest
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.database import get_async_session, Base, engine
+from src.api import database
+from src.api.database import (
+    get_async_session,
+    get_read_session,
+    get_write_session,
+    Base,
+    engine,
+    create_read_engine,
+    create_write_engine,
+    write,
+)
+from src.api.replicas import RecentWriters
 
 
 @pytest.mark.asyncio
@@ -11,6 +27,13 @@ async def test_get_async_session():
         break
 
 
+@pytest.mark.asyncio
+async def test_get_write_session():
+    async for session in get_write_session():
+        assert isinstance(session, AsyncSession)
+        break
+
+
 @pytest.mark.asyncio
 async def test_create_tables():
     async with engine.begin() as conn:
@@ -18,3 +41,72 @@ async def test_create_tables():
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest.mark.asyncio
+async def test_write_without_writer_uses_session(test_session):
+    async def operation(session, value, *, twice):
+        assert session is test_session
+        return value * 2 if twice else value
+
+    assert await write(test_session, operation, 21, twice=True) == 42
+
+
+@pytest.mark.asyncio
+async def test_read_engine_is_read_only(tmp_path):
+    url = f'sqlite+aiosqlite:///{tmp_path / "test.db"}'
+    write_engine = create_write_engine(url)
+    read_engine = create_read_engine(url, pool_size=2)
+
+    async with write_engine.begin() as conn:
+        await conn.execute(text('CREATE TABLE t (x INTEGER)'))
+        await conn.execute(text('INSERT INTO t VALUES (1)'))
+        mode = await conn.scalar(text('PRAGMA journal_mode'))
+
+    async with read_engine.connect() as conn:
+        assert await conn.scalar(text('SELECT x FROM t')) == 1
+        with pytest.raises(OperationalError, match='readonly'):
+            await conn.execute(text('INSERT INTO t VALUES (2)'))
+
+    assert mode == 'wal'
+    await write_engine.dispose()
+    await read_engine.dispose()
+
+
+def make_request(path_params=None, headers=None):
+    return Request(
+        {
+            'type': 'http',
+            'path_params': path_params or {},
+            'headers': [
+                (name.lower().encode(), value.encode())
+                for name, value in (headers or {}).items()
+            ],
+        }
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'path_params, headers',
+    [({'user_id': '7'}, None), (None, {'X-User-Id': '7'})],
+)
+async def test_read_session_sticks_to_primary_after_write(
+    path_params, headers
+):
+    request = make_request(path_params, headers)
+    replica = MagicMock()
+
+    with (
+        patch.object(database, 'recent_writers', RecentWriters()),
+        patch.object(database.replicas, 'session', replica),
+    ):
+        async for _ in get_read_session(request):
+            break
+        replica.assert_called_once()
+
+        database.recent_writers.mark(7)
+        replica.reset_mock()
+        async for _ in get_read_session(request):
+            break
+        replica.assert_not_called()
@@ -0,0 +1,162 @@
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.metrics import (
+    MetricsMiddleware,
+    MetricsTransport,
+    instrument_engine,
+    registry,
+    router,
+    statement_kind,
+)
+
+
+def sample(name: str, **labels) -> float:
+    return registry.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(router)
+
+    @app.get('/screams/{scream_id}')
+    def get_scream(scream_id: int):
+        if scream_id == 0:
+            raise HTTPException(status_code=404)
+        return {'scream_id': scream_id}
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    'statement, kind',
+    [
+        ('SELECT 1', 'SELECT'),
+        ('\n  insert into screams VALUES (1)', 'INSERT'),
+        ('WITH t AS (SELECT 1) SELECT * FROM t', 'WITH'),
+        ('PRAGMA journal_mode = WAL', 'OTHER'),
+        ('', 'OTHER'),
+    ],
+)
+def test_statement_kind(statement, kind):
+    assert statement_kind(statement) == kind
+
+
+def test_request_duration_by_route(client):
+    labels = {'method': 'GET', 'route': '/screams/{scream_id}'}
+    ok = sample('http_request_duration_seconds_count', **labels, status='200')
+    missing = sample(
+        'http_request_duration_seconds_count', **labels, status='404'
+    )
+    unmatched = sample(
+        'http_request_duration_seconds_count',
+        method='GET',
+        route='unmatched',
+        status='404',
+    )
+
+    client.get('/screams/1')
+    client.get('/screams/2')
+    client.get('/screams/0')
+    client.get('/unknown')
+
+    assert sample(
+        'http_request_duration_seconds_count', **labels, status='200'
+    ) == ok + 2
+    assert sample(
+        'http_request_duration_seconds_count', **labels, status='404'
+    ) == missing + 1
+    assert sample(
+        'http_request_duration_seconds_count',
+        method='GET',
+        route='unmatched',
+        status='404',
+    ) == unmatched + 1
+    assert sample('http_requests_in_flight', method='GET') == 0
+
+
+def test_metrics_endpoint(client):
+    client.get('/screams/1')
+
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+    assert 'http_request_duration_seconds_bucket{' in response.text
+    assert 'process_cpu_seconds_total' in response.text
+
+
+@pytest.mark.asyncio
+async def test_instrument_engine(tmp_path):
+    engine = create_async_engine(
+        f'sqlite+aiosqlite:///{tmp_path / "metrics.db"}'
+    )
+    instrument_engine(engine, 'test')
+    instrument_engine(engine, 'test')
+
+    async with engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+        await conn.execute(text('SELECT 2'))
+        assert sample('db_pool_checked_out_connections', engine='test') == 1
+        with pytest.raises(OperationalError):
+            await conn.execute(text('SELECT * FROM missing'))
+
+    assert sample(
+        'db_query_duration_seconds_count', engine='test', statement='SELECT'
+    ) == 2
+    assert sample(
+        'db_query_errors_total', engine='test', statement='SELECT'
+    ) == 1
+    checkouts = sample(
+        'db_pool_checkout_duration_seconds_count', engine='test'
+    )
+    assert checkouts == 1
+    assert sample('db_pool_checked_out_connections', engine='test') == 0
+
+    await engine.dispose()
+    async with engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+    await engine.dispose()
+
+    checkouts = sample(
+        'db_pool_checkout_duration_seconds_count', engine='test'
+    )
+    assert checkouts == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_transport():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == '/down':
+            raise httpx.ConnectError('down', request=request)
+        return httpx.Response(200, content=b'chart')
+
+    client = httpx.AsyncClient(
+        base_url='http://quickchart',
+        transport=MetricsTransport('stub', httpx.MockTransport(handler)),
+    )
+
+    assert (await client.post('/chart')).content == b'chart'
+    with pytest.raises(httpx.ConnectError):
+        await client.get('/down')
+    await client.aclose()
+
+    assert sample(
+        'external_request_duration_seconds_count',
+        service='stub',
+        method='POST',
+        status='200',
+    ) == 1
+    assert sample(
+        'external_request_duration_seconds_count',
+        service='stub',
+        method='GET',
+        status='error',
+    ) == 1
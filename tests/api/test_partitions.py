@@ -0,0 +1,70 @@
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from src.api.partitions import (
+    PartitionRoute,
+    add_months,
+    month_key,
+    months_between,
+    route_period,
+    select_reactions,
+    select_screams,
+)
+
+MSK = timezone(timedelta(hours=3))
+
+
+def test_month_key_uses_analytics_timezone():
+    assert month_key(datetime(2025, 4, 30, 22, 0, tzinfo=timezone.utc)) == (
+        202505
+    )
+    assert month_key(datetime(2025, 5, 1, 1, 0, tzinfo=MSK)) == 202505
+    assert month_key(datetime(2025, 4, 30, 22, 0)) == 202504
+    assert month_key(date(2025, 5, 1)) == 202505
+
+
+def test_add_months():
+    assert add_months(202511, 1) == 202512
+    assert add_months(202512, 1) == 202601
+    assert add_months(202501, -1) == 202412
+    assert add_months(202503, -15) == 202312
+
+
+def test_months_between():
+    assert months_between(
+        datetime(2024, 11, 20, tzinfo=timezone.utc),
+        datetime(2025, 2, 1, tzinfo=timezone.utc),
+    ) == [202411, 202412, 202501, 202502]
+
+
+def test_route_period():
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2025, 12, 31, tzinfo=timezone.utc)
+
+    assert route_period([], start, end) == PartitionRoute()
+    assert route_period([202412, 202501, 202502], start, end) == (
+        PartitionRoute(live=True, archived=(202501, 202502))
+    )
+    assert route_period(
+        [202501, 202502], start, datetime(2025, 2, 28, tzinfo=timezone.utc)
+    ) == PartitionRoute(live=False, archived=(202501, 202502))
+
+
+def test_select_live_only():
+    assert select_screams().name == 'screams'
+    assert 'archived' not in str(select_reactions())
+
+
+def test_select_archived_only():
+    route = PartitionRoute(live=False, archived=(202501,))
+
+    screams = str(
+        select_screams(route)
+        .select()
+        .compile(dialect=postgresql.dialect())
+    )
+
+    assert 'archived_screams' in screams
+    assert 'UNION ALL' not in screams
+    assert 'FROM reactions' not in str(select_reactions(route).select())
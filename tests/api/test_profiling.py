@@ -0,0 +1,108 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.profiling import (
+    QueryProfile,
+    QueryProfilerMiddleware,
+    profile_engine,
+    profile_queries,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(
+        f'sqlite+aiosqlite:///{tmp_path / "profiling.db"}'
+    )
+    profile_engine(engine)
+    profile_engine(engine)
+
+    yield engine
+
+    await engine.dispose()
+
+
+def profiled_client(engine, slow_ms, duplicate_threshold) -> AsyncClient:
+    app = FastAPI()
+    app.add_middleware(
+        QueryProfilerMiddleware,
+        slow_ms=slow_ms,
+        duplicate_threshold=duplicate_threshold,
+    )
+
+    @app.get('/screams')
+    async def get_screams(n: int):
+        async with engine.connect() as conn:
+            for scream_id in range(n):
+                await conn.execute(text('SELECT :id'), {'id': scream_id})
+        return []
+
+    return AsyncClient(transport=ASGITransport(app), base_url='http://test')
+
+
+def test_query_profile():
+    profile = QueryProfile()
+
+    profile.record('SELECT *\n  FROM screams WHERE id = ?', 0.002)
+    profile.record('SELECT * FROM screams WHERE id = ?', 0.003)
+    profile.record('SELECT * FROM reactions', 0.001)
+
+    assert profile.count == 3
+    assert profile.seconds == pytest.approx(0.006)
+    assert list(profile.duplicates()) == ['SELECT * FROM screams WHERE id = ?']
+    assert profile.report().splitlines() == [
+        '    2x      5.00 ms  SELECT * FROM screams WHERE id = ?',
+        '    1x      1.00 ms  SELECT * FROM reactions',
+    ]
+    assert profile.report(limit=1).splitlines()[-1] == 'and 1 more statements'
+
+
+@pytest.mark.asyncio
+async def test_profile_queries(engine):
+    async with engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+        with profile_queries() as profile:
+            await conn.execute(text('SELECT 2'))
+            await conn.execute(text('SELECT 2'))
+            with pytest.raises(Exception):
+                await conn.execute(text('SELECT * FROM missing'))
+        await conn.execute(text('SELECT 3'))
+
+    assert {s: st.count for s, st in profile.statements.items()} == {
+        'SELECT 2': 2,
+        'SELECT * FROM missing': 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_middleware_logs_repeated_statements(engine, caplog):
+    client = profiled_client(engine, slow_ms=1000, duplicate_threshold=3)
+
+    with caplog.at_level(logging.WARNING, logger='src.api.profiling'):
+        await client.get('/screams', params={'n': 2})
+        assert not caplog.records
+
+        await client.get('/screams', params={'n': 3})
+
+    [record] = caplog.records
+    assert record.getMessage().startswith('GET /screams 200 took')
+    assert '3 queries' in record.getMessage()
+    assert 'N+1' in record.getMessage()
+    assert '3x' in record.getMessage()
+
+
+@pytest.mark.asyncio
+async def test_middleware_logs_slow_requests(engine, caplog):
+    client = profiled_client(engine, slow_ms=0, duplicate_threshold=3)
+
+    with caplog.at_level(logging.WARNING, logger='src.api.profiling'):
+        await client.get('/screams', params={'n': 1})
+
+    [record] = caplog.records
+    assert '1 queries' in record.getMessage()
+    assert 'N+1' not in record.getMessage()
@@ -0,0 +1,71 @@
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api import database
+from api.analytics import router as analytics_router
+from api.database import get_read_session, get_write_session
+from api.replicas import RecentWriters
+from api.screams import router as screams_router
+from api.screams import routes as screams_routes
+from src.bot.services.innoscream import InnoScreamAPI
+from src.bot.services.innoscream.client import user_headers
+
+
+@pytest.fixture
+def replica(test_session):
+    @asynccontextmanager
+    async def open_session():
+        yield test_session
+
+    replica = MagicMock(side_effect=open_session)
+    recent_writers = RecentWriters()
+    with (
+        patch.object(database, 'recent_writers', recent_writers),
+        patch.object(screams_routes, 'recent_writers', recent_writers),
+        patch.object(database, 'ReadSessionLocal', open_session),
+        patch.object(database.replicas, 'session', replica),
+    ):
+        yield replica
+
+
+@pytest.fixture
+def api(test_session):
+    async def write_session():
+        yield test_session
+
+    app = FastAPI()
+    app.include_router(screams_router)
+    app.include_router(analytics_router)
+    app.dependency_overrides[get_write_session] = write_session
+
+    @app.get('/replicated')
+    async def replicated(session: AsyncSession = Depends(get_read_session)):
+        return None
+
+    api = InnoScreamAPI(base_url='http://test')
+    api.client = AsyncClient(
+        transport=ASGITransport(app),
+        base_url='http://test',
+        follow_redirects=True,
+    )
+    return api
+
+
+@pytest.mark.asyncio
+async def test_bot_reads_stick_to_primary_after_write(api, replica):
+    await api.get_stats(7)
+    await api.client.get('/replicated', headers=user_headers(7))
+    assert replica.call_count == 2
+
+    await api.create_scream(7, 'Test scream')
+    replica.reset_mock()
+
+    await api.get_stats(7)
+    await api.client.get('/replicated', headers=user_headers(7))
+    await api.client.get('/replicated', headers=user_headers(8))
+    assert replica.call_count == 1
@@ -0,0 +1,73 @@
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from src.api.replicas import ReadReplicas, RecentWriters
+
+
+def make_factory(name):
+    @asynccontextmanager
+    async def factory():
+        yield name
+
+    return factory
+
+
+def test_round_robin():
+    replicas = ReadReplicas([make_factory('a'), make_factory('b')])
+
+    assert [replicas.choose() for _ in range(4)] == [0, 1, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_least_busy_prefers_idle_replica():
+    replicas = ReadReplicas(
+        [make_factory('a'), make_factory('b'), make_factory('c')],
+        policy='least-busy',
+    )
+
+    async with replicas.session() as first:
+        async with replicas.session() as second:
+            assert replicas.busy == [1, 0, 1]
+            assert replicas.choose() == 1
+        assert (first, second) == ('a', 'c')
+
+    assert replicas.busy == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_session_releases_replica_on_error():
+    replicas = ReadReplicas([make_factory('a')], policy='least-busy')
+
+    with pytest.raises(RuntimeError):
+        async with replicas.session():
+            raise RuntimeError
+
+    assert replicas.busy == [0]
+
+
+def test_recent_writers_window():
+    writers = RecentWriters(window=5)
+
+    with patch('src.api.replicas.monotonic', return_value=100):
+        writers.mark(1)
+        assert writers.recent(1)
+        assert writers.recent('1')
+        assert not writers.recent(2)
+
+    with patch('src.api.replicas.monotonic', return_value=105):
+        assert not writers.recent(1)
+        writers.mark(2)
+
+    assert list(writers._until) == ['2']
+
+
+def test_recent_writers_bounded():
+    writers = RecentWriters(window=60, max_users=2)
+
+    for user_id in range(3):
+        writers.mark(user_id)
+
+    assert not writers.recent(0)
+    assert writers.recent(1) and writers.recent(2)
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.api.writer import DatabaseWriter
+
+
+@pytest.fixture
+async def writer(test_engine):
+    writer = DatabaseWriter(
+        async_sessionmaker(
+            test_engine, class_=AsyncSession, expire_on_commit=False
+        )
+    )
+    yield writer
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_runs_writes_one_at_a_time_in_order(writer):
+    running = 0
+    order = []
+
+    async def operation(session, i):
+        nonlocal running
+        running += 1
+        assert running == 1
+        await asyncio.sleep(0)
+        order.append(i)
+        running -= 1
+        return i
+
+    results = await asyncio.gather(
+        *(writer.run(operation, i) for i in range(5))
+    )
+
+    assert results == order == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_failed_write_does_not_stop_writer(writer):
+    async def fail(session):
+        raise RuntimeError
+
+    async def succeed(session):
+        return 'ok'
+
+    with pytest.raises(RuntimeError):
+        await writer.run(fail)
+
+    assert await writer.run(succeed) == 'ok'
+
+
+@pytest.mark.asyncio
+async def test_cancelled_write_releases_writer(writer):
+    release = asyncio.Event()
+
+    async def hold(session):
+        await release.wait()
+
+    holder = asyncio.create_task(writer.run(hold))
+    waiting = asyncio.create_task(writer.run(hold))
+    await asyncio.sleep(0.01)
+    waiting.cancel()
+    release.set()
+    await holder
+
+    async def succeed(session):
+        return 'ok'
+
+    assert await asyncio.wait_for(writer.run(succeed), timeout=1) == 'ok'
+    assert writer.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_close_runs_queued_writes(writer):
+    done = []
+
+    async def operation(session, i):
+        await asyncio.sleep(0)
+        done.append(i)
+
+    pending = [
+        asyncio.create_task(writer.run(operation, i)) for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    await writer.close()
+
+    assert done == [0, 1, 2]
+    await asyncio.gather(*pending)
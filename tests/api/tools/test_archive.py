@@ -0,0 +1,173 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from api import models
+from api.database import Base
+from api.localtime import TIMEZONE
+from src.api.analytics import service as analytics
+from src.api.screams import service as screams
+from src.api.screams.exceptions import ScreamNotFound
+from src.api.tools.archive import archive
+
+NOW = datetime(2025, 6, 15, 9, 0, tzinfo=timezone.utc)
+TODAY = datetime(2025, 6, 15, tzinfo=TIMEZONE)
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(
+        f'sqlite+aiosqlite:///{tmp_path / "archive.db"}'
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def history(session_factory):
+    async with session_factory() as session:
+        january, march, june = (
+            models.Scream(
+                user_id=1,
+                text=f'scream {month}',
+                created_at=datetime(2025, month, 10, 12, tzinfo=timezone.utc),
+            )
+            for month in (1, 3, 6)
+        )
+        session.add_all([january, march, june])
+        await session.flush()
+        session.add_all(
+            [
+                models.Reaction(user_id=2, scream_id=march.id, reaction='👍'),
+                models.Reaction(user_id=3, scream_id=march.id, reaction='👍'),
+                models.Reaction(user_id=4, scream_id=march.id, reaction='🔥'),
+                models.Reaction(user_id=2, scream_id=june.id, reaction='👍'),
+            ]
+        )
+        await session.commit()
+
+    return january, march, june
+
+
+async def count(session, model) -> int:
+    return await session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_old_months(session_factory, history):
+    january, march, june = history
+
+    partitions = await archive(session_factory, keep_months=3, now=NOW)
+
+    assert [p.month for p in partitions] == [202501, 202502, 202503]
+    assert [(p.screams, p.reactions) for p in partitions] == [
+        (1, 0),
+        (0, 0),
+        (1, 3),
+    ]
+
+    async with session_factory() as session:
+        assert await count(session, models.Scream) == 1
+        assert await count(session, models.Reaction) == 1
+        assert await count(session, models.ArchivedScream) == 2
+
+        archived = await session.get(models.ArchivedScream, march.id)
+        assert (archived.month, archived.votes) == (202503, 3)
+
+        scream = await screams.get_scream(session, march.id)
+        assert scream.text == 'scream 3'
+        assert scream.reactions == {'👍': 2, '🔥': 1}
+
+    assert await archive(session_factory, keep_months=3, now=NOW) == []
+
+
+@pytest.mark.asyncio
+async def test_archive_by_local_month(session_factory):
+    # 01:00 of April 1 in the analytics timezone
+    async with session_factory() as session:
+        scream = models.Scream(
+            user_id=1,
+            text='april fools',
+            created_at=datetime(2025, 3, 31, 22, tzinfo=timezone.utc),
+        )
+        session.add(scream)
+        await session.flush()
+        session.add(
+            models.Reaction(user_id=2, scream_id=scream.id, reaction='👍')
+        )
+        await session.commit()
+
+    assert await archive(session_factory, keep_months=3, now=NOW) == []
+
+    [partition] = await archive(session_factory, keep_months=2, now=NOW)
+    assert (partition.month, partition.screams) == (202504, 1)
+
+    april = datetime(2025, 4, 15, tzinfo=TIMEZONE)
+    async with session_factory() as session:
+        with patch.object(analytics, 'get_graph_today', return_value=april):
+            monthly = await analytics.get_most_voted(session, 'month')
+
+    assert monthly.text == 'april fools'
+
+
+@pytest.mark.asyncio
+async def test_archived_screams_leave_list_and_reactions(
+    session_factory, history
+):
+    january, march, june = history
+
+    await archive(session_factory, keep_months=3, now=NOW)
+
+    async with session_factory() as session:
+        page = await screams.get_screams(session, page=1, limit=10)
+        assert [scream.scream_id for scream in page] == [june.id]
+
+        with pytest.raises(ScreamNotFound):
+            await screams.react_on_scream(session, march.id, 5, '👍')
+
+        scream = await screams.get_scream(session, march.id)
+        assert scream.reactions == {'👍': 2, '🔥': 1}
+
+
+@pytest.mark.asyncio
+async def test_analytics_read_archive(session_factory, history):
+    async with session_factory() as session:
+        stats_before = await analytics.get_stats(session, 1)
+
+    await archive(session_factory, keep_months=1, now=NOW)
+
+    async with session_factory() as session:
+        assert await analytics.get_stats(session, 1) == stats_before
+        assert stats_before.screams_count == 3
+        assert stats_before.reactions_count == {'👍': 3, '🔥': 1}
+
+        stats, bars = await analytics.get_stats_and_bars(
+            session,
+            1,
+            'year',
+            TODAY,
+            [202501, 202502, 202503, 202504, 202505],
+        )
+        assert stats == stats_before
+        assert bars == {1: 1, 3: 1, 6: 1}
+
+        with patch.object(analytics, 'get_graph_today', return_value=TODAY):
+            yearly = await analytics.get_most_voted(session, 'year')
+            monthly = await analytics.get_most_voted(session, 'month')
+
+    assert yearly.scream_id == history[1].id
+    assert yearly.reactions == {'👍': 2, '🔥': 1}
+    assert monthly.scream_id == history[2].id
@@ -0,0 +1,103 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from api import models
+from api.database import Base
+from src.api.tools.seed import SeedPlan, generate, growth_quantile, seed
+
+END = datetime(2025, 6, 15, 9, 0, tzinfo=timezone.utc)
+
+PLAN = SeedPlan(
+    screams=250,
+    end=END,
+    days=30,
+    growth=4,
+    users=20,
+    user_exponent=1.2,
+    reactions=2,
+    reaction_weights=(('👍', 1), ('🔥', 0)),
+    subscribers=15,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "seed.db"}')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+def test_growth_quantile():
+    assert growth_quantile(0, 4) == 0
+    assert growth_quantile(1, 4) == pytest.approx(1)
+    assert growth_quantile(0.5, 1) == 0.5
+    # Twice as many screams at the end means fewer in the first half
+    assert growth_quantile(5 / 12, 2) == pytest.approx(0.5)
+
+
+def test_generate_batches():
+    batches = list(generate(PLAN, first_id=7, batch_size=100))
+
+    assert [len(b.screams) for b in batches] == [100, 100, 50]
+    screams = [s for b in batches for s in b.screams]
+    reactions = [r for b in batches for r in b.reactions]
+    assert [s['id'] for s in screams] == list(range(7, 257))
+    times = [s['created_at'] for s in screams]
+    assert times == sorted(times)
+    assert END - timedelta(days=30) <= times[0] and times[-1] <= END
+    # Rate grows 4 times, so most screams are in the second half
+    middle = END - timedelta(days=15)
+    assert sum(t > middle for t in times) > 0.6 * len(times)
+    # Zipf activity makes the first user the most active one
+    users = Counter(s['user_id'] for s in screams)
+    assert users.most_common(1)[0][0] == 0
+    assert {r['reaction'] for r in reactions} == {'👍'}
+    assert all(r['created_at'] <= END for r in reactions)
+    assert len({(r['user_id'], r['scream_id']) for r in reactions}) == len(
+        reactions
+    )
+
+
+def test_generate_is_deterministic():
+    assert list(generate(PLAN)) == list(generate(PLAN))
+    assert list(generate(PLAN)) != list(generate(PLAN._replace(seed=1)))
+
+
+@pytest.mark.asyncio
+async def test_seed(engine):
+    screams, reactions = await seed(engine, PLAN, batch_size=100)
+    await seed(engine, PLAN._replace(seed=1), batch_size=100)
+
+    async with engine.connect() as conn:
+        ids = (
+            await conn.scalars(
+                select(models.Scream.id).order_by(models.Scream.id)
+            )
+        ).all()
+        local_dates = await conn.scalar(
+            select(func.count(models.Scream.local_date))
+        )
+        seeded_reactions = await conn.scalar(
+            select(func.count()).select_from(models.Reaction)
+        )
+        chat_ids = (
+            await conn.scalars(
+                select(models.Subscriber.chat_id).order_by(
+                    models.Subscriber.chat_id
+                )
+            )
+        ).all()
+
+    assert screams == 250
+    assert ids == list(range(1, 501))
+    assert local_dates == 500
+    assert reactions < seeded_reactions
+    assert chat_ids == list(range(1, 31))
@@ -0,0 +1,111 @@
+"""Broadcast benchmark over synthetic subscribers.
+
+Compares the old delivery loop (in-memory set, one awaited send after
+another) with `Broadcaster` fed by subscribers streamed page by page,
+as the bot does with the subscribers API.
+
+Usage:
+    python -m tests.benchmarks.broadcast --subscribers 100000
+"""
+
+import argparse
+import asyncio
+import tracemalloc
+from time import perf_counter
+
+from src.bot.delivery import Broadcaster, RateLimiter
+
+
+async def fake_send(chat_id: int, latency: float) -> int:
+    await asyncio.sleep(latency)
+    return chat_id
+
+
+async def paged_subscribers(total: int, page_size: int, latency: float):
+    after = 0
+    while after < total:
+        await asyncio.sleep(latency)
+        page = range(after + 1, min(after + page_size, total) + 1)
+        for chat_id in page:
+            yield chat_id
+        after = page[-1]
+
+
+async def bench_loop(args) -> tuple[float, int, int]:
+    subscribers = set(range(1, args.subscribers + 1))
+    sample = list(subscribers)[: args.loop_sample]
+
+    start = perf_counter()
+    for sub in sample:
+        await fake_send(sub, args.send_latency)
+    elapsed = perf_counter() - start
+
+    return elapsed * args.subscribers / len(sample), len(sample), 0
+
+
+async def bench_broadcaster(args) -> tuple[float, int, int]:
+    broadcaster = Broadcaster(
+        RateLimiter(rate=args.rate, chat_rate=args.rate),
+        workers=args.workers,
+        queue_size=args.queue_size,
+    )
+
+    start = perf_counter()
+    stats = await broadcaster.broadcast(
+        paged_subscribers(args.subscribers, args.page_size, args.page_latency),
+        lambda chat_id: fake_send(chat_id, args.send_latency),
+    ).wait()
+    elapsed = perf_counter() - start
+
+    await broadcaster.close()
+    return elapsed, stats.sent, stats.failed
+
+
+async def measure(bench, args) -> tuple[float, int, int, float]:
+    tracemalloc.start()
+    elapsed, sent, failed = await bench(args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, sent, failed, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--subscribers', type=int, default=100_000)
+    parser.add_argument('--workers', type=int, default=64)
+    parser.add_argument('--queue-size', type=int, default=1000)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--page-latency', type=float, default=0.005)
+    parser.add_argument('--send-latency', type=float, default=0.002)
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=1e9,
+        help='messages per second, use 25 for Telegram-like limits',
+    )
+    parser.add_argument(
+        '--loop-sample',
+        type=int,
+        default=2000,
+        help='deliveries timed for the sequential loop (extrapolated)',
+    )
+    args = parser.parse_args()
+
+    loop = asyncio.run(measure(bench_loop, args))
+    pool = asyncio.run(measure(bench_broadcaster, args))
+
+    print(f'{args.subscribers} subscribers, send latency {args.send_latency}s')
+    print(
+        f'sequential loop: {loop[0]:8.2f}s '
+        f'({args.subscribers / loop[0]:8.0f} msg/s, '
+        f'extrapolated from {loop[1]}), peak {loop[3]:6.1f} MiB'
+    )
+    print(
+        f'broadcaster:     {pool[0]:8.2f}s '
+        f'({pool[1] / pool[0]:8.0f} msg/s, {pool[1]} sent, '
+        f'{pool[2]} failed), peak {pool[3]:6.1f} MiB'
+    )
+
+
+if __name__ == '__main__':
+    main()
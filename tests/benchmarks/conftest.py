@@ -0,0 +1,114 @@
+"""Fixtures of the API microbenchmarks.
+
+Benchmarks run only when `BENCHMARK_ROWS` lists the scream counts of the
+seeded databases, like `10000,1000000,10000000`. Every database is
+seeded once into `BENCHMARK_DATA_DIR` and reused by later runs, delete
+it to seed again.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from .dataset import WORDS, seeded_database, subscribers
+from api import models
+
+ROWS = [
+    int(rows) for rows in os.getenv('BENCHMARK_ROWS', '').split(',') if rows
+]
+"""Scream counts of the seeded databases."""
+
+DATA_DIR = Path(os.getenv('BENCHMARK_DATA_DIR', '.benchmarks/data'))
+"""Directory of the seeded databases."""
+
+BENCHMARK_USER = 10**12
+"""User and chat ID of rows written by benchmarks, removed after them."""
+
+
+@pytest.fixture(scope='session', params=ROWS or [0], ids=lambda n: f'{n}rows')
+def rows(request) -> int:
+    """Scream count of the seeded database."""
+    return request.param
+
+
+async def remove_benchmark_rows(engine) -> None:
+    """Remove rows written by benchmarks."""
+    async with engine.begin() as conn:
+        for table in (models.Reaction, models.Scream):
+            await conn.execute(
+                delete(table).where(table.user_id == BENCHMARK_USER)
+            )
+        await conn.execute(
+            delete(models.Subscriber).where(
+                models.Subscriber.chat_id >= BENCHMARK_USER
+            )
+        )
+
+
+@pytest.fixture(scope='session')
+async def seeded_engine(rows):
+    path = await seeded_database(DATA_DIR, rows)
+    engine = create_async_engine(f'sqlite+aiosqlite:///{path}')
+    await remove_benchmark_rows(engine)
+    yield engine
+
+    await remove_benchmark_rows(engine)
+    await engine.dispose()
+
+
+@pytest.fixture
+def call(event_loop, seeded_engine):
+    """
+    Call service function with a new session of the seeded database.
+
+    Every call opens its own session, like an API request does, and runs
+    to completion on the test event loop.
+    """
+    session_factory = async_sessionmaker(
+        seeded_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def call_service(function, *args):
+        async with session_factory() as session:
+            return await function(session, *args)
+
+    def call_service_sync(function, *args):
+        return event_loop.run_until_complete(call_service(function, *args))
+
+    return call_service_sync
+
+
+@pytest.fixture
+def benchmark_user() -> int:
+    return BENCHMARK_USER
+
+
+@pytest.fixture
+def subscribers_count(rows) -> int:
+    return subscribers(rows)
+
+
+@pytest.fixture
+def words() -> list[str]:
+    return WORDS
+
+
+@pytest.fixture
+def db_benchmark(benchmark, rows):
+    """Benchmark grouped by the size of the seeded database."""
+    benchmark.group = f'{rows} rows'
+    benchmark.extra_info['rows'] = rows
+    return benchmark
+
+
+@pytest.fixture(scope='session', autouse=True)
+def benchmarks_enabled():
+    if not ROWS:
+        pytest.skip('set BENCHMARK_ROWS to run benchmarks')
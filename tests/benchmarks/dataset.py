@@ -0,0 +1,75 @@
+"""Seeded datasets of benchmarks and load tests.
+
+Databases are seeded by `api.tools.seed`, with screams of random users
+spread over the two years before seeding and about one and a half
+reactions per scream. The same number of screams always gives the same
+rows, up to their times.
+
+The API is imported from `src`, so it has to be on the path and the API
+settings configured, as the tests conftest and `tests.load.run` do.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from api.database import Base
+from api.tools.seed import SeedPlan, seed, vocabulary
+
+SEED = 0
+"""Seed of the generated rows."""
+
+REACTIONS = ['👍', '👎', '❤️']
+"""Reactions of the seeded screams."""
+
+WORDS = vocabulary(SeedPlan._field_defaults['words'], SEED)
+"""Words of scream texts, from the most to the least frequent."""
+
+
+def users(rows: int) -> int:
+    """Get number of users of a seeded database."""
+    return max(rows // 100, 100)
+
+
+def subscribers(rows: int) -> int:
+    """Get number of subscribers of a seeded database."""
+    return max(rows // 10, 100)
+
+
+def plan(rows: int) -> SeedPlan:
+    """Get seed plan of a number of screams."""
+    return SeedPlan(
+        screams=rows,
+        end=datetime.now(tz=timezone.utc),
+        days=730,
+        users=users(rows),
+        reactions=1.5,
+        reaction_weights=tuple((reaction, 1) for reaction in REACTIONS),
+        subscribers=subscribers(rows),
+        seed=SEED,
+    )
+
+
+async def seeded_database(data_dir: Path, rows: int) -> Path:
+    """
+    Get database file of a number of screams, seeding it if missing.
+
+    The file appears only once seeding completes.
+    """
+    path = data_dir / f'screams-{rows}-{SEED}.db'
+    if path.exists():
+        return path
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    seeding = path.with_suffix('.seeding')
+    seeding.unlink(missing_ok=True)
+
+    engine = create_async_engine(f'sqlite+aiosqlite:///{seeding}')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await seed(engine, plan(rows))
+    await engine.dispose()
+
+    seeding.rename(path)
+    return path
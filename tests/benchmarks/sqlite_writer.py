@@ -0,0 +1,175 @@
+"""Mixed read/write load on the API over SQLite with and without single writer.
+
+Starts the API with uvicorn on a fresh SQLite file twice, once with
+concurrent write sessions (the default) and once with
+`DATABASE_SINGLE_WRITER` enabled. Each time concurrent workers send a
+mix of scream reads, scream creations and reactions, and latency per
+kind of request, throughput and failed requests are reported.
+
+Usage:
+    python -m tests.benchmarks.sqlite_writer --requests 3000 --writes 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from time import perf_counter
+
+import httpx
+
+SRC = Path(__file__).parents[2] / 'src'
+
+
+def start_api(port: int, database: str, single_writer: bool):
+    env = {
+        **os.environ,
+        'HOST': '127.0.0.1',
+        'PORT': str(port),
+        'DATABASE_URL': f'sqlite+aiosqlite:///{database}',
+        'DATABASE_SINGLE_WRITER': str(single_writer).lower(),
+        'MEME_CAPTIONS_FONT': 'fonts/impact.ttf',
+    }
+    return subprocess.Popen(
+        [sys.executable, '-m', 'api'],
+        cwd=SRC,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_for(url: str, timeout: float = 15) -> None:
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        try:
+            httpx.get(url)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise TimeoutError('API did not start')
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def bench(base_url: str, args) -> dict:
+    rng = random.Random(args.seed)
+    latencies = {'read': [], 'create': [], 'react': []}
+    failed = 0
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        seeded = await client.post(
+            '/screams/bulk',
+            json=[{'user_id': i, 'text': f'seed {i}'} for i in range(100)],
+        )
+        scream_ids = [s['scream_id'] for s in seeded.json()]
+
+        operations = []
+        for i in range(args.requests):
+            if rng.random() >= args.writes:
+                operations.append(('read', None))
+            elif rng.random() < 0.5:
+                operations.append(('create', i))
+            else:
+                operations.append(('react', i))
+        remaining = iter(operations)
+
+        async def send(kind: str, i: int | None) -> httpx.Response:
+            match kind:
+                case 'read':
+                    if rng.random() < 0.5:
+                        return await client.get(
+                            '/screams/', params={'page': 1, 'limit': 20}
+                        )
+                    return await client.get(
+                        f'/screams/{rng.choice(scream_ids)}'
+                    )
+                case 'create':
+                    return await client.post(
+                        '/screams/', json={'user_id': i, 'text': 'bench'}
+                    )
+            scream_id = rng.choice(scream_ids)
+            return await client.post(
+                f'/screams/{scream_id}/react',
+                json={
+                    'scream_id': scream_id,
+                    'user_id': i,
+                    'reaction': '👍',
+                },
+            )
+
+        async def worker():
+            nonlocal failed
+            for kind, i in remaining:
+                start = perf_counter()
+                try:
+                    response = await send(kind, i)
+                    ok = response.is_success
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies[kind].append(perf_counter() - start)
+                else:
+                    failed += 1
+
+        start = perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = perf_counter() - start
+
+    return {
+        'rps': args.requests / elapsed,
+        'failed': failed,
+        **{
+            f'{kind} {name}': percentile(values, q) * 1e3
+            for kind, values in latencies.items()
+            for name, q in (('p50', 0.5), ('p99', 0.99))
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=3000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--writes', type=float, default=0.3)
+    parser.add_argument('--port', type=int, default=8098)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    results = {}
+    for name, single_writer in (('default', False), ('writer', True)):
+        database = os.path.join(tempfile.mkdtemp(), 'bench.db')
+        api = start_api(args.port, database, single_writer)
+        try:
+            base_url = f'http://127.0.0.1:{args.port}'
+            wait_for(f'{base_url}/docs')
+            results[name] = asyncio.run(bench(base_url, args))
+        finally:
+            api.terminate()
+            api.wait()
+
+    print(
+        f'{args.requests} requests, {args.writes:.0%} writes, '
+        f'concurrency {args.concurrency} (latency in ms)'
+    )
+    columns = list(results['default'])
+    print(f'{"":>8}' + ''.join(f'{column:>13}' for column in columns))
+    for name, result in results.items():
+        print(
+            f'{name:>8}'
+            + ''.join(f'{result[column]:13.1f}' for column in columns)
+        )
+
+
+if __name__ == '__main__':
+    main()
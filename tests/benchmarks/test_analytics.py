@@ -0,0 +1,52 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.analytics import service
+
+pytest.importorskip('pytest_benchmark')
+
+USER_ID = 1
+
+
+@pytest.fixture
+def offline_chart():
+    with patch.object(
+        service.QuickChart, 'chart', AsyncMock(return_value=b'png')
+    ):
+        yield
+
+
+@pytest.mark.parametrize('period', ['day', 'week', 'month', 'year'])
+def test_get_period_limits(benchmark, period):
+    today = datetime(2025, 5, 14)
+
+    start, end = benchmark(service.get_period_limits, period, today)
+
+    assert start <= today <= end
+
+
+def test_get_stats(db_benchmark, call):
+    stats = db_benchmark(call, service.get_stats, USER_ID)
+
+    assert stats.screams_count > 0
+
+
+@pytest.mark.parametrize('period', ['week', 'month', 'year'])
+def test_get_graph(db_benchmark, call, offline_chart, period):
+    graph = db_benchmark(call, service.get_graph, USER_ID, period)
+
+    assert graph == b'png'
+
+
+@pytest.mark.parametrize('period', ['week', 'month', 'year'])
+def test_get_summary(db_benchmark, call, period):
+    summary = db_benchmark(call, service.get_summary, USER_ID, period, 'url')
+
+    assert summary.stats.screams_count > 0
+
+
+@pytest.mark.parametrize('period', ['day', 'week', 'month', 'year'])
+def test_get_most_voted(db_benchmark, call, period):
+    db_benchmark(call, service.get_most_voted, period)
@@ -0,0 +1,47 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageFont
+
+from api.config import settings
+from api.memes import service
+
+pytest.importorskip('pytest_benchmark')
+
+TEXT = (
+    'when the deadline is tomorrow and the code still does not compile '
+    'but the coffee machine is broken again'
+)
+
+
+@pytest.fixture
+def font():
+    return ImageFont.truetype(settings.memes.captions_font, 40)
+
+
+@pytest.fixture
+def image():
+    image = Image.new('RGB', (600, 600), color='white')
+    image.format = 'PNG'
+    return image
+
+
+def test_split_text_to_lines(benchmark, font):
+    lines = benchmark(service.split_text_to_lines, 500, TEXT, font)
+
+    assert len(lines) > 1
+
+
+def test_insert_text_on_image(benchmark, font, image):
+    benchmark(
+        service.insert_text_on_image, image, (50, 50), (500, 200), TEXT, font
+    )
+
+
+@pytest.mark.parametrize('image_format', ['PNG', 'JPEG'])
+def test_image2bytes(benchmark, image, image_format):
+    image.format = image_format
+
+    data = benchmark(service.image2bytes, image)
+
+    assert Image.open(BytesIO(data)).format == image_format
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from api import models
+from api.screams import schemas, service
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.fixture(params=[0, 10, 100])
+def scream(request):
+    return models.Scream(
+        id=1,
+        user_id=1,
+        text='Test scream',
+        created_at=datetime(2025, 5, 14, tzinfo=timezone.utc),
+        reactions=[
+            models.Reaction(
+                user_id=user_id,
+                scream_id=1,
+                reaction=['👍', '👎'][user_id % 2],
+            )
+            for user_id in range(request.param)
+        ],
+    )
+
+
+def test_get_scream_reactions(benchmark, scream):
+    reactions = benchmark(service.get_scream_reactions, scream)
+
+    assert sum(reactions.values()) == len(scream.reactions)
+
+
+def test_scream_orm2schema(benchmark, scream):
+    result = benchmark(service.scream_orm2schema, scream)
+
+    assert result.scream_id == scream.id
+
+
+def test_get_scream(db_benchmark, call, rows):
+    scream = db_benchmark(call, service.get_scream, rows // 2)
+
+    assert scream.scream_id == rows // 2
+
+
+@pytest.mark.parametrize('page', [1, 100, 10000])
+def test_get_screams(db_benchmark, call, page):
+    db_benchmark(call, service.get_screams, page, 20)
+
+
+@pytest.mark.parametrize('rank', [0, 100, 19999])
+def test_search_screams(db_benchmark, call, words, rank):
+    db_benchmark(call, service.search_screams, words[rank], 20)
+
+
+def test_create_scream(db_benchmark, call, benchmark_user):
+    scream = db_benchmark(
+        call, service.create_scream, benchmark_user, 'scream'
+    )
+
+    assert scream.user_id == benchmark_user
+
+
+def test_create_screams(db_benchmark, call, benchmark_user):
+    screams = [
+        schemas.ScreamCreate(user_id=benchmark_user, text=f'scream {i}')
+        for i in range(100)
+    ]
+
+    created = db_benchmark(call, service.create_screams, screams)
+
+    assert len(created) == len(screams)
+
+
+def test_react_on_scream(db_benchmark, call, rows, benchmark_user):
+    db_benchmark(call, service.react_on_scream, rows // 2, benchmark_user, '👍')
+
+
+def test_delete_scream(db_benchmark, call, benchmark_user):
+    def create_scream():
+        scream = call(service.create_scream, benchmark_user, 'scream')
+        return (service.delete_scream, scream.scream_id), {}
+
+    db_benchmark.pedantic(call, setup=create_scream, rounds=100)
@@ -0,0 +1,37 @@
+from itertools import count
+
+import pytest
+
+from api.subscribers import service
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.fixture
+def chat_ids(benchmark_user):
+    return count(benchmark_user)
+
+
+def test_add_subscriber(db_benchmark, call, chat_ids):
+    def new_chat():
+        return (service.add_subscriber, next(chat_ids)), {}
+
+    db_benchmark.pedantic(call, setup=new_chat, rounds=100)
+
+
+def test_remove_subscriber(db_benchmark, call, chat_ids):
+    def add_subscriber():
+        chat_id = next(chat_ids)
+        call(service.add_subscriber, chat_id)
+        return (service.remove_subscriber, chat_id), {}
+
+    db_benchmark.pedantic(call, setup=add_subscriber, rounds=100)
+
+
+@pytest.mark.parametrize('position', [0, 0.5])
+def test_get_subscribers(db_benchmark, call, subscribers_count, position):
+    after = int(subscribers_count * position) or None
+
+    chat_ids = db_benchmark(call, service.get_subscribers, after, 100)
+
+    assert chat_ids
@@ -0,0 +1,161 @@
+"""Round-trip latency of the InnoScream API client over TCP and UDS.
+
+Serves a minimal FastAPI application with uvicorn on a loopback TCP port
+and on a Unix domain socket, then measures requests made through
+`InnoScreamAPI`'s client one after another (latency) and concurrently
+(throughput) for both transports.
+
+Usage:
+    python -m tests.benchmarks.uds --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import tempfile
+import time
+from time import perf_counter
+
+import uvicorn
+from fastapi import FastAPI
+
+from src.bot.services.innoscream import InnoScreamAPI
+
+app = FastAPI()
+
+
+@app.get('/ping')
+async def ping():
+    return {'reactions': {'👍': 5, '👎': 2}}
+
+
+def serve(**kwargs) -> None:
+    uvicorn.run(app, log_level='warning', **kwargs)
+
+
+def wait_for(connect, timeout: float = 10) -> None:
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        try:
+            connect()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError('Server did not start')
+
+
+def connect_tcp(port: int):
+    return lambda: socket.create_connection(('127.0.0.1', port)).close()
+
+
+def connect_uds(path: str):
+    def connect():
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(path)
+
+    return connect
+
+
+def percentile(values: list[float], q: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def bench(api: InnoScreamAPI, args) -> dict[str, float]:
+    for _ in range(100):
+        await api.client.get('/ping')
+
+    latencies = []
+    for _ in range(args.requests):
+        start = perf_counter()
+        response = await api.client.get('/ping')
+        response.raise_for_status()
+        latencies.append(perf_counter() - start)
+    latencies.sort()
+
+    remaining = iter(range(args.requests))
+
+    async def worker():
+        for _ in remaining:
+            (await api.client.get('/ping')).raise_for_status()
+
+    start = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = perf_counter() - start
+
+    await api.client.aclose()
+    return {
+        'p50': percentile(latencies, 0.5) * 1e6,
+        'p99': percentile(latencies, 0.99) * 1e6,
+        'mean': sum(latencies) / len(latencies) * 1e6,
+        'rps': args.requests / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--port', type=int, default=8097)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), 'api.sock')
+    servers = [
+        multiprocessing.Process(
+            target=serve, kwargs={'host': '127.0.0.1', 'port': args.port}
+        ),
+        multiprocessing.Process(target=serve, kwargs={'uds': path}),
+    ]
+    for server in servers:
+        server.start()
+
+    try:
+        wait_for(connect_tcp(args.port))
+        wait_for(connect_uds(path))
+
+        results = {
+            'tcp': asyncio.run(
+                bench(
+                    InnoScreamAPI(
+                        base_url=f'http://127.0.0.1:{args.port}',
+                        retries=0,
+                    ),
+                    args,
+                )
+            ),
+            'uds': asyncio.run(
+                bench(
+                    InnoScreamAPI(
+                        base_url='http://innoscream',
+                        uds=path,
+                        retries=0,
+                    ),
+                    args,
+                )
+            ),
+        }
+    finally:
+        for server in servers:
+            server.terminate()
+            server.join()
+
+    print(
+        f'{args.requests} requests, concurrency {args.concurrency}\n'
+        f'{"":>4} {"p50 us":>9} {"p99 us":>9} {"mean us":>9} {"req/s":>9}'
+    )
+    for name, r in results.items():
+        print(
+            f'{name:>4} {r["p50"]:9.0f} {r["p99"]:9.0f} '
+            f'{r["mean"]:9.0f} {r["rps"]:9.0f}'
+        )
+
+    tcp, uds = results['tcp'], results['uds']
+    print(
+        f'UDS: {1 - uds["p50"] / tcp["p50"]:.0%} lower p50 latency, '
+        f'{uds["rps"] / tcp["rps"] - 1:+.0%} throughput'
+    )
+
+
+if __name__ == '__main__':
+    main()
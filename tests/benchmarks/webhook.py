@@ -0,0 +1,219 @@
+"""Webhook load test with synthetic Telegram updates.
+
+Starts webhook server workers with a dispatcher whose handler simulates
+work of a real one (a round trip to the API), posts synthetic message
+updates to it with a number of concurrent connections and reports
+processed updates per second. With `--url` the updates are posted to an
+already running bot instead, e.g. `python -m bot` with the webhook
+enabled (its handlers then really call the API and Telegram).
+
+Usage:
+    python -m tests.benchmarks.webhook --updates 20000 --workers 4
+    python -m tests.benchmarks.webhook --url http://127.0.0.1:8081/webhook
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import time
+from time import perf_counter
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+from aiogram import Bot, Dispatcher
+
+from src.bot.webhook import create_app, serve
+
+
+def make_update(update_id: int) -> dict:
+    return {
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id,
+            'date': 0,
+            'chat': {'id': update_id % 1000 + 1, 'type': 'private'},
+            'from': {
+                'id': update_id % 1000 + 1,
+                'is_bot': False,
+                'first_name': 'Load',
+            },
+            'text': '/scream load test',
+        },
+    }
+
+
+def stub_bot() -> Bot:
+    bot = MagicMock(spec=Bot)
+    bot.id = 42
+    bot.session = MagicMock()
+    bot.session.json_loads = json.loads
+    bot.session.json_dumps = json.dumps
+    bot.session.close = AsyncMock()
+    return bot
+
+
+def run_server(worker: int, args, processed) -> None:
+    dp = Dispatcher()
+
+    @dp.message()
+    async def handler(message) -> None:
+        await asyncio.sleep(args.handler_latency)
+        with processed.get_lock():
+            processed.value += 1
+
+    app = create_app(
+        dp,
+        stub_bot(),
+        background=not args.sync,
+        max_concurrency=args.concurrency_limit,
+    )
+    asyncio.run(
+        serve(app, '127.0.0.1', args.port, reuse_port=args.workers > 1)
+    )
+
+
+def wait_for_port(port: int, timeout: float = 10) -> None:
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(('127.0.0.1', port)) == 0:
+                return
+        time.sleep(0.05)
+    raise TimeoutError(f'Webhook server did not start on port {port}')
+
+
+async def post_updates(
+    url: str,
+    ids: range,
+    connections: int,
+) -> tuple[int, list[float]]:
+    ids = iter(ids)
+    latencies = []
+    errors = 0
+
+    connector = aiohttp.TCPConnector(limit=connections)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def client() -> None:
+            nonlocal errors
+            for update_id in ids:
+                start = perf_counter()
+                async with session.post(
+                    url, json=make_update(update_id)
+                ) as response:
+                    await response.read()
+                    if response.status != 200:
+                        errors += 1
+                latencies.append(perf_counter() - start)
+
+        await asyncio.gather(*(client() for _ in range(connections)))
+
+    return errors, latencies
+
+
+def load(job: tuple[str, range, int]) -> tuple[int, list[float]]:
+    return asyncio.run(post_updates(*job))
+
+
+def run_loaders(url: str, args) -> tuple[float, int, list[float]]:
+    step = -(-args.updates // args.loaders)
+    jobs = [
+        (
+            url,
+            range(start, min(start + step, args.updates + 1)),
+            max(1, args.connections // args.loaders),
+        )
+        for start in range(1, args.updates + 1, step)
+    ]
+
+    start = perf_counter()
+    with multiprocessing.Pool(len(jobs)) as pool:
+        results = pool.map(load, jobs)
+    elapsed = perf_counter() - start
+
+    errors = sum(errors for errors, _ in results)
+    latencies = sorted(x for _, latencies in results for x in latencies)
+    return elapsed, errors, latencies
+
+
+async def wait_processed(processed, total: int, timeout: float) -> float:
+    start = perf_counter()
+    while processed.value < total and perf_counter() - start < timeout:
+        await asyncio.sleep(0.01)
+    return perf_counter() - start
+
+
+def percentile(values: list[float], q: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--updates', type=int, default=20_000)
+    parser.add_argument('--connections', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument(
+        '--loaders',
+        type=int,
+        default=2,
+        help='processes posting updates',
+    )
+    parser.add_argument('--concurrency-limit', type=int, default=100)
+    parser.add_argument('--handler-latency', type=float, default=0.01)
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument(
+        '--sync',
+        action='store_true',
+        help='answer Telegram after the handler instead of in background',
+    )
+    parser.add_argument(
+        '--url', help='webhook of an already running bot to load instead'
+    )
+    args = parser.parse_args()
+
+    processed = multiprocessing.Value('i', 0)
+    servers = []
+    url = args.url
+    if url is None:
+        servers = [
+            multiprocessing.Process(
+                target=run_server, args=(worker, args, processed)
+            )
+            for worker in range(args.workers)
+        ]
+        for server in servers:
+            server.start()
+        wait_for_port(args.port)
+        url = f'http://127.0.0.1:{args.port}/webhook'
+
+    try:
+        elapsed, errors, latencies = run_loaders(url, args)
+        if servers:
+            elapsed += asyncio.run(
+                wait_processed(processed, args.updates, timeout=60)
+            )
+    finally:
+        for server in servers:
+            server.terminate()
+            server.join()
+
+    mode = 'sync' if args.sync else 'background'
+    print(
+        f'{args.updates} updates, {args.connections} connections, '
+        f'{args.workers} workers ({mode})'
+    )
+    print(f'  throughput: {args.updates / elapsed:,.0f} updates/s')
+    print(
+        f'  response latency: p50 {percentile(latencies, 0.5) * 1000:.1f} ms, '
+        f'p99 {percentile(latencies, 0.99) * 1000:.1f} ms'
+    )
+    if servers:
+        print(f'  processed: {processed.value}, errors: {errors}')
+    else:
+        print(f'  errors: {errors}')
+
+
+if __name__ == '__main__':
+    main()
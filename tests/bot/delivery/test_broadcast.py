@@ -0,0 +1,113 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+
+from src.bot.delivery.broadcast import Broadcaster
+from src.bot.delivery.ratelimit import RateLimiter
+
+
+@pytest.fixture
+async def broadcaster():
+    broadcaster = Broadcaster(
+        RateLimiter(rate=10_000, chat_rate=10_000),
+        workers=4,
+        max_retries=2,
+        queue_size=2,
+    )
+    yield broadcaster
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_delivers_to_all(broadcaster):
+    send = AsyncMock(side_effect=lambda chat_id: chat_id * 10)
+    on_sent = MagicMock()
+
+    job = broadcaster.broadcast(range(10), send, on_sent=on_sent)
+    stats = await job.wait()
+
+    assert stats.total == stats.sent == 10
+    assert stats.failed == stats.blocked == 0
+    assert sorted(c.args[0] for c in send.call_args_list) == list(range(10))
+    on_sent.assert_any_call(3, 30)
+    assert job.done()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_async_recipients(broadcaster):
+    async def recipients():
+        for chat_id in range(5):
+            yield chat_id
+
+    send = AsyncMock()
+
+    stats = await broadcaster.broadcast(recipients(), send).wait()
+
+    assert stats.sent == 5
+
+
+@pytest.mark.asyncio
+async def test_broadcast_no_recipients(broadcaster):
+    stats = await broadcaster.broadcast([], AsyncMock()).wait()
+
+    assert stats.total == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_retry_after(broadcaster):
+    send = AsyncMock(
+        side_effect=[
+            TelegramRetryAfter(MagicMock(), 'Flood control', 0),
+            'ok',
+        ]
+    )
+
+    stats = await broadcaster.broadcast([1], send).wait()
+
+    assert send.call_count == 2
+    assert stats.sent == 1
+    assert stats.retries == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_blocked(broadcaster):
+    on_blocked = AsyncMock()
+    broadcaster.on_blocked = on_blocked
+    send = AsyncMock(
+        side_effect=TelegramForbiddenError(MagicMock(), 'Bot was blocked')
+    )
+
+    stats = await broadcaster.broadcast([1, 2], send).wait()
+
+    assert stats.blocked == 2
+    assert send.call_count == 2
+    assert {c.args[0] for c in on_blocked.call_args_list} == {1, 2}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_gives_up_on_bad_request(broadcaster):
+    send = AsyncMock(
+        side_effect=TelegramBadRequest(MagicMock(), 'Chat not found')
+    )
+
+    stats = await broadcaster.broadcast([1], send).wait()
+
+    assert send.call_count == 1
+    assert stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_join_waits_for_all(broadcaster):
+    send = AsyncMock()
+    broadcaster.broadcast(range(3), send)
+    broadcaster.broadcast(range(3, 6), send)
+
+    await broadcaster.join()
+
+    assert send.call_count == 6
+    assert broadcaster.stats.sent == 6
@@ -0,0 +1,86 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from src.bot.delivery.edits import EditCoalescer, render_keyboard
+from src.bot.delivery.ratelimit import RateLimiter
+
+
+def keyboard(count):
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text=f'👍 {count}', callback_data='r')]
+        ]
+    )
+
+
+@pytest.fixture
+def editor():
+    return EditCoalescer(RateLimiter(rate=1000, chat_rate=1000), delay=0.01)
+
+
+@pytest.mark.asyncio
+async def test_applies_latest_keyboard_only(editor):
+    edit = AsyncMock()
+
+    for count in range(1, 6):
+        editor.submit((1, 1), keyboard(count), edit)
+    await editor.flush()
+
+    edit.assert_called_once_with(keyboard(5))
+    assert editor.stats.applied == 1
+    assert editor.stats.coalesced == 4
+    assert editor.shown((1, 1)) == render_keyboard(keyboard(5))
+
+
+@pytest.mark.asyncio
+async def test_skips_unchanged_keyboard(editor):
+    edit = AsyncMock()
+
+    editor.submit((1, 2), keyboard(1), edit, current=keyboard(0))
+    editor.submit((1, 2), keyboard(0), edit)
+    await editor.flush()
+
+    edit.assert_not_called()
+    assert editor.stats.unchanged == 1
+
+
+@pytest.mark.asyncio
+async def test_edits_messages_independently(editor):
+    edit = AsyncMock()
+
+    editor.submit((1, 3), keyboard(1), edit)
+    editor.submit((2, 3), keyboard(1), edit)
+    await editor.flush()
+
+    assert edit.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retries_after_flood_control(editor):
+    edit = AsyncMock(
+        side_effect=[TelegramRetryAfter(MagicMock(), 'Flood', 0), None]
+    )
+
+    editor.submit((1, 4), keyboard(1), edit)
+    await editor.flush()
+
+    assert edit.call_count == 2
+    assert editor.stats.applied == 1
+
+
+@pytest.mark.asyncio
+async def test_not_modified_is_not_an_error(editor):
+    edit = AsyncMock(
+        side_effect=TelegramBadRequest(
+            MagicMock(), 'Bad Request: message is not modified'
+        )
+    )
+
+    editor.submit((1, 5), keyboard(1), edit)
+    await editor.flush()
+
+    assert editor.stats.failed == 0
+    assert editor.shown((1, 5)) == render_keyboard(keyboard(1))
@@ -0,0 +1,192 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from src.bot.delivery.edits import EditCoalescer, render_keyboard
+from src.bot.delivery.propagation import KeyboardPropagator, ScreamCopies
+from src.bot.delivery.ratelimit import RateLimiter
+
+
+def keyboard(count):
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text=f'👍 {count}', callback_data='r')]
+        ]
+    )
+
+
+def make_propagator(copies, edit, batch_size=50):
+    return KeyboardPropagator(
+        copies,
+        edit,
+        RateLimiter(rate=1000, chat_rate=1000),
+        rate=1000,
+        batch_size=batch_size,
+    )
+
+
+def test_copies_keep_most_recent_screams():
+    copies = ScreamCopies(max_screams=2)
+
+    for scream_id in range(1, 4):
+        copies.add(scream_id, (scream_id, 1), '')
+
+    assert copies.get(1) == []
+    assert copies.get(3) == [((3, 1), '')]
+
+
+@pytest.mark.asyncio
+async def test_edits_all_copies_except_applied():
+    copies = ScreamCopies()
+    for chat_id in range(1, 6):
+        copies.add(1, (chat_id, 10), render_keyboard(keyboard(0)))
+    edit = AsyncMock()
+    propagator = make_propagator(copies, edit)
+
+    propagator.update(1, keyboard(1), applied=(1, 10))
+    await propagator.join()
+    await propagator.close()
+
+    edited = {call.args[:2] for call in edit.call_args_list}
+    assert edited == {(2, 10), (3, 10), (4, 10), (5, 10)}
+    assert propagator.stats.edits == 4
+    assert all(
+        shown == render_keyboard(keyboard(1)) for _, shown in copies.get(1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_skips_copies_with_latest_counts():
+    copies = ScreamCopies()
+    copies.add(1, (1, 10), render_keyboard(keyboard(1)))
+    copies.add(1, (2, 10), render_keyboard(keyboard(0)))
+    edit = AsyncMock()
+    propagator = make_propagator(copies, edit)
+
+    propagator.update(1, keyboard(1))
+    await propagator.join()
+    await propagator.close()
+
+    edit.assert_called_once_with(2, 10, keyboard(1))
+    assert propagator.stats.skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_recently_active_scream_preempts():
+    copies = ScreamCopies()
+    for chat_id in range(1, 5):
+        copies.add(1, (chat_id, 1), '')
+        copies.add(2, (chat_id, 2), '')
+    order = []
+
+    async def edit(chat_id, message_id, markup):
+        order.append(message_id)
+        await asyncio.sleep(0)
+
+    propagator = make_propagator(copies, edit, batch_size=2)
+
+    propagator.update(1, keyboard(1))
+    await asyncio.sleep(0)
+    propagator.update(2, keyboard(1))
+    await propagator.join()
+    await propagator.close()
+
+    assert order.index(2) < len(order) - order[::-1].index(1) - 1
+    assert order.count(1) == order.count(2) == 4
+    assert propagator.stats.preempted >= 1
+
+
+@pytest.mark.asyncio
+async def test_newer_counts_restart_propagation():
+    copies = ScreamCopies()
+    for chat_id in range(1, 5):
+        copies.add(1, (chat_id, 1), '')
+    propagator = None
+
+    async def edit(chat_id, message_id, markup):
+        if chat_id == 1 and markup == keyboard(1):
+            propagator.update(1, keyboard(2))
+
+    propagator = make_propagator(copies, AsyncMock(side_effect=edit), 1)
+
+    propagator.update(1, keyboard(1))
+    await propagator.join()
+    await propagator.close()
+
+    assert all(
+        shown == render_keyboard(keyboard(2)) for _, shown in copies.get(1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_forgets_blocked_copies():
+    copies = ScreamCopies()
+    copies.add(1, (1, 10), '')
+    copies.add(1, (2, 10), '')
+    edit = AsyncMock(
+        side_effect=[
+            TelegramForbiddenError(MagicMock(), 'Bot was blocked'),
+            None,
+        ]
+    )
+    propagator = make_propagator(copies, edit)
+
+    propagator.update(1, keyboard(1))
+    await propagator.join()
+    await propagator.close()
+
+    assert [key for key, _ in copies.get(1)] == [(2, 10)]
+    assert propagator.stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_after_flood_control():
+    copies = ScreamCopies()
+    copies.add(1, (1, 10), '')
+    edit = AsyncMock(
+        side_effect=[TelegramRetryAfter(MagicMock(), 'Flood', 0), None]
+    )
+    propagator = make_propagator(copies, edit)
+
+    propagator.update(1, keyboard(1))
+    await propagator.join()
+    await propagator.close()
+
+    assert edit.call_count == 2
+    assert copies.get(1) == [((1, 10), render_keyboard(keyboard(1)))]
+
+
+@pytest.mark.asyncio
+async def test_propagated_edits_are_shared_with_editor():
+    limiter = RateLimiter(rate=1000, chat_rate=1000)
+    editor = EditCoalescer(limiter, delay=0.01)
+    copies = ScreamCopies()
+    copies.add(1, (1, 10), render_keyboard(keyboard(0)))
+    copies.add(1, (2, 10), render_keyboard(keyboard(0)))
+    edit = AsyncMock()
+    propagator = KeyboardPropagator(
+        copies, edit, limiter, rate=1000, editor=editor
+    )
+    tap_edit = AsyncMock()
+
+    # A taps: A's own copy is edited by the coalescer, B's propagated.
+    editor.submit((1, 10), keyboard(1), tap_edit, current=keyboard(0))
+    propagator.update(1, keyboard(1), applied=(1, 10))
+    await editor.flush()
+    await propagator.join()
+    # B taps: A's copy is refreshed by propagation.
+    editor.submit((2, 10), keyboard(2), tap_edit, current=keyboard(1))
+    propagator.update(1, keyboard(2), applied=(2, 10))
+    await editor.flush()
+    await propagator.join()
+    # A un-taps: the coalescer must not think A still shows 1.
+    tap_edit.reset_mock()
+    editor.submit((1, 10), keyboard(1), tap_edit, current=keyboard(2))
+    await editor.flush()
+    await propagator.close()
+
+    tap_edit.assert_called_once_with(keyboard(1))
+    assert editor.shown((1, 10)) == render_keyboard(keyboard(1))
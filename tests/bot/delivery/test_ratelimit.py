@@ -0,0 +1,55 @@
+import asyncio
+from time import monotonic
+
+import pytest
+
+from src.bot.delivery.ratelimit import RateLimiter, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst_then_rate():
+    bucket = TokenBucket(rate=100, capacity=5)
+
+    start = monotonic()
+    for _ in range(10):
+        await bucket.acquire()
+
+    assert monotonic() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause():
+    bucket = TokenBucket(rate=1000)
+    bucket.pause(0.05)
+
+    assert bucket.delay() > 0
+
+    start = monotonic()
+    await bucket.acquire()
+
+    assert monotonic() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_per_chat():
+    limiter = RateLimiter(rate=1000, chat_rate=20)
+
+    start = monotonic()
+    await asyncio.gather(*(limiter.acquire(1) for _ in range(3)))
+    per_chat = monotonic() - start
+
+    start = monotonic()
+    await asyncio.gather(*(limiter.acquire(chat) for chat in range(2, 5)))
+    distinct_chats = monotonic() - start
+
+    assert per_chat >= 0.09
+    assert distinct_chats < 0.05
+
+
+def test_rate_limiter_drops_idle_chats():
+    limiter = RateLimiter(max_chats=2)
+    limiter._chat_bucket(1)
+    limiter._chat_bucket(2)
+    limiter._chat_bucket(3)
+
+    assert set(limiter._chats) == {3}
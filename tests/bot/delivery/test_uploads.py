@@ -0,0 +1,54 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.types import BufferedInputFile
+
+from src.bot.delivery.uploads import CachedPhoto, PhotoCache
+
+
+def photo_message(file_id):
+    message = MagicMock()
+    message.photo = [MagicMock(file_id='small'), MagicMock(file_id=file_id)]
+    return message
+
+
+@pytest.mark.asyncio
+async def test_cached_photo_uploads_once():
+    photo = CachedPhoto(b'image', 'image.png')
+    send_photo = AsyncMock(return_value=photo_message('file-id'))
+
+    await asyncio.gather(*(photo.send(send_photo) for _ in range(5)))
+
+    sent = [c.args[0] for c in send_photo.call_args_list]
+    assert isinstance(sent[0], BufferedInputFile)
+    assert sent[1:] == ['file-id'] * 4
+    assert photo.file_id == 'file-id'
+
+
+@pytest.mark.asyncio
+async def test_cached_photo_retries_failed_upload():
+    photo = CachedPhoto(b'image', 'image.png')
+    send_photo = AsyncMock(
+        side_effect=[RuntimeError('blocked'), photo_message('file-id')]
+    )
+
+    with pytest.raises(RuntimeError):
+        await photo.send(send_photo)
+    await photo.send(send_photo)
+
+    assert isinstance(send_photo.call_args.args[0], BufferedInputFile)
+    assert photo.file_id == 'file-id'
+
+
+def test_photo_cache_reuses_same_content():
+    cache = PhotoCache(maxsize=2)
+
+    first = cache.get(b'a', 'a.png')
+
+    assert cache.get(b'a', 'a.png') is first
+    assert cache.get(b'b', 'b.png') is not first
+
+    cache.get(b'c', 'c.png')
+
+    assert cache.get(b'a', 'a.png') is not first
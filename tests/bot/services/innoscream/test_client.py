@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -6,6 +7,7 @@ from httpx import Response, HTTPStatusError, RequestError, TimeoutException
 
 from src.bot.services.innoscream.client import InnoScreamAPI
 from src.bot.services.innoscream.models import Scream, Stats
+from src.bot.services.innoscream.transport import ResilientTransport
 
 
 @pytest.fixture
@@ -50,7 +52,9 @@ async def test_create_scream(api, mock_client, sample_scream_data):
     result = await api.create_scream(user_id=123, text='Test scream')
 
     mock_client.post.assert_called_once_with(
-        '/screams', json={'user_id': 123, 'text': 'Test scream'}
+        '/screams',
+        json={'user_id': 123, 'text': 'Test scream'},
+        headers={'X-User-Id': '123'},
     )
     assert isinstance(result, Scream)
     assert result.scream_id == sample_scream_data['scream_id']
@@ -166,6 +170,7 @@ async def test_react_on_scream(api, mock_client, sample_scream_data):
     mock_client.post.assert_called_once_with(
         '/screams/1/react',
         json={'scream_id': 1, 'user_id': 123, 'reaction': '👍'},
+        headers={'X-User-Id': '123'},
     )
     assert isinstance(result, Scream)
     assert result.scream_id == sample_scream_data['scream_id']
@@ -197,7 +202,9 @@ async def test_get_stats(api, mock_client, sample_stats_data):
 
     result = await api.get_stats(user_id=123)
 
-    mock_client.get.assert_called_once_with('/analytics/123/stats')
+    mock_client.get.assert_called_once_with(
+        '/analytics/123/stats', headers={'X-User-Id': '123'}
+    )
     assert isinstance(result, Stats)
     assert result.screams_count == sample_stats_data['screams_count']
     assert result.reactions_count == sample_stats_data['reactions_count']
@@ -216,7 +223,33 @@ async def test_get_stats_user_not_found(api, mock_client):
     with pytest.raises(HTTPStatusError):
         await api.get_stats(user_id=999)
 
-    mock_client.get.assert_called_once_with('/analytics/999/stats')
+    mock_client.get.assert_called_once_with(
+        '/analytics/999/stats', headers={'X-User-Id': '999'}
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_summary(api, mock_client, sample_stats_data):
+    mock_response = Response(
+        200,
+        json={
+            'stats': sample_stats_data,
+            'graph': {'url': None, 'image': 'Z3JhcGg='},
+        },
+    )
+    mock_response.raise_for_status = lambda: None
+    mock_client.get.return_value = mock_response
+
+    result = await api.get_summary(user_id=123, period='week')
+
+    mock_client.get.assert_called_once_with(
+        '/analytics/123/summary',
+        params={'period': 'week', 'graph': 'inline'},
+        headers={'X-User-Id': '123'},
+    )
+    assert result.stats == Stats.model_validate(sample_stats_data)
+    assert result.graph.image == b'graph'
+    assert result.graph.url is None
 
 
 @pytest.mark.asyncio
@@ -229,7 +262,9 @@ async def test_get_graph(api, mock_client):
     result = await api.get_graph(user_id=123, period='week')
 
     mock_client.get.assert_called_once_with(
-        '/analytics/123/graph', params={'period': 'week'}
+        '/analytics/123/graph',
+        params={'period': 'week'},
+        headers={'X-User-Id': '123'},
     )
     assert result == mock_content
 
@@ -335,3 +370,88 @@ async def test_generate_meme_timeout(api, mock_client):
         await api.generate_meme(scream_id=1)
 
     mock_client.post.assert_called_once()
+
+
+def test_accept_encoding_header():
+    api = InnoScreamAPI(base_url='http://test-api.com')
+
+    headers = api.client.headers
+    assert headers['Accept-Encoding'].startswith('gzip, deflate')
+    assert 'br' in headers['Accept-Encoding']
+    assert 'zstd' in headers['Accept-Encoding']
+
+
+@pytest.mark.asyncio
+async def test_add_subscriber(api, mock_client):
+    mock_client.put = AsyncMock(return_value=MagicMock())
+
+    await api.add_subscriber(123)
+
+    mock_client.put.assert_called_once_with('/subscribers/123')
+
+
+@pytest.mark.asyncio
+async def test_remove_subscriber(api, mock_client):
+    mock_client.delete.return_value = MagicMock()
+
+    await api.remove_subscriber(123)
+
+    mock_client.delete.assert_called_once_with('/subscribers/123')
+
+
+@pytest.mark.asyncio
+async def test_iter_subscribers(api, mock_client):
+    pages = [[1, 2], [3, 4], [5]]
+    mock_client.get.side_effect = [
+        MagicMock(json=MagicMock(return_value=page)) for page in pages
+    ]
+
+    chat_ids = [chat_id async for chat_id in api.iter_subscribers(2)]
+
+    assert chat_ids == [1, 2, 3, 4, 5]
+    assert mock_client.get.call_count == 3
+    assert mock_client.get.call_args.kwargs['params']['after'] == 4
+
+
+def test_client_uses_resilient_transport():
+    with patch('src.bot.services.innoscream.client.AsyncClient') as client:
+        api = InnoScreamAPI(
+            base_url='http://test-api.com',
+            timeout=3,
+            timeouts={'POST /memes/generate': 90},
+            retries=1,
+        )
+
+    kwargs = client.call_args.kwargs
+    assert kwargs['timeout'] == 3
+    assert isinstance(kwargs['transport'], ResilientTransport)
+    assert kwargs['transport'].timeouts == {'POST /memes/generate': 90}
+    assert kwargs['transport'].retries == 1
+    assert api.stats is kwargs['transport'].stats
+
+
+@pytest.mark.asyncio
+async def test_client_over_unix_socket(tmp_path):
+    path = str(tmp_path / 'api.sock')
+    requests = []
+
+    async def handle(reader, writer):
+        requests.append(await reader.readuntil(b'\r\n\r\n'))
+        writer.write(
+            b'HTTP/1.1 200 OK\r\n'
+            b'Content-Type: application/json\r\n'
+            b'Content-Length: 6\r\n\r\n'
+            b'[1, 2]'
+        )
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_unix_server(handle, path)
+    async with server:
+        api = InnoScreamAPI(base_url='http://innoscream', uds=path)
+        result = await api.get_subscribers(limit=2)
+        await api.client.aclose()
+
+    assert result == [1, 2]
+    assert requests[0].startswith(b'GET /subscribers/?limit=2')
+    assert b'host: innoscream' in requests[0].lower()
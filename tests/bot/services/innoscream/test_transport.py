@@ -0,0 +1,224 @@
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from httpx import (
+    AsyncClient,
+    ConnectError,
+    MockTransport,
+    Request,
+    Response,
+)
+
+from src.bot.services.innoscream.transport import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientTransport,
+    endpoint_name,
+)
+
+
+def make_client(handler, **kwargs):
+    transport = ResilientTransport(
+        MockTransport(handler), backoff=0, **kwargs
+    )
+    return AsyncClient(base_url='http://test-api.com', transport=transport)
+
+
+def test_endpoint_name():
+    assert (
+        endpoint_name(Request('GET', 'http://api/screams/42'))
+        == 'GET /screams/{id}'
+    )
+    assert (
+        endpoint_name(Request('PUT', 'http://api/subscribers/-100123'))
+        == 'PUT /subscribers/{id}'
+    )
+    assert (
+        endpoint_name(Request('GET', 'http://api/analytics/7/summary'))
+        == 'GET /analytics/{id}/summary'
+    )
+
+
+@pytest.mark.asyncio
+async def test_retries_idempotent_request():
+    statuses = iter([503, 502, 200])
+    client = make_client(lambda request: Response(next(statuses)))
+
+    response = await client.get('/screams/1')
+
+    assert response.status_code == 200
+    stats = client._transport.stats['GET /screams/{id}']
+    assert stats.requests == 3
+    assert stats.retries == 2
+    assert stats.errors == 2
+
+
+@pytest.mark.asyncio
+async def test_retries_network_errors():
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ConnectError('Connection refused', request=request)
+        return Response(200)
+
+    client = make_client(handler)
+
+    response = await client.delete('/subscribers/1')
+
+    assert response.status_code == 200
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_post():
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return Response(503)
+
+    client = make_client(handler)
+
+    response = await client.post('/screams/1/react', json={})
+
+    assert response.status_code == 503
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_client_errors():
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return Response(404)
+
+    client = make_client(handler)
+
+    response = await client.get('/screams/1')
+
+    assert response.status_code == 404
+    assert calls == 1
+    assert client._transport.breakers['GET /screams/{id}'].failures == 0
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_fails_fast():
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return Response(500)
+
+    client = make_client(handler, retries=0, failure_threshold=2)
+
+    for _ in range(2):
+        await client.get('/screams/1')
+    with pytest.raises(CircuitOpenError):
+        await client.get('/screams/2')
+
+    assert calls == 2
+    assert client._transport.stats['GET /screams/{id}'].rejected == 1
+    assert (await client.get('/analytics/getMostVoted')).status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_endpoint_timeout_overrides_client_timeout():
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions['timeout']['read'])
+        return Response(200)
+
+    client = make_client(handler, timeouts={'POST /memes/generate': 60})
+
+    await client.post('/memes/generate', params={'scream_id': 1})
+    await client.get('/screams/1')
+
+    assert timeouts == [60, 5]
+
+
+@pytest.mark.asyncio
+async def test_explicit_timeout_overrides_endpoint_timeout():
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions['timeout']['read'])
+        return Response(200)
+
+    client = make_client(handler, timeouts={'POST /memes/generate': 90})
+
+    await client.post('/memes/generate', timeout=60)
+    await client.post('/memes/generate')
+
+    assert timeouts == [60, 90]
+
+
+def test_circuit_breaker_half_open_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+
+    with patch(
+        'src.bot.services.innoscream.transport.monotonic', return_value=0
+    ):
+        breaker.record_failure()
+        assert not breaker.allow()
+
+    with patch(
+        'src.bot.services.innoscream.transport.monotonic', return_value=10
+    ):
+        assert breaker.state == 'half-open'
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == 'open'
+
+    with patch(
+        'src.bot.services.innoscream.transport.monotonic', return_value=20
+    ):
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == 'closed'
+        assert breaker.allow()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('error', [asyncio.CancelledError, RuntimeError])
+async def test_unresolved_trial_reopens_circuit(error):
+    def handler(request):
+        raise error
+
+    transport = ResilientTransport(
+        MockTransport(handler), failure_threshold=1, reset_timeout=10
+    )
+    breaker = transport.breakers['GET /screams/{id}'] = CircuitBreaker(
+        failure_threshold=1, reset_timeout=10
+    )
+
+    with patch(
+        'src.bot.services.innoscream.transport.monotonic', return_value=0
+    ):
+        breaker.record_failure()
+
+    with patch(
+        'src.bot.services.innoscream.transport.monotonic', return_value=10
+    ):
+        with pytest.raises(error):
+            await transport.handle_async_request(
+                Request('GET', 'http://test-api.com/screams/1')
+            )
+        assert not breaker.trial
+        assert breaker.state == 'open'
+
+    with patch(
+        'src.bot.services.innoscream.transport.monotonic', return_value=20
+    ):
+        assert breaker.allow()
@@ -4,7 +4,12 @@ from unittest.mock import AsyncMock, patch, MagicMock
 
 from aiogram.types import Message, User, Chat, CallbackQuery
 
-from src.bot.services.innoscream.models import Scream, Stats
+from src.bot.services.innoscream.models import (
+    Graph,
+    Scream,
+    Stats,
+    Summary,
+)
 
 
 patch('aiogram.client.bot.Bot.__init__', return_value=None).start()
@@ -36,6 +41,10 @@ def mock_callback_query():
     callback.from_user = MagicMock(spec=User)
     callback.from_user.id = 123
     callback.message = MagicMock(spec=Message)
+    callback.message.chat = MagicMock(spec=Chat)
+    callback.message.chat.id = 123
+    callback.message.message_id = 789
+    callback.message.reply_markup = None
     callback.message.edit_reply_markup = AsyncMock()
     return callback
 
@@ -49,11 +58,22 @@ def mock_innoscream_api():
         mock_api.react_on_scream = AsyncMock()
         mock_api.get_stats = AsyncMock()
         mock_api.get_graph = AsyncMock()
+        mock_api.get_summary = AsyncMock()
         mock_api.get_most_voted_scream = AsyncMock()
         mock_api.generate_meme = AsyncMock()
+        mock_api.add_subscriber = AsyncMock()
+        mock_api.remove_subscriber = AsyncMock()
+        mock_api.iter_subscribers = MagicMock(
+            side_effect=lambda **kwargs: async_iter([])
+        )
         yield mock_api
 
 
+async def async_iter(items):
+    for item in items:
+        yield item
+
+
 @pytest.fixture
 def sample_scream():
     return Scream(
@@ -71,14 +91,14 @@ def sample_stats():
 
 
 @pytest.mark.asyncio
-async def test_start_command(mock_message):
-    from src.bot.__main__ import start, subscribers
-
-    subscribers.clear()
+async def test_start_command(mock_message, mock_innoscream_api):
+    from src.bot.__main__ import start
 
     await start(mock_message)
 
-    assert mock_message.from_user.id in subscribers
+    mock_innoscream_api.add_subscriber.assert_called_once_with(
+        mock_message.from_user.id
+    )
     mock_message.reply.assert_called_once()
     assert (
         'Welcome to the Anonymous Scream Bot'
@@ -87,14 +107,14 @@ async def test_start_command(mock_message):
 
 
 @pytest.mark.asyncio
-async def test_exit_command(mock_message):
-    from src.bot.__main__ import exit_bot, subscribers
-
-    subscribers.add(mock_message.chat.id)
+async def test_exit_command(mock_message, mock_innoscream_api):
+    from src.bot.__main__ import exit_bot
 
     await exit_bot(mock_message)
 
-    assert mock_message.chat.id not in subscribers
+    mock_innoscream_api.remove_subscriber.assert_called_once_with(
+        mock_message.chat.id
+    )
     mock_message.reply.assert_called_once()
     assert 'unsubscribed' in mock_message.reply.call_args[0][0]
 
@@ -130,7 +150,7 @@ async def test_extend_reactions_with_defaults(sample_scream):
 
 
 @pytest.mark.asyncio
-async def test_create_scream_no_text(mock_message):
+async def test_create_scream_no_text(mock_message, mock_innoscream_api):
     mock_message.text = '/scream'
 
     from src.bot.__main__ import create_scream
@@ -147,20 +167,25 @@ async def test_create_scream_with_text(
 ):
     mock_message.text = '/scream Test message'
     mock_innoscream_api.create_scream.return_value = sample_scream
+    mock_innoscream_api.iter_subscribers.side_effect = (
+        lambda **kwargs: async_iter([123, 456])
+    )
 
-    with patch('src.bot.__main__.subscribers', {123, 456}):
-        with patch('src.bot.__main__.settings') as mock_settings:
-            mock_settings.bot.admins = [456]
-            mock_settings.bot.reactions = ['👍', '👎']
+    with patch('src.bot.__main__.settings') as mock_settings:
+        mock_settings.bot.admins = [456]
+        mock_settings.bot.reactions = ['👍', '👎']
 
-            from src.bot.__main__ import create_scream
+        from src.bot.__main__ import broadcaster, copies, create_scream
 
-            await create_scream(mock_message)
+        await create_scream(mock_message)
+        await broadcaster.join()
+        await broadcaster.close()
+        copies.forget(1)
 
-            mock_innoscream_api.create_scream.assert_called_once_with(
-                123, 'Test message'
-            )
-            assert mock_message.bot.send_message.call_count == 2
+        mock_innoscream_api.create_scream.assert_called_once_with(
+            123, 'Test message'
+        )
+        assert mock_message.bot.send_message.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -169,28 +194,123 @@ async def test_create_reaction(
 ):
     mock_innoscream_api.react_on_scream.return_value = sample_scream
 
-    from src.bot.__main__ import ReactionsCallbackFactory, create_reaction
+    from src.bot.__main__ import (
+        ReactionsCallbackFactory,
+        create_reaction,
+        editor,
+        propagator,
+    )
 
     callback_data = ReactionsCallbackFactory(scream_id=1, reaction='👍')
 
-    await create_reaction(mock_callback_query, callback_data)
+    with patch.object(editor, 'delay', 0):
+        await create_reaction(mock_callback_query, callback_data)
+        await editor.flush()
+        await propagator.join()
+        await propagator.close()
 
     mock_innoscream_api.react_on_scream.assert_called_once_with(1, 123, '👍')
     mock_callback_query.message.edit_reply_markup.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_create_reaction_burst_single_edit(
+    mock_callback_query, mock_innoscream_api, sample_scream
+):
+    mock_innoscream_api.react_on_scream.return_value = sample_scream
+    mock_callback_query.message.message_id = 790
+
+    from src.bot.__main__ import (
+        ReactionsCallbackFactory,
+        create_reaction,
+        editor,
+        propagator,
+    )
+
+    callback_data = ReactionsCallbackFactory(scream_id=1, reaction='👍')
+
+    with patch.object(editor, 'delay', 0.05):
+        for _ in range(5):
+            await create_reaction(mock_callback_query, callback_data)
+        await editor.flush()
+
+        await create_reaction(mock_callback_query, callback_data)
+        await editor.flush()
+        await propagator.join()
+        await propagator.close()
+
+    assert mock_innoscream_api.react_on_scream.call_count == 6
+    mock_callback_query.message.edit_reply_markup.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_reaction_updates_other_copies(
+    mock_message, mock_callback_query, mock_innoscream_api, sample_scream
+):
+    mock_message.text = '/scream Test message'
+    mock_message.bot.send_message.side_effect = lambda chat_id, **kwargs: (
+        MagicMock(message_id=chat_id + 1000)
+    )
+    mock_innoscream_api.create_scream.return_value = sample_scream
+    mock_innoscream_api.react_on_scream.return_value = (
+        sample_scream.model_copy(update={'reactions': {'👍': 1}})
+    )
+    mock_innoscream_api.iter_subscribers.side_effect = (
+        lambda **kwargs: async_iter([123, 456, 789])
+    )
+    mock_callback_query.message.message_id = 1123
+
+    from src.bot.__main__ import (
+        ReactionsCallbackFactory,
+        broadcaster,
+        copies,
+        create_reaction,
+        create_scream,
+        editor,
+        propagator,
+    )
+
+    with patch('src.bot.__main__.bot') as mock_bot:
+        mock_bot.edit_message_reply_markup = AsyncMock()
+
+        await create_scream(mock_message)
+        await broadcaster.join()
+        await broadcaster.close()
+
+        callback_data = ReactionsCallbackFactory(scream_id=1, reaction='👍')
+        with patch.object(editor, 'delay', 0):
+            await create_reaction(mock_callback_query, callback_data)
+            await editor.flush()
+            await propagator.join()
+
+        await propagator.close()
+        copies.forget(1)
+
+    edited = {
+        (call.kwargs['chat_id'], call.kwargs['message_id'])
+        for call in mock_bot.edit_message_reply_markup.call_args_list
+    }
+    assert edited == {(456, 1456), (789, 1789)}
+    mock_callback_query.message.edit_reply_markup.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_get_stats(mock_message, mock_innoscream_api, sample_stats):
-    mock_innoscream_api.get_stats.return_value = sample_stats
-    mock_innoscream_api.get_graph.return_value = b'graph_image_bytes'
+    mock_innoscream_api.get_summary.return_value = Summary(
+        stats=sample_stats, graph=Graph(image=b'graph_image_bytes')
+    )
 
     from src.bot.__main__ import get_stats
 
     await get_stats(mock_message)
 
-    mock_innoscream_api.get_stats.assert_called_once_with(123)
-    mock_innoscream_api.get_graph.assert_called_once_with(123, 'week')
+    mock_innoscream_api.get_summary.assert_called_once_with(123, 'week')
+    mock_innoscream_api.get_stats.assert_not_called()
+    mock_innoscream_api.get_graph.assert_not_called()
     mock_message.reply_photo.assert_called_once()
+    assert 'Total number of posts*\n10' in (
+        mock_message.reply_photo.call_args.kwargs['caption']
+    )
 
 
 @pytest.mark.asyncio
@@ -223,36 +343,35 @@ async def test_send_daily_top_scream(mock_innoscream_api, sample_scream):
     mock_innoscream_api.get_most_voted_scream.return_value = sample_scream
     mock_innoscream_api.generate_meme.return_value = b'meme_image_bytes'
 
-    with patch('src.bot.__main__.subscribers', {123, 456}):
-        with patch('src.bot.__main__.bot') as mock_bot:
-            mock_bot.send_photo = AsyncMock()
-            with patch('src.bot.__main__.asyncio.sleep', AsyncMock()):
+    with patch('src.bot.__main__.bot') as mock_bot:
+        mock_bot.send_photo = AsyncMock()
+        with patch('src.bot.__main__.asyncio.sleep', AsyncMock()):
 
-                async def run_once():
-                    scream = await mock_innoscream_api.get_most_voted_scream(
-                        'day'
-                    )
-                    if not scream:
-                        return
+            async def run_once():
+                scream = await mock_innoscream_api.get_most_voted_scream(
+                    'day'
+                )
+                if not scream:
+                    return
 
-                    meme = await mock_innoscream_api.generate_meme(
-                        scream.scream_id
-                    )
+                meme = await mock_innoscream_api.generate_meme(
+                    scream.scream_id
+                )
 
-                    for sub in {123, 456}:
-                        await mock_bot.send_photo(
-                            chat_id=sub,
-                            photo=meme,
-                            caption=(
-                                f'🌟 *Top Scream of the Day*\n\n{scream.text}'
-                            ),
-                        )
+                for sub in {123, 456}:
+                    await mock_bot.send_photo(
+                        chat_id=sub,
+                        photo=meme,
+                        caption=(
+                            f'🌟 *Top Scream of the Day*\n\n{scream.text}'
+                        ),
+                    )
 
-                await run_once()
+            await run_once()
 
-                mock_innoscream_api.get_most_voted_scream.assert_called_once_with('day')  # noqa: E501 # fmt: skip
-                mock_innoscream_api.generate_meme.assert_called_once_with(1)
-                assert mock_bot.send_photo.call_count == 2
+            mock_innoscream_api.get_most_voted_scream.assert_called_once_with('day')  # noqa: E501 # fmt: skip
+            mock_innoscream_api.generate_meme.assert_called_once_with(1)
+            assert mock_bot.send_photo.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -286,3 +405,70 @@ async def test_send_daily_top_scream_no_scream(mock_innoscream_api):
             )
             mock_innoscream_api.generate_meme.assert_not_called()
             mock_bot.send_photo.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_top_scream_uploads_meme_once(
+    sample_scream, mock_innoscream_api
+):
+    sent = MagicMock()
+    sent.photo = [MagicMock(file_id='meme-file-id')]
+    mock_innoscream_api.iter_subscribers.side_effect = (
+        lambda **kwargs: async_iter([1, 2, 3])
+    )
+
+    with patch('src.bot.__main__.bot') as mock_bot:
+        mock_bot.send_photo = AsyncMock(return_value=sent)
+
+        from src.bot.__main__ import broadcast_top_scream, broadcaster
+
+        stats = await broadcast_top_scream(
+            sample_scream, b'unique_meme_bytes'
+        ).wait()
+        await broadcaster.close()
+
+    photos = [c.kwargs['photo'] for c in mock_bot.send_photo.call_args_list]
+    assert stats.sent == 3
+    assert sum(p == 'meme-file-id' for p in photos) == 2
+
+
+@pytest.mark.parametrize(
+    'enabled, workers, tracked_screams, fails',
+    [
+        (True, 1, 1000, False),
+        (True, 4, 0, False),
+        (False, 4, 1000, False),
+        (True, 4, 1000, True),
+    ],
+)
+def test_check_workers(enabled, workers, tracked_screams, fails):
+    from src.bot.__main__ import check_workers
+
+    with patch('src.bot.__main__.settings') as mock_settings:
+        mock_settings.webhook.enabled = enabled
+        mock_settings.webhook.workers = workers
+        mock_settings.broadcast.tracked_screams = tracked_screams
+
+        if fails:
+            with pytest.raises(SystemExit, match='single worker'):
+                check_workers()
+        else:
+            check_workers()
+
+
+@pytest.mark.parametrize(
+    'enabled, workers, expected',
+    [
+        (False, 4, 24.0),
+        (True, 1, 24.0),
+        (True, 4, 6.0),
+    ],
+)
+def test_worker_rate(enabled, workers, expected):
+    from src.bot.__main__ import worker_rate
+
+    with patch('src.bot.__main__.settings') as mock_settings:
+        mock_settings.webhook.enabled = enabled
+        mock_settings.webhook.workers = workers
+
+        assert worker_rate(24.0) == expected
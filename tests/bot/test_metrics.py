@@ -0,0 +1,127 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
+from prometheus_client import CollectorRegistry
+
+from src.bot.delivery import BroadcastStats
+from src.bot.metrics import (
+    HandlerMetricsMiddleware,
+    StatsCollector,
+    TelegramMetricsMiddleware,
+    registry,
+)
+from src.bot.services.innoscream import EndpointStats
+
+
+def sample(name: str, **labels) -> float:
+    return registry.get_sample_value(name, labels) or 0
+
+
+async def create_scream(event, data):
+    return 'created'
+
+
+async def get_stats(event, data):
+    raise RuntimeError('API is down')
+
+
+@pytest.mark.asyncio
+async def test_handler_middleware():
+    middleware = HandlerMetricsMiddleware()
+    ok = sample(
+        'bot_handler_duration_seconds_count',
+        handler='create_scream',
+        outcome='ok',
+    )
+    failed = sample(
+        'bot_handler_duration_seconds_count',
+        handler='get_stats',
+        outcome='error',
+    )
+
+    result = await middleware(
+        create_scream,
+        MagicMock(),
+        {'handler': MagicMock(callback=create_scream)},
+    )
+    with pytest.raises(RuntimeError):
+        await middleware(
+            get_stats, MagicMock(), {'handler': MagicMock(callback=get_stats)}
+        )
+
+    assert result == 'created'
+    assert sample(
+        'bot_handler_duration_seconds_count',
+        handler='create_scream',
+        outcome='ok',
+    ) == ok + 1
+    assert sample(
+        'bot_handler_duration_seconds_count',
+        handler='get_stats',
+        outcome='error',
+    ) == failed + 1
+
+
+@pytest.mark.asyncio
+async def test_telegram_middleware():
+    middleware = TelegramMetricsMiddleware()
+    method = SendMessage(chat_id=1, text='scream')
+    make_request = AsyncMock(
+        side_effect=[
+            'sent',
+            TelegramRetryAfter(method, 'Flood control', 1),
+        ]
+    )
+    ok = sample(
+        'telegram_request_duration_seconds_count',
+        method='sendMessage',
+        outcome='ok',
+    )
+    limited = sample(
+        'telegram_request_duration_seconds_count',
+        method='sendMessage',
+        outcome='retry_after',
+    )
+
+    assert await middleware(make_request, MagicMock(), method) == 'sent'
+    with pytest.raises(TelegramRetryAfter):
+        await middleware(make_request, MagicMock(), method)
+
+    assert sample(
+        'telegram_request_duration_seconds_count',
+        method='sendMessage',
+        outcome='ok',
+    ) == ok + 1
+    assert sample(
+        'telegram_request_duration_seconds_count',
+        method='sendMessage',
+        outcome='retry_after',
+    ) == limited + 1
+
+
+def test_stats_collector():
+    broadcast = BroadcastStats(total=10, sent=7, failed=1, blocked=2)
+    api = {
+        'GET /screams/{id}': EndpointStats(
+            requests=5, errors=1, latency_total=0.5
+        )
+    }
+    collectors = CollectorRegistry()
+    collectors.register(StatsCollector(lambda: broadcast, lambda: api))
+
+    def value(name: str, **labels) -> float:
+        return collectors.get_sample_value(name, labels)
+
+    broadcast.sent += 1
+
+    assert value('bot_broadcast_deliveries_total', outcome='sent') == 8
+    assert value('bot_broadcast_deliveries_total', outcome='blocked') == 2
+    assert value('bot_broadcast_queued_total') == 10
+    assert value('bot_api_requests_total', endpoint='GET /screams/{id}') == 5
+    assert value('bot_api_errors_total', endpoint='GET /screams/{id}') == 1
+    assert (
+        value('bot_api_latency_seconds_total', endpoint='GET /screams/{id}')
+        == 0.5
+    )
@@ -0,0 +1,110 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram import Bot, Dispatcher
+from aiohttp.test_utils import TestClient, TestServer
+
+from src.bot.webhook import create_app
+
+
+def make_update(update_id):
+    return {
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id,
+            'date': 0,
+            'chat': {'id': 1, 'type': 'private'},
+            'from': {'id': 1, 'is_bot': False, 'first_name': 'Test'},
+            'text': 'hello',
+        },
+    }
+
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock(spec=Bot)
+    bot.id = 42
+    bot.session = MagicMock()
+    bot.session.json_loads = json.loads
+    bot.session.json_dumps = json.dumps
+    bot.session.close = AsyncMock()
+    return bot
+
+
+async def make_client(dispatcher, bot, **kwargs):
+    client = TestClient(TestServer(create_app(dispatcher, bot, **kwargs)))
+    await client.start_server()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_webhook_feeds_updates(mock_bot):
+    dp = Dispatcher()
+    received = []
+
+    @dp.message()
+    async def handler(message):
+        received.append(message.message_id)
+
+    client = await make_client(dp, mock_bot, background=False)
+    try:
+        response = await client.post('/webhook', json=make_update(1))
+    finally:
+        await client.close()
+
+    assert response.status == 200
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_webhook_rejects_wrong_secret(mock_bot):
+    dp = Dispatcher()
+    client = await make_client(dp, mock_bot, secret_token='secret')
+    try:
+        response = await client.post(
+            '/webhook',
+            json=make_update(1),
+            headers={'X-Telegram-Bot-Api-Secret-Token': 'wrong'},
+        )
+    finally:
+        await client.close()
+
+    assert response.status == 401
+
+
+@pytest.mark.asyncio
+async def test_webhook_limits_background_concurrency(mock_bot):
+    dp = Dispatcher()
+    running = 0
+    peak = 0
+    done = asyncio.Event()
+    handled = []
+
+    @dp.message()
+    async def handler(message):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        handled.append(message.message_id)
+        if len(handled) == 10:
+            done.set()
+
+    client = await make_client(dp, mock_bot, max_concurrency=2)
+    try:
+        responses = await asyncio.gather(
+            *(
+                client.post('/webhook', json=make_update(i))
+                for i in range(10)
+            )
+        )
+        await asyncio.wait_for(done.wait(), 5)
+    finally:
+        await client.close()
+
+    assert all(response.status == 200 for response in responses)
+    assert sorted(handled) == list(range(10))
+    assert peak == 2
@@ -1,7 +1,16 @@
 import os
+import sys
 import pytest
 import asyncio
+from pathlib import Path
 from unittest.mock import patch
+from dotenv import load_dotenv
+
+# Load test environment variables
+env_path = Path(__file__).parent / 'api' / '.env.test'
+load_dotenv(dotenv_path=env_path)
+
+sys.path.append('src')
 
 
 def pytest_configure(config):
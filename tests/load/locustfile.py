@@ -0,0 +1,194 @@
+"""Load scenario of the InnoScream API.
+
+Users read, create and react to screams, search them, and request
+statistics, graphs and memes. Scream IDs are drawn from a Zipf
+distribution over the `LOAD_SCREAMS` seeded screams, the newest being
+the most popular, and user IDs uniformly from the `LOAD_USERS` seeded
+users. On quit every endpoint is checked against its p95 and p99 SLOs,
+a missed one fails the run, and a report is written to `LOAD_REPORT`
+when it is set. See `tests.load.run` for the headless runner.
+"""
+
+import json
+import os
+import random
+from itertools import accumulate
+
+from locust import HttpUser, between, events, task
+
+from tests.benchmarks.dataset import REACTIONS, WORDS
+
+SCREAMS = int(os.getenv('LOAD_SCREAMS', '100'))
+"""Number of seeded screams."""
+
+USERS = int(os.getenv('LOAD_USERS', '100'))
+"""Number of seeded users."""
+
+ZIPF_EXPONENT = float(os.getenv('LOAD_ZIPF_EXPONENT', '1.0'))
+"""Exponent of the Zipf distributions of scream IDs and search words."""
+
+SLOS = {
+    'GET /screams/': (100, 200),
+    'GET /screams/[id]': (50, 100),
+    'GET /screams/search': (150, 300),
+    'POST /screams/': (100, 250),
+    'POST /screams/[id]/react': (100, 250),
+    'GET /analytics/[user_id]/stats': (100, 200),
+    'GET /analytics/[user_id]/graph': (500, 1000),
+    'GET /analytics/getMostVoted': (300, 600),
+    'POST /memes/generate': (1500, 3000),
+}
+"""p95 and p99 response time objectives in milliseconds by endpoint."""
+
+
+def zipf_weights(size: int) -> list[float]:
+    """Get cumulative Zipf weights of ranks from 1 to size."""
+    return list(
+        accumulate(1 / rank**ZIPF_EXPONENT for rank in range(1, size + 1))
+    )
+
+
+SCREAM_WEIGHTS = zipf_weights(SCREAMS)
+"""Cumulative weights of scream IDs from the newest one."""
+
+WORD_WEIGHTS = zipf_weights(len(WORDS))
+"""Cumulative weights of search words from the most frequent one."""
+
+
+class InnoScreamUser(HttpUser):
+    wait_time = between(1, 3)
+
+    def on_start(self):
+        self.user_id = random.randrange(USERS)
+
+    def scream_id(self) -> int:
+        [rank] = random.choices(range(SCREAMS), cum_weights=SCREAM_WEIGHTS)
+        return SCREAMS - rank
+
+    @task(3)
+    def create_scream(self):
+        payload = {
+            'user_id': self.user_id,
+            'text': ' '.join(
+                random.choices(WORDS, cum_weights=WORD_WEIGHTS, k=8)
+            ),
+        }
+        self.client.post('/screams/', json=payload, name='POST /screams/')
+
+    @task(5)
+    def get_scream(self):
+        self.client.get(
+            f'/screams/{self.scream_id()}', name='GET /screams/[id]'
+        )
+
+    @task(3)
+    def get_screams(self):
+        self.client.get(
+            '/screams/',
+            params={'page': random.randint(1, 5), 'limit': 20},
+            name='GET /screams/',
+        )
+
+    @task(1)
+    def search_screams(self):
+        [word] = random.choices(WORDS, cum_weights=WORD_WEIGHTS)
+        self.client.get(
+            '/screams/search', params={'q': word}, name='GET /screams/search'
+        )
+
+    @task(2)
+    def react_on_scream(self):
+        scream_id = self.scream_id()
+        payload = {
+            'scream_id': scream_id,
+            'user_id': self.user_id,
+            'reaction': random.choice(REACTIONS),
+        }
+        self.client.post(
+            f'/screams/{scream_id}/react',
+            json=payload,
+            name='POST /screams/[id]/react',
+        )
+
+    @task(1)
+    def get_stats(self):
+        self.client.get(
+            f'/analytics/{self.user_id}/stats',
+            name='GET /analytics/[user_id]/stats',
+        )
+
+    @task(1)
+    def get_graph(self):
+        periods = ['week', 'month', 'year']
+        period = random.choice(periods)
+        self.client.get(
+            f'/analytics/{self.user_id}/graph',
+            params={'period': period},
+            name='GET /analytics/[user_id]/graph',
+        )
+
+    @task(1)
+    def get_most_voted_scream(self):
+        periods = ['day', 'week', 'month', 'year']
+        period = random.choice(periods)
+        self.client.get(
+            '/analytics/getMostVoted',
+            params={'period': period},
+            name='GET /analytics/getMostVoted',
+        )
+
+    @task(1)
+    def generate_meme(self):
+        self.client.post(
+            '/memes/generate',
+            params={'scream_id': self.scream_id()},
+            timeout=60,
+            name='POST /memes/generate',
+        )
+
+
+def endpoint_report(entry) -> dict:
+    """Summarize requests of an endpoint and check them against SLOs."""
+    p95 = entry.get_response_time_percentile(0.95)
+    p99 = entry.get_response_time_percentile(0.99)
+    slo_p95, slo_p99 = SLOS.get(entry.name, (None, None))
+
+    return {
+        'requests': entry.num_requests,
+        'failures': entry.num_failures,
+        'rps': round(entry.total_rps, 2),
+        'p50': entry.get_response_time_percentile(0.5),
+        'p95': p95,
+        'p99': p99,
+        'slo_p95': slo_p95,
+        'slo_p99': slo_p99,
+        'passed': entry.num_failures == 0
+        and (slo_p95 is None or p95 <= slo_p95)
+        and (slo_p99 is None or p99 <= slo_p99),
+    }
+
+
+@events.quitting.add_listener
+def check_slos(environment, **kwargs):
+    endpoints = {
+        entry.name: endpoint_report(entry)
+        for entry in environment.stats.entries.values()
+    }
+    missed = sorted(
+        name for name, report in endpoints.items() if not report['passed']
+    )
+    for name in missed:
+        report = endpoints[name]
+        print(
+            f'SLO missed by {name}: p95 {report["p95"]} ms, '
+            f'p99 {report["p99"]} ms, {report["failures"]} failures'
+        )
+
+    if os.getenv('LOAD_REPORT'):
+        with open(os.environ['LOAD_REPORT'], 'w') as file:
+            json.dump(
+                {'endpoints': endpoints, 'missed': missed}, file, indent=2
+            )
+
+    if missed:
+        environment.process_exit_code = 1
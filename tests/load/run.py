@@ -0,0 +1,212 @@
+"""Headless load test of the API, offline and against seeded data.
+
+Seeds a database of `--screams` screams, or reuses one seeded before
+(see `tests.benchmarks.dataset`), and runs the API on a scratch copy of
+it, so every run starts from the same rows. QuickChart and Supermeme are
+replaced by the stand-ins of `tests.load.stubs` with the given
+latencies. Then `tests/load/locustfile.py` runs headless, and its report of
+p50, p95 and p99 response times per endpoint, checked against the SLOs,
+is written to `--report` together with the run parameters. With
+`--baseline` the percentiles are compared with an earlier report. Exits
+with 1 when an SLO is missed.
+
+The runner, like the API it starts, imports the API from `src`, which
+has to be on `PYTHONPATH`.
+
+Usage:
+    PYTHONPATH=src python -m tests.load.run --screams 1000000 \\
+        --users 100 --run-time 5m \\
+        --report load.json --baseline previous-load.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import ExitStack
+from pathlib import Path
+
+ROOT = Path(__file__).parents[2]
+"""Repository root."""
+
+
+def free_port() -> int:
+    """Get a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start(stack: ExitStack, args: list[str], env: dict | None = None) -> None:
+    """Start Python module process, terminated when the stack closes."""
+    process = subprocess.Popen(
+        [sys.executable, '-m', *args],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+    )
+
+    def stop():
+        process.terminate()
+        process.wait(timeout=30)
+
+    stack.callback(stop)
+
+
+def wait_ready(url: str, timeout: float = 60) -> None:
+    """Wait until URL answers."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=5):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """Print percentiles of report next to those of a baseline report."""
+    print(f'{"endpoint":<32}{"p50":>16}{"p95":>16}{"p99":>16}')
+    for name, endpoint in report['endpoints'].items():
+        before = baseline['endpoints'].get(name, {})
+        cells = [
+            f'{before.get(p, "-")} -> {endpoint[p]}'
+            for p in ('p50', 'p95', 'p99')
+        ]
+        print(f'{name:<32}' + ''.join(f'{cell:>16}' for cell in cells))
+
+
+def run(args) -> int:
+    """Run load test and write its report, returning locust exit code."""
+    from tests.benchmarks.dataset import SEED, seeded_database, users
+
+    database = asyncio.run(seeded_database(args.data_dir, args.screams))
+
+    with tempfile.TemporaryDirectory() as scratch, ExitStack() as stack:
+        scratch_database = Path(scratch) / database.name
+        shutil.copy(database, scratch_database)
+
+        ports = {name: free_port() for name in ('api', *args.latency)}
+        for name, latency in args.latency.items():
+            start(
+                stack,
+                [
+                    'tests.load.stubs',
+                    name,
+                    f'--port={ports[name]}',
+                    f'--latency={latency}',
+                    f'--jitter={latency * args.jitter}',
+                ],
+            )
+            wait_ready(f'http://127.0.0.1:{ports[name]}/openapi.json')
+
+        api_url = f'http://127.0.0.1:{ports["api"]}'
+        start(
+            stack,
+            ['api'],
+            {
+                'PYTHONPATH': str(ROOT / 'src'),
+                'HOST': '127.0.0.1',
+                'PORT': str(ports['api']),
+                'DATABASE_URL': f'sqlite+aiosqlite:///{scratch_database}',
+                'QUICKCHART_URL': f'http://127.0.0.1:{ports["quickchart"]}',
+                'SUPERMEME_URL': f'http://127.0.0.1:{ports["supermeme"]}',
+            },
+        )
+        wait_ready(f'{api_url}/openapi.json')
+
+        report_path = Path(scratch) / 'report.json'
+        locust = subprocess.run(
+            [
+                sys.executable,
+                '-m',
+                'locust',
+                '--locustfile=tests/load/locustfile.py',
+                '--headless',
+                f'--host={api_url}',
+                f'--users={args.users}',
+                f'--spawn-rate={args.spawn_rate}',
+                f'--run-time={args.run_time}',
+                '--only-summary',
+            ],
+            cwd=ROOT,
+            env={
+                **os.environ,
+                'LOAD_SCREAMS': str(args.screams),
+                'LOAD_USERS': str(users(args.screams)),
+                'LOAD_REPORT': str(report_path),
+            },
+        )
+        report = json.loads(report_path.read_text())
+
+    report['parameters'] = {
+        'screams': args.screams,
+        'seed': SEED,
+        'users': args.users,
+        'spawn_rate': args.spawn_rate,
+        'run_time': args.run_time,
+        'latency': args.latency,
+        'jitter': args.jitter,
+    }
+    args.report.write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        compare(report, json.loads(args.baseline.read_text()))
+
+    return locust.returncode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--screams', type=int, default=100000)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--spawn-rate', type=float, default=10)
+    parser.add_argument('--run-time', default='1m')
+    parser.add_argument(
+        '--quickchart-latency',
+        type=float,
+        default=0.2,
+        help='Seconds per response of the QuickChart stand-in',
+    )
+    parser.add_argument(
+        '--supermeme-latency',
+        type=float,
+        default=0.3,
+        help='Seconds per response of the Supermeme stand-in',
+    )
+    parser.add_argument(
+        '--jitter',
+        type=float,
+        default=0.25,
+        help='Jitter of the stand-in latencies as a fraction of them',
+    )
+    parser.add_argument(
+        '--data-dir', type=Path, default=Path('.benchmarks/data')
+    )
+    parser.add_argument('--report', type=Path, default=Path('load.json'))
+    parser.add_argument('--baseline', type=Path)
+    args = parser.parse_args()
+
+    # Settings the API modules need to import, the database is seeded
+    # through its own engine and the API gets its own settings
+    os.environ.setdefault('DATABASE_URL', 'sqlite+aiosqlite:///:memory:')
+    os.environ.setdefault('MEME_CAPTIONS_FONT', 'fonts/impact.ttf')
+
+    args.latency = {
+        'quickchart': args.quickchart_latency,
+        'supermeme': args.supermeme_latency,
+    }
+
+    sys.exit(run(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""Stand-in QuickChart and Supermeme APIs for offline load tests.
+
+Both answer every request after a configurable latency, uniformly
+jittered, with fixed content shaped like the real services: QuickChart
+renders every chart as the same PNG, Supermeme finds the same few
+templates for every query and serves their pages and images.
+
+Usage:
+    python -m tests.load.stubs quickchart --port 8101 --latency 0.2
+    python -m tests.load.stubs supermeme --port 8102 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from functools import cache
+from io import BytesIO
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+from PIL import Image
+
+TEMPLATES = ['distracted-boyfriend', 'drake-hotline-bling', 'two-buttons']
+"""Names of the meme templates found for every query."""
+
+IMAGE_SIZE = 600
+"""Width and height of the chart and meme images."""
+
+
+@cache
+def png() -> bytes:
+    """Render the image served for every chart and meme template."""
+    image = Image.new('RGB', (IMAGE_SIZE, IMAGE_SIZE), color='white')
+    data = BytesIO()
+    image.save(data, format='PNG')
+    return data.getvalue()
+
+
+def delay_responses(app: FastAPI, latency: float, jitter: float) -> None:
+    """Delay every response of app by latency plus or minus jitter."""
+
+    @app.middleware('http')
+    async def delay(request: Request, call_next):
+        await asyncio.sleep(max(latency + random.uniform(-jitter, jitter), 0))
+        return await call_next(request)
+
+
+def create_quickchart_app(latency: float = 0, jitter: float = 0) -> FastAPI:
+    """Create stand-in QuickChart API."""
+    app = FastAPI(title='QuickChart stub')
+    delay_responses(app, latency, jitter)
+
+    @app.post('/chart')
+    @app.get('/chart')
+    async def chart() -> Response:
+        return Response(png(), media_type='image/png')
+
+    return app
+
+
+def create_supermeme_app(latency: float = 0, jitter: float = 0) -> FastAPI:
+    """Create stand-in Supermeme API."""
+    app = FastAPI(title='Supermeme stub')
+    delay_responses(app, latency, jitter)
+
+    @app.get('/api/search')
+    async def search(searchQuery: str) -> dict:
+        return {
+            'memeTemplates': [
+                {
+                    'name': name,
+                    'image_path': f'/images/{name}.png',
+                    'description': name.replace('-', ' '),
+                    'meme_text': searchQuery,
+                }
+                for name in TEMPLATES
+            ]
+        }
+
+    @app.get('/meme/{name}')
+    async def meme(request: Request, name: str) -> Response:
+        props = {
+            'pageTitle': name,
+            'imageSrc': str(request.url_for('image', name=name)),
+            'imageName': name,
+            'imageDescription': name.replace('-', ' '),
+            'imageWidth': IMAGE_SIZE,
+            'imageHeight': IMAGE_SIZE,
+            'initialCaptions': [
+                {
+                    'x': 50,
+                    'y': 400,
+                    'text': '',
+                    'width': 500,
+                    'height': 150,
+                    'language': 'en',
+                    'fontSize': 40,
+                    'fontFamily': 'Impact',
+                    'rotateAngle': 0,
+                }
+            ],
+        }
+        next_data = json.dumps({'props': {'pageProps': props}})
+        return Response(
+            '<html><body><script id="__NEXT_DATA__" '
+            f'type="application/json">{next_data}</script></body></html>',
+            media_type='text/html',
+        )
+
+    @app.get('/images/{name}.png')
+    async def image(name: str) -> Response:
+        return Response(png(), media_type='image/png')
+
+    return app
+
+
+APPS = {
+    'quickchart': create_quickchart_app,
+    'supermeme': create_supermeme_app,
+}
+"""Stand-in app factories by service name."""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('service', choices=list(APPS))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, required=True)
+    parser.add_argument(
+        '--latency', type=float, default=0, help='Seconds per response'
+    )
+    parser.add_argument(
+        '--jitter', type=float, default=0, help='Seconds of latency jitter'
+    )
+    args = parser.parse_args()
+
+    uvicorn.run(
+        APPS[args.service](args.latency, args.jitter),
+        host=args.host,
+        port=args.port,
+        log_level='warning',
+    )
+
+
+if __name__ == '__main__':
+    main()
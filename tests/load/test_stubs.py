@@ -0,0 +1,37 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.external.quickchart import Chart, ChartData, QuickChart
+from src.api.external.supermeme import Supermeme
+from tests.load import stubs
+
+
+def stub_client(app) -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app), base_url='http://stub')
+
+
+@pytest.mark.asyncio
+async def test_quickchart_stub():
+    quickchart = QuickChart()
+    quickchart.client = stub_client(stubs.create_quickchart_app())
+
+    image = await quickchart.chart(
+        Chart(type='bar', data=ChartData(labels=[], datasets=[]))
+    )
+
+    assert image == stubs.png()
+
+
+@pytest.mark.asyncio
+async def test_supermeme_stub():
+    supermeme = Supermeme()
+    supermeme.client = stub_client(stubs.create_supermeme_app())
+
+    templates = await supermeme.search_meme_templates('scream')
+    props = await supermeme.get_meme_template_props(templates[0])
+    image = await supermeme.get_meme_image(props)
+
+    assert [t.name for t in templates] == stubs.TEMPLATES
+    assert props.image_src == f'http://stub/images/{stubs.TEMPLATES[0]}.png'
+    assert props.initial_captions
+    assert image == stubs.png()